@@ -0,0 +1,211 @@
+"""Benchmarks the backup session history
+
+drives the BackupChannel and Model.add_session_log the way the backup
+thread does, with the Tk main thread side draining the channel every
+few updates, and reports the memory use of the process and the time
+per update as the session grows.
+
+the first and the last report windows are compared, and the script
+exits with status 1 when the memory grew by more than --max-rss-growth
+MB or an update got more than --max-slowdown times slower, so that
+the history staying flat is checked rather than read off the table.
+
+Usage:
+    python scripts/bench_session_history.py [--loops 100000]
+"""
+import os
+import sys
+import argparse
+import tempfile
+from time import perf_counter
+
+approot = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.append(approot)
+sys.path.append(os.path.join(approot, "modules"))
+
+from modules.app import Model, BackupChannel, BackupEntry
+
+class Settings():
+    """the app settings the Model reads, with their default values
+    """
+    def get_app_setting(self, name, category='APP'):
+        return None
+
+class Controller():
+    """stands in for the WindowController, the Model only needs
+    the settings and somewhere to show its errors
+    """
+    def __init__(self):
+        self.app_settings = Settings()
+
+    def show_error(self, message):
+        print("ERROR: {}".format(message))
+
+def rss_mb():
+    """returns the memory use of the process in MB: the resident set size
+    on Linux, the peak resident set size on the other platforms that have
+    the resource module, None when it can't be read
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KB elsewhere
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+def bench(loops, drain_every, report_every):
+    """runs the benchmark
+
+    Args:
+        loops (int): the number of backups logged
+        drain_every (int): the number of updates between two drains
+        report_every (int): the number of updates between two reports
+
+    Returns:
+        list: the (updates, RSS in MB, microseconds per update) of every
+              report window
+    """
+    windows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Model(Controller(), os.path.join(tmp, "bench.db"))
+        channel = BackupChannel()
+
+        # a previous session, which the next session start prunes
+        channel.reset(1)
+        for loop in range(min(loops, 1000)):
+            db.add_session_log(channel.session_start, BackupEntry(
+                "save_{:03d}.xml.gz".format(loop % 10),
+                "id1_{}.xml.gz".format(loop),
+                "hash",
+                0.5,
+                0,
+                None
+            ))
+
+        channel.reset(1)
+        db.prune_session_log(channel.session_start)
+
+        print("{:>8} {:>10} {:>12} {:>10} {:>8}".format(
+            "updates", "RSS (MB)", "us/update", "shown", "dropped"
+        ))
+        shown = 0
+        dropped = 0
+        elapsed = 0
+        window_start = perf_counter()
+        for loop in range(1, loops + 1):
+            timer_start = perf_counter()
+            entry = BackupEntry(
+                "save_{:03d}.xml.gz".format(loop % 10),
+                "id1_{}.xml.gz".format(loop),
+                "hash",
+                0.5,
+                0,
+                None
+            )
+            channel.publish(loops=loop, countdown=0, processing=entry)
+            channel.finish(entry._replace(
+                log_id=db.add_session_log(channel.session_start, entry)
+            ))
+            elapsed += perf_counter() - timer_start
+
+            if loop % drain_every == 0:
+                _, finished, lost = channel.drain()
+                shown += len(finished)
+                dropped += lost
+
+            if loop % report_every == 0:
+                rss = rss_mb()
+                windows.append((loop, rss, elapsed / report_every * 1000000))
+                print("{:>8} {:>10} {:>12.1f} {:>10} {:>8}".format(
+                    loop,
+                    "n/a" if rss is None else "{:0.1f}".format(rss),
+                    windows[-1][2],
+                    shown,
+                    dropped
+                ))
+                elapsed = 0
+
+        cursor = db.connection.cursor()
+        cursor.row_factory = None
+        rows, sessions = cursor.execute(
+            "SELECT count(*), count(DISTINCT session_start) FROM backup_session_log"
+        ).fetchone()
+        print("\n{} updates in {:0.2f} seconds, {} log rows in {} session".format(
+            loops,
+            perf_counter() - window_start,
+            rows,
+            sessions
+        ))
+        db.connection.close()
+
+    return windows
+
+def check(windows, max_rss_growth, max_slowdown):
+    """compares the last report window with the first one
+
+    Args:
+        windows (list): the report windows returned by bench
+        max_rss_growth (float): the allowed RSS growth in MB
+        max_slowdown (float): the allowed ratio between the time per
+                              update of the last and the first window
+
+    Returns:
+        list: the exceeded tolerances, empty when the benchmark passed
+    """
+    if len(windows) < 2:
+        return ["at least two report windows are needed, raise --loops"]
+
+    failures = []
+    _, first_rss, first_us = windows[0]
+    _, last_rss, last_us = windows[-1]
+    if first_rss is not None and last_rss is not None:
+        growth = last_rss - first_rss
+        print("RSS grew by {:0.1f} MB, the tolerance is {:0.1f} MB".format(
+            growth,
+            max_rss_growth
+        ))
+        if growth > max_rss_growth:
+            failures.append("RSS grew by {:0.1f} MB".format(growth))
+    else:
+        print("RSS can't be read on this platform, only the time is checked")
+
+    slowdown = last_us / max(first_us, 1e-9)
+    print("an update takes {:0.2f}x the time of the first window, the tolerance is {:0.2f}x".format(
+        slowdown,
+        max_slowdown
+    ))
+    if slowdown > max_slowdown:
+        failures.append("an update got {:0.2f}x slower".format(slowdown))
+
+    return failures
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--loops', type=int, default=100000,
+                        help="the number of backups logged")
+    parser.add_argument('--drain-every', type=int, default=10,
+                        help="the number of updates between two drains")
+    parser.add_argument('--report-every', type=int, default=10000,
+                        help="the number of updates between two reports")
+    parser.add_argument('--max-rss-growth', type=float, default=8,
+                        help="the allowed RSS growth in MB between the first and the last report")
+    parser.add_argument('--max-slowdown', type=float, default=1.5,
+                        help="the allowed slowdown of an update between the first and the last report")
+    args = parser.parse_args()
+    failures = check(
+        bench(args.loops, args.drain_every, args.report_every),
+        args.max_rss_growth,
+        args.max_slowdown
+    )
+    if failures:
+        print("FAILED: {}".format(", ".join(failures)))
+        sys.exit(1)
+    print("PASSED")
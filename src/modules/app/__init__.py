@@ -2,7 +2,12 @@
 """
 
 from .validate import Validate
+from .formatter import Formatter
+from .backup_listing import BackupListing
 from .model import Model
+from .db_worker import DBWorker
+from .job_runner import Job, JobRunner
+from .backup_channel import BackupChannel, BackupEntry
 from .app_settings import AppSettings
 from .save_manager import SaveManager
 from .playthrough_manager import PlaythroughManager
\ No newline at end of file
@@ -56,7 +56,7 @@ class AppSettings():
                 ),
                 "BACKUPPATH": "{}".format(self.backup_dir),
                 "X4SAVEPATH": "{}".format(self.get_x4_save_path()),
-                "VERSION": 2
+                "VERSION": 4
             },
             "BACKUP": {
                 "BACKUPFREQUENCY_SECONDS": 300,
@@ -66,7 +66,11 @@ class AppSettings():
                 "DELETE_AUTOSAVES": False,
                 "DELETE_SAVES": False,
                 "DELETE_OLD_DAYS": 30,
-                "DO_NOT_DELETE_LAST": 10
+                "DO_NOT_DELETE_LAST": 10,
+                "KEEP_HOURLY": 0,
+                "KEEP_DAILY": 0,
+                "KEEP_WEEKLY": 0,
+                "QUOTA_MB": 0
             }
         }
         self.save()
@@ -207,4 +211,34 @@ class AppSettings():
                 category="BACKUP"
             )
             self.save()
+
+        if self.get_app_setting("VERSION") == 2:
+            self.update_app_setting("VERSION", 3)
+            # the grandfather-father-son retention tiers, disabled by default
+            self._create_app_setting(
+                "KEEP_HOURLY",
+                0,
+                category="BACKUP"
+            )
+            self._create_app_setting(
+                "KEEP_DAILY",
+                0,
+                category="BACKUP"
+            )
+            self._create_app_setting(
+                "KEEP_WEEKLY",
+                0,
+                category="BACKUP"
+            )
+            self.save()
+
+        if self.get_app_setting("VERSION") == 3:
+            self.update_app_setting("VERSION", 4)
+            # the disk quota for the backup store, disabled by default
+            self._create_app_setting(
+                "QUOTA_MB",
+                0,
+                category="BACKUP"
+            )
+            self.save()
         
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""Holds the BackupChannel class
+
+The BackupChannel passes the progress of the backup thread to the Tk main
+thread. The backup thread only replaces the latest snapshot, so nothing
+piles up while the GUI isn't reading, and the GUI drains it from a single
+after() poller at its own pace.
+"""
+import threading
+from collections import namedtuple, deque
+from time import time
+
+# the state of the backup thread. processing is the BackupEntry being
+# backed up, None while waiting for the next loop. warning is shown while
+# waiting, None when there is nothing to warn about
+BackupProgress = namedtuple(
+    'BackupProgress',
+    ['loops', 'countdown', 'seconds', 'processing', 'warning']
+)
+
+# an X4 save backed up during the session. log_id is its entry in the
+# session log, see Model.add_session_log
+BackupEntry = namedtuple(
+    'BackupEntry',
+    ['x4save', 'backup_filename', 'hash', 'backup_timespan', 'evicted', 'log_id']
+)
+
+class BackupChannel():
+    """BackupChannel Class
+
+    Usage:
+        # backup thread
+        channel.publish(countdown=countdown)
+        channel.finish(entry)
+
+        # Tk main thread
+        progress, finished, dropped = channel.drain()
+
+    At most max_finished backups are kept between drains, the older ones
+    are only counted, as they can be read from the session log
+    """
+    # the number of finished backups kept until the next drain
+    max_finished = 500
+
+    def __init__(self):
+        """Constructor
+        """
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self, seconds=0):
+        """starts a new backup session
+
+        Args:
+            seconds (int): the number of seconds between backup loops
+        """
+        with self.lock:
+            self.session_start = time()
+            self.progress = BackupProgress(0, seconds, seconds, None, None)
+            self.finished = deque(maxlen=self.max_finished)
+            self.dropped = 0
+
+    def publish(self, **changes):
+        """replaces the latest snapshot with a copy holding the changes
+
+        Args:
+            changes: the BackupProgress fields to change
+        """
+        with self.lock:
+            self.progress = self.progress._replace(**changes)
+
+    def finish(self, entry):
+        """records a finished backup, and clears the one being processed
+
+        Args:
+            entry (BackupEntry): the finished backup
+        """
+        with self.lock:
+            if len(self.finished) == self.max_finished:
+                self.dropped += 1
+            self.finished.append(entry)
+            self.progress = self.progress._replace(processing=None)
+
+    def drain(self):
+        """returns the latest snapshot, and the backups finished since the
+        last drain
+
+        Returns:
+            tuple: (BackupProgress, list of BackupEntry, the number of
+                   finished backups that didn't fit)
+        """
+        with self.lock:
+            finished = list(self.finished)
+            self.finished.clear()
+            dropped, self.dropped = self.dropped, 0
+            return self.progress, finished, dropped
@@ -0,0 +1,148 @@
+"""Module holding the backup listing shown in the StartPage backup treeview
+"""
+
+class BackupListing:
+    """keeps the backups read by Model.get_backup_listing in memory, one
+    list per column, so they can be sorted and paged without going
+    back to the database.
+
+    The order of every sorted column is computed once and cached as a
+    permutation of the row indexes, so sorting again by a column, in
+    either direction, only reorders the rows that are shown.
+
+    A filter limits the listing to some of its backups, the others stay
+    in memory so the filter can change without reading them again
+    """
+    # the columns that can be sorted by, and the key each one sorts on
+    sort_keys = {
+        'x4_save_time': lambda value: value or 0,
+        'playtime': lambda value: value or 0
+    }
+
+    def __init__(self, backups, sort_column='x4_save_time', sort_direction='ASC'):
+        """Constructor
+
+        Args:
+            backups (list): the backups returned by Model.get_backup_listing
+            sort_column (str): the column to sort by
+            sort_direction (str): ASC/DESC
+        """
+        backups = backups or []
+        self.names = list(backups[0].keys()) if backups else []
+        self.columns = {
+            name: [backup[name] for backup in backups] for name in self.names
+        }
+        self.positions = {
+            file_hash: index
+            for index, file_hash in enumerate(self.columns.get('file_hash', []))
+        }
+        self.permutations = {}
+        self.order = None
+        self.sorted_by = None
+        # the row indexes matching the filter, None when not filtered
+        self.shown = None
+        self.sort(sort_column, sort_direction)
+
+    def __len__(self):
+        return len(self.order)
+
+    def listed(self, file_hash):
+        """returns True when the backup is in the listing and matches
+        the filter
+
+        Args:
+            file_hash (str): the hash of the backup
+        """
+        index = self.positions.get(file_hash)
+        if index is None:
+            return False
+
+        return self.shown is None or index in self.shown
+
+    def filter(self, hashes=None):
+        """only lists the backups with these hashes, the hashes of
+        backups that aren't in the listing are ignored
+
+        Args:
+            hashes (list): default None. the hashes returned by
+                           Model.filter_backups, None lists every backup
+        """
+        if hashes is None:
+            self.shown = None
+        else:
+            positions = self.positions
+            self.shown = {
+                positions[file_hash] for file_hash in hashes
+                if file_hash in positions
+            }
+        self.sort(*self.sorted_by)
+
+    def sort(self, column, direction):
+        """sorts the listing by column, ties are sorted by the backup hash
+        so the order matches the one get_backup_listing uses
+
+        Args:
+            column (str): the column to sort by, one of sort_keys
+            direction (str): ASC/DESC
+        """
+        self.sorted_by = (column, direction)
+        ascending = self.permutations.get((column, 'ASC'))
+        if ascending is None:
+            key = self.sort_keys[column]
+            values = [key(value) for value in self.columns.get(column, [])]
+            hashes = self.columns.get('file_hash', [])
+            ascending = sorted(
+                range(len(values)),
+                key=lambda index: (values[index], hashes[index])
+            )
+            self.permutations[(column, 'ASC')] = ascending
+
+        if direction.upper() == 'ASC':
+            self.order = ascending
+        else:
+            self.order = self.permutations.get((column, 'DESC'))
+            if self.order is None:
+                self.order = ascending[::-1]
+                self.permutations[(column, 'DESC')] = self.order
+
+        if self.shown is not None:
+            shown = self.shown
+            self.order = [index for index in self.order if index in shown]
+
+    def page(self, offset, limit):
+        """returns the backups at the sorted positions offset to
+        offset + limit
+
+        Returns:
+            list: backup dicts, as returned by Model.get_backup_listing
+        """
+        return [
+            {name: self.columns[name][index] for name in self.names}
+            for index in self.order[offset:offset + limit]
+        ]
+
+    def update(self, backups):
+        """replaces the values of backups that have changed. Backups that
+        aren't in the listing are ignored, and the cached order of a
+        sort column is dropped when its values change
+
+        Args:
+            backups (list): the changed backups, as returned by
+                            Model.get_backup_listing
+        """
+        for backup in backups:
+            index = self.positions.get(backup['file_hash'])
+            if index is None:
+                continue
+
+            for name in self.names:
+                if self.columns[name][index] == backup[name]:
+                    continue
+
+                self.columns[name][index] = backup[name]
+                if name in self.sort_keys:
+                    for direction in ('ASC', 'DESC'):
+                        self.permutations.pop((name, direction), None)
+
+        if (self.sorted_by[0], 'ASC') not in self.permutations:
+            self.sort(*self.sorted_by)
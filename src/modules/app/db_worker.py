@@ -0,0 +1,206 @@
+"""Holds the DBWorker class
+
+The DBWorker runs Model queries on a dedicated thread so that the Tk main
+thread never blocks on SQLite. Results are handed back to the GUI by a
+single after() poller which runs on the Tk main thread.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import threading
+from concurrent.futures import Future
+from queue import Queue, Empty
+
+if TYPE_CHECKING:
+    from modules.gui import WindowController
+
+class DBWorker():
+    """DBWorker Class
+
+    Usage:
+        controller.db_worker.submit(
+            'get_playthrough_stats',
+            playthrough_id,
+            key='playthrough_stats',
+            callback=self.show_playthrough_stats
+        )
+
+    Every request that is submitted with the same key supersedes the
+    previous ones: superseded requests are skipped if they haven't
+    started yet, interrupted if they are running, and their results
+    are never delivered.
+    """
+    # how often (ms) the Tk main thread checks for finished requests
+    poll_ms = 15
+
+    def __init__(self, controller: WindowController, dbpath: str):
+        """Constructor
+
+        Args:
+            controller (WindowController): the main application controller
+            dbpath (string): the full path to the application SQLite database
+        """
+        self.controller = controller
+        self.dbpath = dbpath
+        self.requests = Queue()
+        self.results = Queue()
+        self.lock = threading.Lock()
+        self.latest = {}
+        self.next_id = 0
+        self.pending = 0
+        self.polling = False
+        self.db = None
+        self.running = None
+        self.thread = threading.Thread(
+            target=self._run,
+            name="DBWorker",
+            daemon=True
+        )
+        self.thread.start()
+
+    @property
+    def app_settings(self):
+        """the worker Model reads some app settings through its controller
+        """
+        return self.controller.app_settings
+
+    def show_error(self, message):
+        """errors raised by the worker Model are shown on the Tk main thread
+
+        errors from superseded requests are dropped, as they are
+        usually caused by interrupting the request
+        """
+        if self.running and not self._is_current(*self.running):
+            return
+
+        self.results.put(('error', message))
+
+    def submit(self, method, *args, callback=None, key=None, **kwargs):
+        """queues a call to a Model method on the worker thread.
+        Must be called from the Tk main thread
+
+        Args:
+            method (str): the name of the Model method to call
+            args: positional arguments for the Model method
+            callback (function): called on the Tk main thread with the
+                                 result, unless the request was superseded
+            key (str): requests with the same key supersede each other
+            kwargs: keyword arguments for the Model method
+
+        Returns:
+            Future: the future for the result of the Model method
+        """
+        future = Future()
+        with self.lock:
+            self.next_id += 1
+            request_id = self.next_id
+            if key:
+                self.latest[key] = request_id
+        if key:
+            self._interrupt(key)
+
+        self.pending += 1
+        self.requests.put(
+            (request_id, key, method, args, kwargs, future, callback)
+        )
+        self._schedule_poll()
+        return future
+
+    def cancel(self, key):
+        """cancels all outstanding requests for key
+
+        Args:
+            key (str): the request key to cancel
+        """
+        with self.lock:
+            self.next_id += 1
+            self.latest[key] = self.next_id
+        self._interrupt(key)
+
+    def stop(self):
+        """stops the worker thread once the queued requests are done
+        """
+        self.requests.put(None)
+
+    def _interrupt(self, key):
+        """interrupts the running query if it belongs to key
+        """
+        # the lock makes sure the request can't finish, and the next one
+        # start, between checking the running request and interrupting it
+        with self.lock:
+            running = self.running
+            if self.db and running and running[1] == key:
+                self.db.connection.interrupt()
+
+    def _is_current(self, request_id, key):
+        """returns False when the request has been superseded or cancelled
+        """
+        if not key:
+            return True
+
+        with self.lock:
+            return self.latest.get(key) == request_id
+
+    def _run(self):
+        """the worker thread, which owns its own Model and SQLite connection
+        """
+        from modules.app import Model
+        db = Model(self, self.dbpath)
+        self.db = db
+
+        while True:
+            request = self.requests.get()
+            if request is None:
+                break
+
+            request_id, key, method, args, kwargs, future, callback = request
+            if not self._is_current(request_id, key):
+                future.cancel()
+                self.results.put(('done', request))
+                continue
+
+            if future.set_running_or_notify_cancel():
+                with self.lock:
+                    self.running = (request_id, key)
+                try:
+                    future.set_result(getattr(db, method)(*args, **kwargs))
+                except Exception as e:
+                    future.set_exception(e)
+                with self.lock:
+                    self.running = None
+
+            self.results.put(('done', request))
+
+        db.connection.close()
+
+    def _schedule_poll(self):
+        if not self.polling:
+            self.polling = True
+            self.controller.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        """delivers finished requests on the Tk main thread
+        """
+        while True:
+            try:
+                kind, data = self.results.get_nowait()
+            except Empty:
+                break
+
+            if kind == 'error':
+                self.controller.show_error(data)
+                continue
+
+            self.pending -= 1
+            request_id, key, method, args, kwargs, future, callback = data
+            if future.cancelled() or not self._is_current(request_id, key):
+                continue
+
+            if future.exception():
+                self.controller.show_error(future.exception())
+            elif callback:
+                callback(future.result())
+
+        self.polling = False
+        if self.pending > 0:
+            self._schedule_poll()
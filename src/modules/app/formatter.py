@@ -0,0 +1,32 @@
+"""Module responsible for formatting values for display
+"""
+
+class Formatter:
+    """formats raw database values for display in the GUI
+    """
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def size(size):
+        """formats a size in bytes using the largest fitting unit
+
+        Args:
+            size (int): the size in bytes
+
+        Returns:
+            str: the formatted size, ie: 1.25 GB
+        """
+        if size is None:
+            return 'unknown'
+
+        size = float(size)
+        for unit in ('bytes', 'KB', 'MB', 'GB'):
+            if abs(size) < 1024:
+                if unit == 'bytes':
+                    return "{:0.0f} {}".format(size, unit)
+                return "{:0.2f} {}".format(size, unit)
+            size /= 1024
+
+        return "{:0.2f} TB".format(size)
@@ -0,0 +1,268 @@
+"""Holds the JobRunner class
+
+The JobRunner runs the long operations, such as imports, deletions and
+restores, as jobs on a pool of worker threads so that the Tk main thread
+never blocks on them. Their progress and results are handed back to the
+GUI by a single after() poller which runs on the Tk main thread.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Empty
+
+if TYPE_CHECKING:
+    from modules.gui import WindowController
+
+class Job():
+    """a job submitted to the JobRunner
+
+    Attributes:
+        id (int): the job id, unique for the application run
+        title (str): shown in the jobs panel and the progress window
+        cancel (Event): the cancellation token, handed to the job target
+        progress (tuple): the latest (done, total, status) of the job
+        started (bool): False while the job waits for a free worker
+        finished (bool): True once the job has stopped
+        window (Progress): the progress window of the job, if it has one
+    """
+    def __init__(self, job_id, title):
+        """Constructor
+
+        Args:
+            job_id (int): the job id
+            title (str): the job title
+        """
+        self.id = job_id
+        self.title = title
+        self.cancel = threading.Event()
+        self.messages = Queue()
+        self.progress = None
+        self.started = False
+        self.finished = False
+        self.window = None
+        self.on_progress = None
+        self.on_result = None
+        self.on_done = None
+        self.on_error = None
+
+    def describe(self):
+        """returns the state of the job as a short line of text
+        """
+        if self.cancel.is_set():
+            return "cancelling..."
+        if not self.started:
+            return "queued"
+        if not self.progress:
+            return "running"
+
+        done, total, status = self.progress
+        if total:
+            return "{:0.0%}".format(done / total)
+        return status or "running"
+
+    def focus(self):
+        """brings the progress window of the job to the front
+        """
+        if self.window:
+            self.window.focus()
+
+class JobRunner():
+    """JobRunner Class
+
+    Usage:
+        job = controller.jobs.submit(
+            "Delete Backups",
+            self.delete_backups_thread,
+            on_done=deletion_done
+        )
+        job.cancel.set()
+
+    The target of a job is called on a worker thread with
+    (settings, cancel, progress, *args). It must put
+    ('progress', (done, total, status)) messages and a final
+    ('finished', result) message on the progress queue, and may put
+    ('result', data) messages for partial results. Only the latest
+    progress is delivered, every partial result is. A job that raises
+    shows the error and calls on_error instead of on_done, so that
+    callers can restore their UI.
+    """
+    # the number of jobs that run at the same time, the others are queued
+    max_workers = 4
+    # how often (ms) the Tk main thread checks the progress of the jobs
+    poll_ms = 100
+
+    def __init__(self, controller: WindowController):
+        """Constructor
+
+        Args:
+            controller (WindowController): the main application controller
+        """
+        self.controller = controller
+        self.pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="Job"
+        )
+        self.jobs = {}
+        self.next_id = 0
+        self.listeners = []
+        self.polling = False
+
+    def submit(self, title, target, *args, on_progress=None, on_result=None,
+               on_done=None, on_error=None, show_progress=True):
+        """queues a job on the worker pool. Must be called from the
+        Tk main thread
+
+        Args:
+            title (str): the job title
+            target (function): the operation to run, see the class docstring
+            args: extra arguments for target
+            on_progress (function): default None. called on the Tk main
+                                    thread with (done, total, status)
+            on_result (function): default None. called on the Tk main thread
+                                  with the data of every result message
+            on_done (function): default None. called on the Tk main thread
+                                with the result
+            on_error (function): default None. called on the Tk main thread
+                                 with the exception, when the job raises
+            show_progress (bool): default True. shows the progress in a
+                                  progress window which can cancel the job
+
+        Returns:
+            Job: the submitted job
+        """
+        self.next_id += 1
+        job = Job(self.next_id, title)
+        job.on_progress = on_progress
+        job.on_result = on_result
+        job.on_done = on_done
+        job.on_error = on_error
+        if show_progress:
+            job.window = self.controller.show_progress(
+                title,
+                on_cancel=job.cancel.set
+            )
+
+        self.jobs[job.id] = job
+        self.pool.submit(
+            self._run,
+            job,
+            target,
+            (self.controller.app_settings.app_settings, job.cancel, job.messages, *args)
+        )
+        self._notify()
+        self._schedule_poll()
+        return job
+
+    def cancel(self, job_id):
+        """cancels a job. The job is listed until it has stopped
+
+        Args:
+            job_id (int): the id of the job to cancel
+        """
+        job = self.jobs.get(job_id)
+        if job:
+            job.cancel.set()
+            self._notify()
+
+    def cancel_all(self):
+        """cancels every job, for when the application closes
+        """
+        for job in self.jobs.values():
+            job.cancel.set()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def active(self):
+        """returns the jobs that haven't finished yet
+
+        Returns:
+            list: the jobs, in the order they were submitted
+        """
+        return list(self.jobs.values())
+
+    def add_listener(self, listener):
+        """registers a function which is called on the Tk main thread with
+        the active jobs every time a job is submitted, progresses or stops
+
+        Args:
+            listener (function): called with the list of active jobs
+        """
+        self.listeners.append(listener)
+        listener(self.active())
+
+    def _run(self, job, target, args):
+        """the worker thread side of a job
+        """
+        job.started = True
+        try:
+            target(*args)
+        except Exception as e:
+            job.messages.put(('error', e))
+
+    def _notify(self):
+        active = self.active()
+        for listener in self.listeners:
+            listener(active)
+
+    def _schedule_poll(self):
+        if not self.polling:
+            self.polling = True
+            self.controller.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        """delivers the progress and the results of the jobs on the
+        Tk main thread
+        """
+        for job in self.active():
+            self._deliver(job)
+
+        self._notify()
+        self.polling = False
+        if self.jobs:
+            self._schedule_poll()
+
+    def _deliver(self, job):
+        """delivers the messages of a job, and ends it once it has stopped
+        """
+        latest = None
+        end = None
+        while end is None:
+            try:
+                kind, data = job.messages.get_nowait()
+            except Empty:
+                break
+
+            if kind == 'progress':
+                latest = data
+            elif kind == 'result':
+                if job.on_result:
+                    job.on_result(data)
+            else:
+                end = (kind, data)
+
+        if latest and not job.cancel.is_set():
+            job.progress = latest
+            if job.window:
+                job.window.set_progress(*latest)
+            if job.on_progress:
+                job.on_progress(*latest)
+
+        if end is None:
+            return
+
+        del self.jobs[job.id]
+        job.finished = True
+        # the job committed its changes on its own connection
+        self.controller.db.expire_data_version()
+        if job.window:
+            job.window.finish()
+            job.window = None
+
+        kind, data = end
+        if kind == 'error':
+            self.controller.show_error(data)
+            if job.on_error:
+                job.on_error(data)
+        elif job.on_done:
+            job.on_done(data)
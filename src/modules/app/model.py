@@ -6,8 +6,12 @@ Responsible for all SQLite database read/writes for the application
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+import os
+import json
 import sqlite3
-from time import ctime
+import pathlib
+from collections import OrderedDict
+from time import ctime, perf_counter, monotonic
 
 if TYPE_CHECKING:
     from modules.gui import WindowController
@@ -16,6 +20,18 @@ class Model():
     """The Model Class
     handles all database logic/io
     """
+    # the maximum number of query results held in the query cache
+    cache_size = 128
+    # run ANALYZE, not just PRAGMA optimize, after this many changed rows
+    analyze_changes = 1000
+    # the maximum number of free pages released by one idle vacuum step
+    vacuum_step_pages = 256
+    # the maximum number of playthrough archives attached at the same time
+    max_attached = 4
+    # how long (seconds) the data_version of the databases is trusted
+    # before it is read again. 0 reads it for every cached read
+    data_version_interval = 0
+
     def __init__(self, controller: WindowController, dbpath: str):
         """constructor
         
@@ -27,6 +43,14 @@ class Model():
         self.controller = controller
         self.connection = None
         self.version = None
+        self.write_generation = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self._data_versions = None
+        self._data_versions_read = 0
+        self.optimized_changes = 0
+        self._attached = OrderedDict()
         self._connect()
         
     def _connect(self):
@@ -53,6 +77,518 @@ class Model():
         except sqlite3.Error as e:
             self.controller.show_error(e)
 
+    def _invalidate(self):
+        """bumps the write generation, which invalidates every cached query.
+        Must be called by every method that writes to the database
+        """
+        self.write_generation += 1
+
+    def _generation(self):
+        """returns the current cache generation
+
+        the generation combines our own write counter with the SQLite
+        data_version of the main database and of the attached archives,
+        which changes when another connection (the backup thread for
+        example) commits changes to the database. The data_version is
+        only read again once data_version_interval has passed, or once
+        it has been expired
+        """
+        now = monotonic()
+        if (
+            self._data_versions is None or
+            now - self._data_versions_read >= self.data_version_interval
+        ):
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            self._data_versions = tuple(
+                cursor.execute("PRAGMA {}.data_version".format(schema)).fetchone()[0]
+                for schema in ('main', *self._attached.values())
+            )
+            self._data_versions_read = now
+        return (self.write_generation, self._data_versions)
+
+    def expire_data_version(self):
+        """makes the next cached read check the data_version again, for
+        when another connection is known to have committed changes
+        """
+        self._data_versions = None
+
+    def _read(self, query, params, row_factory, fetch_one=False):
+        """runs a read only query through the query cache
+
+        results are cached by query and parameters, evicting the least
+        recently used entries, and are only reused while the generation
+        they were read in is still current. Cached results are shared
+        between callers, so they must be treated as read only.
+
+        sqlite3 errors are raised to the caller
+
+        Args:
+            query (str): the SQL query to run
+            params (tuple): the query parameters
+            row_factory (function): the row factory to build each row with
+            fetch_one (bool): default False. return the first row only
+        """
+        key = (query, params, fetch_one)
+        generation = self._generation()
+        entry = self._cache.get(key)
+        if entry and entry[0] == generation:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return entry[1]
+
+        self.cache_misses += 1
+        with self.connection as c:
+            c.row_factory = row_factory
+            cursor = c.execute(query, params)
+            if fetch_one:
+                res = cursor.fetchone()
+            else:
+                res = cursor.fetchall()
+
+        self._cache[key] = (generation, res)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return res
+
+    def cache_info(self):
+        """returns the query cache statistics
+        """
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'size': len(self._cache),
+            'max_size': self.cache_size,
+            'write_generation': self.write_generation
+        }
+
+    def _pragma(self, pragma):
+        """runs a PRAGMA statement and returns all the resulting rows
+
+        sqlite3 errors are raised to the caller
+
+        Args:
+            pragma (str): the PRAGMA statement to run
+        """
+        cursor = self.connection.cursor()
+        cursor.row_factory = None
+        return cursor.execute(pragma).fetchall()
+
+    def optimize(self, analyze=False):
+        """refreshes the query planner statistics
+
+        Args:
+            analyze (bool): default False. set to True to run a full ANALYZE
+                            instead of letting PRAGMA optimize decide
+        """
+        try:
+            if analyze:
+                self._pragma("ANALYZE")
+            self._pragma("PRAGMA optimize")
+            self.optimized_changes = self.connection.total_changes
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+    def after_large_mutation(self):
+        """should be called after bulk inserts or deletes, such as imports
+        and deletion runs, to keep the planner statistics current
+        """
+        changes = self.connection.total_changes - self.optimized_changes
+        self.optimize(analyze=changes >= self.analyze_changes)
+
+    def incremental_vacuum(self, pages=None):
+        """releases free pages back to the file system. Only has an
+        effect when the database uses incremental auto vacuum
+
+        Args:
+            pages (int): the maximum number of pages to release.
+                         default: vacuum_step_pages
+        """
+        # incremental_vacuum frees one page per step, and execute() only
+        # steps statements without result columns once, so use executescript
+        try:
+            self.connection.executescript("PRAGMA incremental_vacuum({:d});".format(
+                pages or self.vacuum_step_pages
+            ))
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+    def idle_maintenance(self):
+        """a single, bounded maintenance step which is run while
+        the application is idle
+
+        Returns:
+            dict: the database information after the maintenance step
+        """
+        info = self.get_db_info()
+        if info and info['auto_vacuum'] == 'incremental' and info['free_pages']:
+            self.incremental_vacuum()
+            info = self.get_db_info()
+
+        if self.connection.total_changes - self.optimized_changes > 0:
+            self.optimize()
+
+        return info
+
+    def get_db_info(self):
+        """returns the size and free space of the database
+        """
+        try:
+            page_count, = self._pragma("PRAGMA page_count")[0]
+            page_size, = self._pragma("PRAGMA page_size")[0]
+            free_pages, = self._pragma("PRAGMA freelist_count")[0]
+            auto_vacuum, = self._pragma("PRAGMA auto_vacuum")[0]
+            return {
+                'size': page_count * page_size,
+                'page_count': page_count,
+                'free_pages': free_pages,
+                'free_ratio': free_pages / page_count if page_count else 0,
+                'auto_vacuum': ('none', 'full', 'incremental')[auto_vacuum]
+            }
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return None
+
+    def integrity_check(self):
+        """runs the SQLite integrity check, which reads the whole database
+
+        Returns:
+            dict: the check results and the number of seconds it took
+        """
+        try:
+            timer_start = perf_counter()
+            results = [row[0] for row in self._pragma("PRAGMA integrity_check")]
+            return {
+                'ok': results == ['ok'],
+                'results': results,
+                'seconds': perf_counter() - timer_start
+            }
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return None
+
+    def archive_path(self, filename):
+        """returns the full path of a playthrough archive database.
+        archives are kept in the archive folder next to the main database
+
+        Args:
+            filename (str): the archive database filename
+        """
+        return os.path.join(
+            os.path.dirname(os.path.abspath(self.dbpath)),
+            'archive',
+            filename
+        )
+
+    def _get_archive(self, playthrough_id):
+        """returns the archive filename of a playthrough, None when the
+        playthrough is not archived
+
+        sqlite3 errors are raised to the caller
+        """
+        query = """
+            SELECT archive FROM playthroughs
+            WHERE id = ?
+        """
+        return self._read(
+            query,
+            (playthrough_id, ),
+            lambda cursor, row: row[0],
+            fetch_one=True
+        )
+
+    def _archived_playthrough(self, hash):
+        """returns the playthrough id of an archived backup, None when
+        the backup is not archived
+
+        sqlite3 errors are raised to the caller
+        """
+        query = """
+            SELECT playthrough_id FROM archived_backups
+            WHERE file_hash = ?
+        """
+        return self._read(
+            query,
+            (hash, ),
+            lambda cursor, row: row[0],
+            fetch_one=True
+        )
+
+    def _attach(self, playthrough_id, filename=None):
+        """attaches the archive database of a playthrough on demand and
+        returns its schema name, or None when the playthrough isn't archived.
+
+        only the most recently used archives are kept attached. Must be
+        called outside of a transaction, sqlite3 errors are raised to the
+        caller
+
+        Args:
+            playthrough_id (int): the playthrough id
+            filename (str): the archive filename, when the playthrough
+                            isn't marked as archived yet
+        """
+        playthrough_id = int(playthrough_id)
+        if playthrough_id in self._attached:
+            self._attached.move_to_end(playthrough_id)
+            return self._attached[playthrough_id]
+
+        if not filename:
+            filename = self._get_archive(playthrough_id)
+            if not filename:
+                return None
+            if not os.path.exists(self.archive_path(filename)):
+                raise sqlite3.OperationalError(
+                    "Archive database not found: {}".format(
+                        self.archive_path(filename)
+                    )
+                )
+
+        while len(self._attached) >= self.max_attached:
+            _, schema = self._attached.popitem(last=False)
+            self.connection.execute("DETACH DATABASE {}".format(schema))
+
+        schema = "archive_{:d}".format(playthrough_id)
+        self.connection.execute(
+            "ATTACH DATABASE ? AS {}".format(schema),
+            (self.archive_path(filename), )
+        )
+        self._attached[playthrough_id] = schema
+        self.expire_data_version()
+        self._upgrade_archive(schema)
+        return schema
+
+    def _backup_columns(self, schema='main'):
+        """returns the column definitions of the backups table of a schema
+        as a list of (name, type, default) tuples, in table order
+        """
+        cursor = self.connection.cursor()
+        cursor.row_factory = None
+        return [
+            (row[1], row[2], row[4])
+            for row in cursor.execute(
+                "PRAGMA {}.table_info(backups)".format(schema)
+            ).fetchall()
+        ]
+
+    def _backup_column_list(self):
+        """returns the quoted, comma separated column list of the main
+        backups table, which the backups are copied between the main
+        database and the archives with
+        """
+        return ", ".join(
+            '"{}"'.format(name) for name, _, _ in self._backup_columns()
+        )
+
+    def _upgrade_archive(self, schema):
+        """adds the columns which the migrations added to the main backups
+        table since the archive was created to the backups table of an
+        attached archive. Must be called outside of a transaction, sqlite3
+        errors are raised to the caller
+        """
+        archived = {name for name, _, _ in self._backup_columns(schema)}
+        if not archived:
+            # the archive is being created
+            return
+
+        for name, type, default in self._backup_columns():
+            if name in archived:
+                continue
+            self.connection.execute(
+                'ALTER TABLE {}.backups ADD COLUMN "{}" {}{}'.format(
+                    schema,
+                    name,
+                    type,
+                    "" if default is None else " DEFAULT {}".format(default)
+                )
+            )
+
+    def _detach(self, playthrough_id):
+        """detaches the archive database of a playthrough if it's attached
+        """
+        schema = self._attached.pop(int(playthrough_id), None)
+        if schema:
+            self.connection.execute("DETACH DATABASE {}".format(schema))
+            self.expire_data_version()
+
+    def release_archive(self, playthrough_id):
+        """detaches the archive database of a playthrough from this
+        connection, so that another connection can move or remove it
+
+        Args:
+            playthrough_id (int): the playthrough id
+        """
+        try:
+            self._detach(playthrough_id)
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+    def _backup_table(self, hash):
+        """returns the table holding the backup with the given hash,
+        attaching its archive database when the backup is archived
+        """
+        archived_id = self._archived_playthrough(hash)
+        if archived_id is None:
+            return 'backups'
+
+        return "{}.backups".format(self._attach(archived_id))
+
+    def _backups_source(self, playthrough_id):
+        """returns the table expression to read the backups of a playthrough
+        from. For archived playthroughs the archive is attached and unioned
+        with the main backups table, which holds the backups made since
+        the playthrough was archived
+        """
+        schema = self._attach(playthrough_id) if playthrough_id else None
+        if not schema:
+            return 'backups'
+
+        return """(
+                SELECT {0} FROM main.backups
+                UNION ALL
+                SELECT {0} FROM {1}.backups
+            ) AS backups""".format(self._backup_column_list(), schema)
+
+    def _unarchive_backups(self, playthrough_id, hash=None):
+        """moves archived backups back into the main database.
+
+        Moves a single backup when a hash is given, otherwise all the
+        archived backups of the playthrough. Must be called outside of a
+        transaction, sqlite3 errors are raised to the caller
+
+        Args:
+            playthrough_id (int): the playthrough id of the archive
+            hash (str): the hash of the backup to move
+        """
+        schema = self._attach(playthrough_id)
+        columns = self._backup_column_list()
+        where = "WHERE file_hash = ?" if hash else ""
+        params = (hash, ) if hash else ()
+        self._invalidate()
+        with self.connection as c:
+            c.execute(
+                "INSERT INTO main.backups ({0}) SELECT {0} FROM {1}.backups {2}".format(
+                    columns,
+                    schema,
+                    where
+                ),
+                params
+            )
+            c.execute(
+                """
+                UPDATE playthroughs SET archived_size = archived_size - (
+                    SELECT coalesce(sum(file_size), 0) FROM {}.backups {}
+                )
+                WHERE id = ?
+                """.format(schema, where),
+                params + (playthrough_id, )
+            )
+            c.execute(
+                "DELETE FROM archived_backups {}".format(
+                    where or "WHERE playthrough_id = ?"
+                ),
+                params or (playthrough_id, )
+            )
+            c.execute(
+                "DELETE FROM {}.backups {}".format(schema, where),
+                params
+            )
+            c.commit()
+
+    def archive_playthrough(self, playthrough_id):
+        """moves the backups of a finished playthrough out of the main
+        database into a separate archive database, which is attached
+        on demand when the backups are read.
+
+        Backups marked for deletion stay in the main database. Archived
+        backups are not part of the notes search index.
+
+        Args:
+            playthrough_id (int): the id of the playthrough to archive
+        """
+        filename = "playthrough_{:d}.db".format(int(playthrough_id))
+        where = 'WHERE playthrough_id = ? AND "delete" IS NOT TRUE'
+        self._invalidate()
+        try:
+            os.makedirs(os.path.dirname(self.archive_path(filename)), exist_ok=True)
+            schema = self._attach(playthrough_id, filename)
+            columns = self._backup_column_list()
+            with self.connection as c:
+                c.execute("""
+                    CREATE TABLE IF NOT EXISTS {0}.backups AS
+                    SELECT {1} FROM main.backups WHERE 0
+                """.format(schema, columns))
+                c.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS {0}.backups_file_hash
+                    ON backups (file_hash)
+                """.format(schema))
+                c.execute("""
+                    CREATE INDEX IF NOT EXISTS {0}.backups_playthrough_save_time
+                    ON backups (playthrough_id, x4_save_time)
+                """.format(schema))
+                c.execute(
+                    "INSERT INTO {0}.backups ({1}) SELECT {1} FROM main.backups {2}".format(
+                        schema,
+                        columns,
+                        where
+                    ),
+                    (playthrough_id, )
+                )
+                c.execute("""
+                    INSERT INTO archived_backups (file_hash, playthrough_id)
+                    SELECT file_hash, playthrough_id FROM main.backups {}
+                """.format(where), (playthrough_id, ))
+                c.execute("""
+                    UPDATE playthroughs SET
+                        archive = ?,
+                        archived_size = coalesce(archived_size, 0) + (
+                            SELECT coalesce(sum(file_size), 0)
+                            FROM main.backups {}
+                        )
+                    WHERE id = ?
+                """.format(where), (filename, playthrough_id, playthrough_id))
+                c.execute(
+                    "DELETE FROM main.backups {}".format(where),
+                    (playthrough_id, )
+                )
+                c.commit()
+            return True
+        except (sqlite3.Error, OSError) as e:
+            self.controller.show_error(e)
+
+        return False
+
+    def unarchive_playthrough(self, playthrough_id):
+        """moves the archived backups of a playthrough back into
+        the main database and removes its archive database
+
+        Args:
+            playthrough_id (int): the id of the playthrough to unarchive
+        """
+        try:
+            filename = self._get_archive(playthrough_id)
+            if not filename:
+                return False
+
+            self._unarchive_backups(playthrough_id)
+            self._invalidate()
+            with self.connection as c:
+                c.execute("""
+                    UPDATE playthroughs SET archive = NULL, archived_size = NULL
+                    WHERE id = ?
+                """, (playthrough_id, ))
+                c.commit()
+            self._detach(playthrough_id)
+            os.remove(self.archive_path(filename))
+            return True
+        except (sqlite3.Error, OSError) as e:
+            self.controller.show_error(e)
+
+        return False
+
     def save_playthrough(self, name, notes='', id=None, show_error=True, overwrite=False):
         """Saves/Updates a new playthrough to the playthroughs table
 
@@ -90,6 +626,7 @@ class Model():
             if overwrite == False:
                 return False
 
+        self._invalidate()
         with self.connection as c:
             try:
                 if entry:
@@ -126,6 +663,7 @@ Please choose a different playthrough name, one that doesn't already exist.""")
         if name == "__RECYCLE BIN__":
             return False
         
+        self._invalidate()
         with self.connection as c:
             try:
                 c.execute(query,(name,))
@@ -142,20 +680,24 @@ Please choose a different playthrough name, one that doesn't already exist.""")
             id (int): the id of the playthrough to retreive
         """
         query="""
-        SELECT id, name, notes FROM playthroughs
+        SELECT id, name, notes, archive FROM playthroughs
         WHERE id = ?
         """
-        with self.connection as c:
-            try:
-                c.row_factory = lambda cursor, row: {
+        try:
+            res = self._read(
+                query,
+                (id,),
+                lambda cursor, row: {
                     "id": row[0],
                     "name": row[1],
-                    "notes": row[2]
-                }
-                res = c.execute(query, (id,)).fetchone()
-                return res 
-            except sqlite3.Error as e:
-                    self.controller.show_error(e)
+                    "notes": row[2],
+                    "archived": bool(row[3])
+                },
+                fetch_one=True
+            )
+            return res 
+        except sqlite3.Error as e:
+                self.controller.show_error(e)
     
     def get_playthrough_by_name(self, name):
         """retrieve the playthrough with a specific name
@@ -164,39 +706,46 @@ Please choose a different playthrough name, one that doesn't already exist.""")
             name (str): the name of the playthrough to retreive
         """
         query="""
-        SELECT id, name, notes FROM playthroughs
+        SELECT id, name, notes, archive FROM playthroughs
         WHERE name = ?
         """
-        with self.connection as c:
-            try:
-                c.row_factory = lambda cursor, row: {
+        try:
+            res = self._read(
+                query,
+                (name,),
+                lambda cursor, row: {
                     "id": row[0],
                     "name": row[1],
-                    "notes": row[2]
-                }
-                res = c.execute(query, (name,)).fetchone()
-                return res 
-            except sqlite3.Error as e:
-                self.controller.show_error(e)
+                    "notes": row[2],
+                    "archived": bool(row[3])
+                },
+                fetch_one=True
+            )
+            return res 
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
 
     def get_playthroughs(self):
         """get all playthroughs
         """
         query="""
-        SELECT id, name, notes FROM playthroughs
+        SELECT id, name, notes, archive FROM playthroughs
         """
-        with self.connection as c:
-            try:
-                c.row_factory = lambda cursor, row: {
+        try:
+            res = self._read(
+                query,
+                (),
+                lambda cursor, row: {
                     "id": row[0],
                     "name": row[1],
-                    "notes": row[2]
+                    "notes": row[2],
+                    "archived": bool(row[3])
                 }
-                res = c.execute(query).fetchall()
-                return res 
-            except sqlite3.Error as e:
-                self.controller.show_error(e)
-                
+            )
+            return res 
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+            
     def get_playthrough_names(self):
         """get only the names of the playthroughs
         
@@ -206,13 +755,15 @@ Please choose a different playthrough name, one that doesn't already exist.""")
             SELECT name FROM playthroughs
             ORDER BY CASE WHEN name = '__RECYCLE BIN__' THEN 1 else 2 END, name COLLATE NOCASE ASC
         """
-        with self.connection as c:
-            try:
-                c.row_factory = lambda cursor, row: row[0]
-                res = c.execute(query).fetchall()
-                return res
-            except sqlite3.Error as e:
-                self.controller.show_error(e)
+        try:
+            res = self._read(
+                query,
+                (),
+                lambda cursor, row: row[0]
+            )
+            return res
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
 
     def check_backup_exists(self, hash):
         """a test to see if a backup exists for a certain file hash
@@ -221,19 +772,23 @@ Please choose a different playthrough name, one that doesn't already exist.""")
             hash (str): the SHA256 file hash to lookup
         """
         query = """
-            SELECT
-                file_hash
-            FROM backups
+            SELECT file_hash FROM backups
+            WHERE file_hash = ?
+            UNION ALL
+            SELECT file_hash FROM archived_backups
             WHERE file_hash = ?
         """
-        with self.connection as c:
-            try:
-                c.row_factory = lambda cursor, row: row[0]
-                res = c.execute(query, (hash, )).fetchone()
-                if res:
-                    return True
-            except sqlite3.Error as e:
-                self.controller.show_error(e)
+        try:
+            res = self._read(
+                query,
+                (hash, hash),
+                lambda cursor, row: row[0],
+                fetch_one=True
+            )
+            if res:
+                return True
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
         
         return False
     
@@ -250,12 +805,21 @@ Please choose a different playthrough name, one that doesn't already exist.""")
             file_hash (str): the hash of the backup to update
         """
         query = """
-            UPDATE backups 
+            UPDATE {}
             SET playthrough_id = ?, branch = ?, flag = ?, notes = ?, "delete" = ?
             WHERE file_hash = ?
         """
+        self._invalidate()
         with self.connection as c:
             try:
+                # an archived backup that is moved to another playthrough
+                # or marked for deletion goes back to the main database
+                archived_id = self._archived_playthrough(file_hash)
+                if archived_id is not None and (
+                    delete or str(archived_id) != str(playthrough_id)
+                ):
+                    self._unarchive_backups(archived_id, file_hash)
+                query = query.format(self._backup_table(file_hash))
                 c.execute(query, (
                     playthrough_id,
                     branch,
@@ -291,8 +855,14 @@ Please choose a different playthrough name, one that doesn't already exist.""")
             # figure out the playthrough_id for __DELEDTED__ playthrough
             dp = self.get_playthrough_by_name("__RECYCLE BIN__")
         
+        self._invalidate()
         with self.connection as c:
             try:
+                # backups marked for deletion are always kept in the main
+                # database, where the pruning and deletion queries see them
+                archived_id = self._archived_playthrough(hash)
+                if archived_id is not None:
+                    self._unarchive_backups(archived_id, hash)
                 if move_playthrough:
                     c.execute(query, (
                         dp['id'],
@@ -325,6 +895,7 @@ Please choose a different playthrough name, one that doesn't already exist.""")
         backup = self.get_backup_by_hash(hash)
 
         if not dp['id'] == backup['playthrough_id']:
+            self._invalidate()
             with self.connection as c:
                 try:
                     c.execute(query, (
@@ -354,12 +925,13 @@ by assigning it to another playthrough""".format(
             hash (str): the SHA256 hash of the backup to update
         """
         query = """
-            UPDATE backups SET flag = ?, notes = ?, branch = ?
+            UPDATE {} SET flag = ?, notes = ?, branch = ?
             WHERE file_hash = ?
         """
+        self._invalidate()
         with self.connection as c:
             try:
-                c.execute(query, (
+                c.execute(query.format(self._backup_table(hash)), (
                     flag,
                     notes,
                     branch,
@@ -378,12 +950,13 @@ by assigning it to another playthrough""".format(
             hash (str): the SHA256 hash of the backup to update
         """
         query = """
-            UPDATE backups SET flag = ?
+            UPDATE {} SET flag = ?
             WHERE file_hash = ?
         """
+        self._invalidate()
         with self.connection as c:
             try:
-                c.execute(query, (
+                c.execute(query.format(self._backup_table(hash)), (
                     flag,
                     hash, 
                 ))
@@ -397,64 +970,222 @@ by assigning it to another playthrough""".format(
         Args:
             playthrough_id (int): the playthrough id
         """
+        # playthrough_branches is kept up to date by triggers on the backups
+        # table, so we don't have to scan all the backups of a playthrough.
+        # archived backups are not covered by the triggers, so for archived
+        # playthroughs the branches are read from the backups themselves
         query="""
-            SELECT DISTINCT(branch) FROM backups
+            SELECT branch FROM playthrough_branches
             WHERE playthrough_id = ?
-            ORDER BY branch 
+            ORDER BY branch
         """
-        with self.connection as c:
-            try:
-                c.row_factory = lambda cursor, row: row[0]
-                res = c.execute(query, (playthrough_id, )).fetchall()
-                if res:
-                    return res
-                else:
-                    return ['1 - main']
-            except sqlite3.Error as e:
-                self.controller.show_error(e)
+        archived_query="""
+            SELECT DISTINCT coalesce(branch, '') FROM {}
+            WHERE playthrough_id = ?
+            ORDER BY 1
+        """
+        try:
+            if self._get_archive(playthrough_id):
+                query = archived_query.format(
+                    self._backups_source(playthrough_id)
+                )
+            res = self._read(
+                query,
+                (playthrough_id, ),
+                lambda cursor, row: row[0]
+            )
+            if res:
+                return res
+            else:
+                return ['1 - main']
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
         
         return None
 
-    def set_branch(self, hash, branch):
-        """updates the branch name for a specific playthrough matched 
-        by the file hash
+    def get_playthrough_stats(self, playthrough_id):
+        """returns the summary statistics for the given playthrough id.
 
-        Args:
-            hash (str): the file hash
-            branch (str): the branch name
-        """
-        query = """
-            UPDATE backups SET branch = ?
-            WHERE file_hash = ?
-        """
-        with self.connection as c:
-            try:
-                c.execute(query, (
-                    branch,
-                    hash, 
-                ))
-                c.commit()
-            except sqlite3.Error as e:
-                self.controller.show_error(e)
+        the statistics are maintained by triggers on the backups table
+        so this is a single row lookup. Archived backups are not covered
+        by the triggers, so they are aggregated for archived playthroughs
 
-    def update_backup_playthrough(self, playthrough_id, backup_filename, hash):
-        """updates the playthrough_id and the backup_filename for a specific
-        backup specified by hash. Used when moving a backup between playthroughs
-        
         Args:
-            playthrough_id (int): the playthrough ID to associate this backup with
-            backup_filename (str): the name of the backup file
-            hash (str): the hash of record which will be updated
+            playthrough_id (int): the playthrough id
         """
-        query = """
-            UPDATE backups SET playthrough_id = ?, backup_filename = ?
-            WHERE file_hash = ?
+        query="""
+            SELECT
+                backup_count
+                , latest_save_time
+                , max_playtime
+                , branch_count
+                , total_size
+            FROM playthrough_stats
+            WHERE playthrough_id = ?
         """
-        with self.connection as c:
-            try:
-                c.execute(query, (
-                    playthrough_id,
-                    backup_filename,
+        archived_query="""
+            SELECT
+                count(*)
+                , max(x4_save_time)
+                , max(playtime)
+                , count(DISTINCT coalesce(branch, ''))
+                , coalesce(sum(file_size), 0)
+            FROM {}
+            WHERE playthrough_id = ?
+        """
+        try:
+            if self._get_archive(playthrough_id):
+                query = archived_query.format(
+                    self._backups_source(playthrough_id)
+                )
+            res = self._read(
+                query,
+                (playthrough_id, ),
+                lambda cursor, row: {
+                    'backup_count': row[0],
+                    'latest_save_time': row[1],
+                    'max_playtime': row[2] if row[2] else 0,
+                    'branch_count': row[3],
+                    'total_size': row[4]
+                },
+                fetch_one=True
+            )
+            if res:
+                return res
+            else:
+                return {
+                    'backup_count': 0,
+                    'latest_save_time': None,
+                    'max_playtime': 0,
+                    'branch_count': 0,
+                    'total_size': 0
+                }
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return None
+
+    def get_total_backup_size(self):
+        """returns the total size in bytes of all backups.
+
+        sums the per playthrough totals maintained by triggers
+        and the sizes recorded when playthroughs were archived
+        instead of aggregating over all the backups
+        """
+        query = """
+            SELECT
+                (SELECT coalesce(sum(total_size), 0) FROM playthrough_stats)
+                + (SELECT coalesce(sum(archived_size), 0) FROM playthroughs)
+        """
+        try:
+            return self._read(
+                query,
+                (),
+                lambda cursor, row: row[0],
+                fetch_one=True
+            )
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return None
+
+    def get_backups_missing_storage_metadata(self):
+        """returns the backups that don't have their file size
+        and storage metadata recorded yet
+        """
+        query = """
+            SELECT file_hash, backup_filename
+            FROM backups
+            WHERE file_size IS NULL
+        """
+        try:
+            return self._read(
+                query,
+                (),
+                lambda cursor, row: {
+                    'file_hash': row[0],
+                    'backup_filename': row[1]
+                }
+            )
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return []
+
+    def update_storage_metadata(self, backups):
+        """records the file size and storage metadata for many backups
+        in a single transaction
+
+        Args:
+            backups (list): list of dicts with the keys file_hash,
+                            file_size, uncompressed_size and stored_mtime
+        """
+        query = """
+            UPDATE backups SET
+                file_size = ?,
+                uncompressed_size = ?,
+                stored_mtime = ?
+            WHERE file_hash = ?
+        """
+        self._invalidate()
+        with self.connection as c:
+            try:
+                c.executemany(query, [(
+                    backup['file_size'],
+                    backup['uncompressed_size'],
+                    backup['stored_mtime'],
+                    backup['file_hash']
+                ) for backup in backups])
+                c.commit()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+    def set_branch(self, hash, branch):
+        """updates the branch name for a specific playthrough matched 
+        by the file hash
+
+        Args:
+            hash (str): the file hash
+            branch (str): the branch name
+        """
+        query = """
+            UPDATE {} SET branch = ?
+            WHERE file_hash = ?
+        """
+        self._invalidate()
+        with self.connection as c:
+            try:
+                c.execute(query.format(self._backup_table(hash)), (
+                    branch,
+                    hash, 
+                ))
+                c.commit()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+    def update_backup_playthrough(self, playthrough_id, backup_filename, hash):
+        """updates the playthrough_id and the backup_filename for a specific
+        backup specified by hash. Used when moving a backup between playthroughs
+        
+        Args:
+            playthrough_id (int): the playthrough ID to associate this backup with
+            backup_filename (str): the name of the backup file
+            hash (str): the hash of record which will be updated
+        """
+        query = """
+            UPDATE backups SET playthrough_id = ?, backup_filename = ?
+            WHERE file_hash = ?
+        """
+        self._invalidate()
+        with self.connection as c:
+            try:
+                # moving an archived backup brings it back to the main database
+                archived_id = self._archived_playthrough(hash)
+                if archived_id is not None:
+                    self._unarchive_backups(archived_id, hash)
+                c.execute(query, (
+                    playthrough_id,
+                    backup_filename,
                     hash, 
                 ))
                 c.commit()
@@ -488,12 +1219,14 @@ by assigning it to another playthrough""".format(
                 , notes
                 , "delete"
                 , branch
-            FROM backups
+            FROM {}
             WHERE file_hash = ?
         """
-        with self.connection as c:
-            try:
-                c.row_factory = lambda cursor, row: {
+        try:
+            res = self._read(
+                query.format(self._backup_table(hash)),
+                (hash, ),
+                lambda cursor, row: {
                     'playthrough_id': row[0],
                     'x4_filename': row[1],
                     'x4_save_time': ctime(row[2]),
@@ -513,11 +1246,12 @@ by assigning it to another playthrough""".format(
                     'notes': row[16],
                     'delete': bool(row[17]),
                     'branch': row[18]
-                }
-                res = c.execute(query, (hash, )).fetchone()
-                return res
-            except sqlite3.Error as e:
-                self.controller.show_error(e)
+                },
+                fetch_one=True
+            )
+            return res
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
         
         return None
     
@@ -530,8 +1264,12 @@ by assigning it to another playthrough""".format(
         query = """
             DELETE FROM backups WHERE file_hash = ?
         """
+        self._invalidate()
         with self.connection as c:
             try:
+                archived_id = self._archived_playthrough(hash)
+                if archived_id is not None:
+                    self._unarchive_backups(archived_id, hash)
                 c.execute(query, (
                     hash, 
                 ))
@@ -540,95 +1278,142 @@ by assigning it to another playthrough""".format(
                 self.controller.show_error(e)
 
 
-    def get_backups_to_delete(
-            self,
-            sort_column='x4_save_time',
-            sort_direction='asc'
-        ):
-        """retreives all backups that have been marked for deletion
+    def _deletable_clause(self):
+        """returns the SQL expression which is true for the marked backups
+        that may be deleted: backups that aren't flagged and whose savetype
+        may be deleted, as set in the backup settings
+        """
+        policy = self._retention_policy()
+        savetypes = [
+            "x4_filename LIKE '{}%'".format(savetype)
+            for setting, savetype in (
+                ('DELETE_QUICKSAVES', 'quicksave'),
+                ('DELETE_AUTOSAVES', 'autosave'),
+                ('DELETE_SAVES', 'save')
+            )
+            if policy[setting]
+        ]
+        return "NOT flag AND ({})".format(' OR '.join(savetypes) or 'FALSE')
+
+    def count_deletable_backups(self):
+        """counts the backups marked for deletion, without reading them,
+        see get_deletable_backups
+
+        Returns:
+            dict: count and bytes, the number and total size of the backups
+                  that may be deleted, and blocked, the number of marked
+                  backups the settings don't allow to delete
         """
         query = """
             SELECT
-                playthrough_id
-                , x4_filename
-                , x4_save_time
-                , file_hash
-                , backup_time
-                , backup_filename
-                , backup_duration
-                , game_version
-                , original_game_version
-                , playtime
-                , x4_start_type
-                , character_name
-                , company_name
-                , money
-                , moded
-                , flag
-                , notes
-                , "delete"
-                , branch
-            FROM backups
-            WHERE "delete" = TRUE
-            ORDER BY {} {}
-        """.format(
-            sort_column,
-            sort_direction
-        )
+                count(*) FILTER (WHERE deletable),
+                total(file_size) FILTER (WHERE deletable),
+                count(*) FILTER (WHERE NOT deletable)
+            FROM (
+                SELECT file_size, {} AS deletable
+                FROM backups
+                WHERE "delete"
+            )
+        """.format(self._deletable_clause())
+        try:
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            count, size, blocked = cursor.execute(query).fetchone()
+            return {
+                'count': count,
+                'bytes': int(size),
+                'blocked': blocked
+            }
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
 
-        with self.connection as c:
-            try:
-                c.row_factory = lambda cursor, row: {
-                    'playthrough_id': row[0],
-                    'x4_filename': row[1],
-                    'x4_save_time': ctime(row[2]),
-                    'file_hash': row[3],
-                    'backup_time': ctime(row[4]),
-                    'backup_filename': row[5],
-                    'backup_duration': row[6],
-                    'game_version': row[7],
-                    'original_game_version': row[8],
-                    'playtime': row[9],
-                    'x4_start_type': row[10],
-                    'character_name': row[11],
-                    'company_name': row[12],
-                    'money': float(row[13] if row[13] else 0),
-                    'moded': bool(row[14]),
-                    'flag': bool(row[15]),
-                    'notes': row[16],
-                    'delete': bool(row[17]),
-                    'branch': row[18]
-                }
-                res = c.execute(query).fetchall()
-                return res
-            except sqlite3.Error as e:
-                self.controller.show_error(e)
-        
         return None
 
-    def get_latest_backups(self):
-        """returns the file_hashes of the latest backups.
-        The number returned is configed in the backup options
-        "Do Not Prune Last Backups" option
+    def get_deletable_backups(self):
+        """decides which of the backups marked for deletion may be deleted:
+        backups that aren't flagged and whose savetype may be deleted,
+        as set in the backup settings
+
+        Returns:
+            dict: backups, a list of (file_hash, backup_filename, file_size)
+                  tuples, and blocked, the number of marked backups
+                  the settings don't allow to delete
         """
         query = """
-            SELECT file_hash FROM backups ORDER BY x4_save_time DESC LIMIT {}
-        """.format(
-            self.controller.app_settings.get_app_setting(
-                'DO_NOT_DELETE_LAST',
-                category='BACKUP'
-            )
-        )
+            SELECT file_hash, backup_filename, file_size,
+                {} AS deletable
+            FROM backups
+            WHERE "delete"
+            ORDER BY x4_save_time
+        """.format(self._deletable_clause())
+        deletable = {
+            'backups': [],
+            'blocked': 0
+        }
+        try:
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            for file_hash, backup_filename, file_size, allowed in cursor.execute(query):
+                if allowed:
+                    deletable['backups'].append(
+                        (file_hash, backup_filename, file_size)
+                    )
+                else:
+                    deletable['blocked'] += 1
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
 
+        return deletable
+
+    def journal_deletions(self, backups):
+        """records the backups whose files are about to be deleted in the
+        delete journal, so an interrupted deletion can be recovered.
+        see get_delete_journal. sqlite3 errors are raised to the caller
+
+        Args:
+            backups (list): (file_hash, backup_filename, ...) tuples
+        """
+        query = """
+            INSERT OR REPLACE INTO delete_journal (file_hash, backup_filename)
+            VALUES (?,?)
+        """
+        self._invalidate()
         with self.connection as c:
-            try:
-                c.row_factory = lambda cursor, row: row[0]
-                res = c.execute(query).fetchall()
-                return res
-            except sqlite3.Error as e:
-                self.controller.show_error(e)
-        
-        return None
+            c.executemany(query, [backup[:2] for backup in backups])
+
+    def commit_deletions(self, deleted, failed=()):
+        """deletes the backups whose files were deleted and clears their
+        delete journal entries, and the entries of the files that could
+        not be deleted, in a single transaction. sqlite3 errors are
+        raised to the caller
+
+        Args:
+            deleted (list): the hashes of the deleted backups
+            failed (list): the hashes of the backups that weren't deleted
+        """
+        self._invalidate()
+        with self.connection as c:
+            c.executemany(
+                "DELETE FROM backups WHERE file_hash = ?",
+                [(hash, ) for hash in deleted]
+            )
+            c.executemany(
+                "DELETE FROM delete_journal WHERE file_hash = ?",
+                [(hash, ) for hash in (*deleted, *failed)]
+            )
+
+    def get_delete_journal(self):
+        """returns the delete journal entries left by an interrupted deletion
+
+        Returns:
+            list: (file_hash, backup_filename) tuples
+        """
+        query = """
+            SELECT file_hash, backup_filename FROM delete_journal
+        """
+        cursor = self.connection.cursor()
+        cursor.row_factory = None
+        return cursor.execute(query).fetchall()
 
     def get_backups_by_id(
             self,
@@ -671,7 +1456,7 @@ by assigning it to another playthrough""".format(
                 , notes
                 , "delete"
                 , branch
-            FROM backups
+            FROM {}
             WHERE playthrough_id = ?
         """
 
@@ -690,9 +1475,11 @@ by assigning it to another playthrough""".format(
             sort_direction
         )
 
-        with self.connection as c:
-            try:
-                c.row_factory = lambda cursor, row: {
+        try:
+            res = self._read(
+                query.format(self._backups_source(playthrough_id)),
+                (playthrough_id, ),
+                lambda cursor, row: {
                     'playthrough_id': row[0],
                     'x4_filename': row[1],
                     'x4_save_time': ctime(row[2]),
@@ -713,107 +1500,626 @@ by assigning it to another playthrough""".format(
                     'delete': bool(row[17]),
                     'branch': row[18]
                 }
-                res = c.execute(query, (
-                    playthrough_id,
-                )).fetchall()
-                return res
-            except sqlite3.Error as e:
-                self.controller.show_error(e)
+            )
+            return res
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
         
         return None
-    
-    def get_old_backups(self):
-        """retreives all backups older then the 'delete_old_days' app setting
-        which don't already have the delete mark set, and which don't have the
-        do not delete flag set
+
+    def get_backup_listing(
+            self,
+            playthrough_id=None,
+            deleted_only=False,
+            include_to_delete=False,
+            sort_column='x4_save_time',
+            sort_direction='asc',
+            branch=None,
+            hashes=None
+        ):
+        """retrieves only the columns displayed in the StartPage backup
+        treeview. The notes preview (first line of the notes) is computed by
+        SQLite so the full notes text never leaves the database, and numeric
+        values are returned raw so formatting is deferred to the widget
+
+        Args:
+            playthrough_id (int): the playthrough_id to list backups for
+            deleted_only (bool): default False. lists all backups marked for
+                                 deletion (the __RECYCLE BIN__ view) instead
+                                 of the backups of a single playthrough
+            include_to_delete (bool): default False. Includes the items marked
+                                      for deletion
+            sort_column (str): which column to sort by (default is x4_save_time)
+            sort_direction (str): Default Asc. Asc/Desc
+            branch (str): by default all branches are returned.
+                          limits the results to a specific branch
+            hashes (list): default None. limits the results to the backups
+                           with these hashes, to refresh single rows
         """
+        # the preview is capped so a single huge line of notes
+        # doesn't get transfered for every row either
         query = """
             SELECT
-                playthrough_id
-                , x4_filename
+                backup_filename
                 , x4_save_time
-                , file_hash
-                , backup_time
-                , backup_filename
-                , backup_duration
-                , game_version
-                , original_game_version
+                , branch
                 , playtime
-                , x4_start_type
                 , character_name
-                , company_name
                 , money
                 , moded
                 , flag
-                , notes
-                , "delete"
-                , branch
-            FROM backups
-            WHERE 
-                x4_save_time <= unixepoch('now', '-{} day')
-                AND NOT "delete"
-                AND NOT flag
-        """.format(
-            self.controller.app_settings.get_app_setting(
-                'DELETE_OLD_DAYS',
-                category='BACKUP'
-            )
+                , substr(
+                    coalesce(notes, ''),
+                    1,
+                    min(
+                        CASE WHEN instr(coalesce(notes, ''), char(10)) > 0
+                            THEN instr(coalesce(notes, ''), char(10)) - 1
+                            ELSE length(coalesce(notes, ''))
+                        END,
+                        120
+                    )
+                ) AS notes_preview
+                , file_hash
+            FROM {}
+        """
+        source, params = self._backup_listing_source(
+            playthrough_id,
+            deleted_only,
+            include_to_delete,
+            branch
         )
+        query = query.format(source)
+        if hashes is not None:
+            query += " AND file_hash IN (SELECT value FROM json_each(?))"
+            params += (json.dumps(list(hashes)), )
 
-        if (
-            self.controller.app_settings.get_app_setting(
-                'DELETE_QUICKSAVES',
-                category='BACKUP'
-            ) == False
-        ):
-            query += " and x4_filename NOT LIKE 'quicksave%' "
-        
-        if (
-            self.controller.app_settings.get_app_setting(
-                'DELETE_AUTOSAVES',
-                category='BACKUP'
-            ) == False
-        ):
-            query += " and x4_filename NOT LIKE 'autosave%' "
-        
-        if (
-            self.controller.app_settings.get_app_setting(
-                'DELETE_SAVES',
-                category='BACKUP'
-            ) == False
-        ):
-            query += " and x4_filename NOT LIKE 'save%' "
-
-        with self.connection as c:
+        # SQL Parameters can't be used in the order by
+        # they can only be used to replace values.
+        # the hash breaks ties, the same way BackupListing does
+        query += " ORDER BY {0} {1}, file_hash {1}".format(
+            sort_column,
+            sort_direction
+        )
+
+        try:
+            res = self._read(
+                query,
+                params,
+                lambda cursor, row: {
+                    'backup_filename': row[0],
+                    'x4_save_time': row[1],
+                    'branch': row[2],
+                    'playtime': row[3] if row[3] else 0,
+                    'character_name': row[4],
+                    'money': row[5] if row[5] else 0,
+                    'moded': bool(row[6]),
+                    'flag': bool(row[7]),
+                    'notes_preview': row[8],
+                    'file_hash': row[9]
+                }
+            )
+            return res
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return None
+
+    def _backup_listing_source(
+            self,
+            playthrough_id,
+            deleted_only,
+            include_to_delete,
+            branch,
+            filters=None
+        ):
+        """returns the FROM and WHERE clauses, and their parameters,
+        of get_backup_listing and filter_backups
+        """
+        if deleted_only:
+            source = 'backups WHERE "delete" = TRUE'
+            params = ()
+        else:
+            table = self._backups_source(playthrough_id)
+            source = "{} WHERE playthrough_id = ?".format(table)
+            params = (playthrough_id,)
+
+            if not include_to_delete:
+                source += " AND \"delete\" IS NOT TRUE"
+
+            if branch:
+                source += " AND branch = ?"
+                params += (branch,)
+
+        if filters:
+            # the notes index only covers the main backups table
+            clauses, filter_params = self._backup_filter_clauses(
+                filters,
+                indexed_text=deleted_only or table == 'backups'
+            )
+            source += clauses
+            params += filter_params
+
+        return source, params
+
+    # the first and the last+1 x4 filename of every save type, so the
+    # save type filter is a range over the backups_filter index
+    save_type_ranges = {
+        'autosave': ('autosave', 'autosavf'),
+        'quicksave': ('quicksave', 'quicksavf'),
+        'save': ('save', 'savf')
+    }
+
+    def _backup_filter_clauses(self, filters, indexed_text=True):
+        """returns the WHERE clauses, and their parameters, of the filter
+        bar filters. Every filter that isn't set is ignored
+
+        Args:
+            filters (dict): savetype (autosave/quicksave/save), flag (bool),
+                            game_version (str), character (str),
+                            min_playtime and max_playtime (seconds),
+                            and text, matched against the notes, branch
+                            and character name as word prefixes
+            indexed_text (bool): default True. matches the text with the
+                                 full text index, otherwise with LIKE,
+                                 for archived backups
+
+        Returns:
+            tuple: (str, tuple) the clauses, each starting with AND,
+                   and their parameters
+        """
+        clauses = ""
+        params = ()
+
+        save_range = self.save_type_ranges.get(filters.get('savetype'))
+        if save_range:
+            clauses += " AND x4_filename >= ? AND x4_filename < ?"
+            params += save_range
+
+        if filters.get('flag') is not None:
+            # flagged backups are found with the partial backups_flagged index
+            clauses += " AND flag" if filters['flag'] else " AND flag IS NOT TRUE"
+
+        if filters.get('game_version'):
+            clauses += " AND game_version = ?"
+            params += (filters['game_version'],)
+
+        if filters.get('character'):
+            clauses += " AND character_name = ?"
+            params += (filters['character'],)
+
+        if filters.get('min_playtime') is not None:
+            clauses += " AND playtime >= ?"
+            params += (filters['min_playtime'],)
+
+        if filters.get('max_playtime') is not None:
+            clauses += " AND playtime <= ?"
+            params += (filters['max_playtime'],)
+
+        text = filters.get('text')
+        if text and indexed_text:
+            match = self._fts_query(text)
+            if match:
+                clauses += " AND rowid IN (SELECT rowid FROM backups_fts WHERE backups_fts MATCH ?)"
+                params += (match,)
+        elif text:
+            for word in text.split():
+                pattern = "%{}%".format(
+                    word.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                )
+                clauses += """ AND (
+                    notes LIKE ? ESCAPE '\\'
+                    OR branch LIKE ? ESCAPE '\\'
+                    OR character_name LIKE ? ESCAPE '\\'
+                )"""
+                params += (pattern, pattern, pattern)
+
+        return clauses, params
+
+    def filter_backups(
+            self,
+            filters,
+            playthrough_id=None,
+            deleted_only=False,
+            include_to_delete=False,
+            branch=None
+        ):
+        """returns the hashes of the backups listed by get_backup_listing
+        which match the filter bar filters. Only the hashes are read, the
+        StartPage filters the listing it already holds with them
+
+        Args:
+            filters (dict): the filters, see _backup_filter_clauses
+            playthrough_id (int): the playthrough_id to list backups for
+            deleted_only (bool): default False. filters the backups marked
+                                 for deletion instead
+            include_to_delete (bool): default False. Includes the items marked
+                                      for deletion
+            branch (str): by default all branches are filtered.
+                          limits the results to a specific branch
+
+        Returns:
+            list: the hashes of the matching backups
+        """
+        source, params = self._backup_listing_source(
+            playthrough_id,
+            deleted_only,
+            include_to_delete,
+            branch,
+            filters
+        )
+        try:
+            return self._read(
+                "SELECT file_hash FROM {}".format(source),
+                params,
+                lambda cursor, row: row[0]
+            ) or []
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return None
+
+    def get_backup_filter_values(self, playthrough_id=None, deleted_only=False):
+        """returns the game versions and character names of the backups
+        listed by get_backup_listing, for the filter bar dropdowns
+
+        Args:
+            playthrough_id (int): the playthrough_id to list backups for
+            deleted_only (bool): default False. reads the backups marked
+                                 for deletion instead
+
+        Returns:
+            dict: game_versions and characters, sorted lists of the
+                  distinct values
+        """
+        source, params = self._backup_listing_source(
+            playthrough_id,
+            deleted_only,
+            False,
+            None
+        )
+        query = """
+            SELECT DISTINCT {0} FROM {1}
+            AND {0} IS NOT NULL
+            ORDER BY {0}
+        """
+        try:
+            return {
+                name: self._read(
+                    query.format(column, source),
+                    params,
+                    lambda cursor, row: row[0]
+                ) or []
+                for name, column in (
+                    ('game_versions', 'game_version'),
+                    ('characters', 'character_name')
+                )
+            }
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return None
+
+    def search(self, text, limit=50, offset=0):
+        """full text search over the backup notes, branches and character
+        names, and the playthrough notes, across all playthroughs
+
+        Args:
+            text (str): the text to search for. every word is matched as a
+                        prefix, and all words must match
+            limit (int): the maximum number of hits to return (default 50)
+            offset (int): the number of hits to skip, used for paging
+
+        Returns:
+            list: dictionaries for each hit, best matches first
+        """
+        match = self._fts_query(text)
+        if not match:
+            return []
+
+        # bm25() returns lower values for better matches
+        query = """
+            SELECT
+                kind
+                , playthrough_id
+                , playthrough_name
+                , file_hash
+                , backup_filename
+                , x4_save_time
+                , snippet
+            FROM (
+                SELECT
+                    'backup' AS kind
+                    , b.playthrough_id
+                    , p.name AS playthrough_name
+                    , b.file_hash
+                    , b.backup_filename
+                    , b.x4_save_time
+                    , snippet(backups_fts, -1, '[', ']', '...', 12) AS snippet
+                    , bm25(backups_fts) AS rank
+                FROM backups_fts
+                JOIN backups b ON b.rowid = backups_fts.rowid
+                LEFT JOIN playthroughs p ON p.id = b.playthrough_id
+                WHERE backups_fts MATCH ?
+                UNION ALL
+                SELECT
+                    'playthrough' AS kind
+                    , p.id
+                    , p.name
+                    , NULL
+                    , NULL
+                    , NULL
+                    , snippet(playthroughs_fts, -1, '[', ']', '...', 12)
+                    , bm25(playthroughs_fts)
+                FROM playthroughs_fts
+                JOIN playthroughs p ON p.id = playthroughs_fts.rowid
+                WHERE playthroughs_fts MATCH ?
+            )
+            ORDER BY rank
+            LIMIT ? OFFSET ?
+        """
+        with self.connection as c:
             try:
                 c.row_factory = lambda cursor, row: {
-                    'playthrough_id': row[0],
-                    'x4_filename': row[1],
-                    'x4_save_time': ctime(row[2]),
+                    'kind': row[0],
+                    'playthrough_id': row[1],
+                    'playthrough_name': row[2],
                     'file_hash': row[3],
-                    'backup_time': ctime(row[4]),
-                    'backup_filename': row[5],
-                    'backup_duration': row[6],
-                    'game_version': row[7],
-                    'original_game_version': row[8],
-                    'playtime': row[9],
-                    'x4_start_type': row[10],
-                    'character_name': row[11],
-                    'company_name': row[12],
-                    'money': float(row[13] if row[13] else 0),
-                    'moded': bool(row[14]),
-                    'flag': bool(row[15]),
-                    'notes': row[16],
-                    'delete': bool(row[17]),
-                    'branch': row[18]
+                    'backup_filename': row[4],
+                    'x4_save_time': ctime(row[5]) if row[5] else '',
+                    'snippet': row[6]
                 }
-                res = c.execute(query).fetchall()
+                res = c.execute(query, (
+                    match,
+                    match,
+                    limit,
+                    offset
+                )).fetchall()
                 return res
             except sqlite3.Error as e:
                 self.controller.show_error(e)
-        
+
         return None
 
+    @staticmethod
+    def _fts_query(text):
+        """converts user input into a safe FTS5 MATCH expression
+
+        every word is quoted, so FTS5 operators and punctuation typed by the
+        user can't cause syntax errors, and is matched as a prefix
+
+        Args:
+            text (str): the user supplied search text
+        """
+        words = text.split() if text else []
+        return " ".join(
+            '"{}"*'.format(word.replace('"', '""')) for word in words
+        )
+
+    # the grandfather-father-son tiers: the newest backup of every period
+    # is kept while it's younger than the tier's setting
+    retention_tiers = (
+        ('KEEP_HOURLY', 'hours', "strftime('%Y-%m-%d %H', x4_save_time, 'unixepoch', 'localtime')"),
+        ('KEEP_DAILY', 'days', "date(x4_save_time, 'unixepoch', 'localtime')"),
+        ('KEEP_WEEKLY', 'days', "date(x4_save_time, 'unixepoch', 'localtime', 'weekday 0', '-6 days')"),
+    )
+
+    def _retention_policy(self, policy=None):
+        """returns the retention policy, from the backup settings,
+        overridden by the values in policy
+
+        Args:
+            policy (dict): default None. backup settings to override
+        """
+        names = (
+            'DELETE_OLD_DAYS',
+            'DO_NOT_DELETE_LAST',
+            'DELETE_QUICKSAVES',
+            'DELETE_AUTOSAVES',
+            'DELETE_SAVES',
+            'KEEP_HOURLY',
+            'KEEP_DAILY',
+            'KEEP_WEEKLY'
+        )
+        settings = {
+            name: self.controller.app_settings.get_app_setting(
+                name,
+                category='BACKUP'
+            )
+            for name in names
+        }
+        settings.update(policy or {})
+        return settings
+
+    def _retention_query(self, policy=None):
+        """builds the WITH clause defining the candidates table, the
+        backups the retention policy prunes. Returns the WITH clause, to be
+        followed by a statement reading the candidates, and its parameters.
+
+        backups are pruned when they are older than the 'delete_old_days'
+        setting, are not flagged, are not one of the last backups of their
+        playthrough branch, are not the representative of a retention tier
+        and have a savetype that may be deleted. Backups of archived
+        playthroughs are never pruned
+
+        Args:
+            policy (dict): default None. backup settings to override
+        """
+        policy = self._retention_policy(policy)
+        ranks = []
+        keep = []
+        params = {
+            'old': "-{:d} days".format(int(policy['DELETE_OLD_DAYS'] or 0)),
+            'last': int(policy['DO_NOT_DELETE_LAST'] or 0)
+        }
+        for setting, unit, period in self.retention_tiers:
+            name = setting.lower()
+            ranks.append("""
+                    , row_number() OVER (
+                        PARTITION BY playthrough_id, branch, {}
+                        ORDER BY x4_save_time DESC
+                    ) AS {}_rank""".format(period, name))
+            keep.append("""
+                AND NOT ({0}_rank = 1 AND x4_save_time > unixepoch('now', :{0}))""".format(name))
+            # the weekly tier is configured in weeks
+            count = int(policy[setting] or 0) * (7 if setting == 'KEEP_WEEKLY' else 1)
+            params[name] = "-{:d} {}".format(count, unit)
+
+        query = """
+            WITH ranked AS (
+                SELECT
+                    file_hash
+                    , playthrough_id
+                    , x4_filename
+                    , x4_save_time
+                    , file_size
+                    , flag
+                    , row_number() OVER (
+                        PARTITION BY playthrough_id, branch
+                        ORDER BY x4_save_time DESC
+                    ) AS latest_rank{}
+                FROM backups
+                WHERE NOT "delete"
+            ), candidates AS (
+                SELECT * FROM ranked
+                WHERE
+                    x4_save_time <= unixepoch('now', :old)
+                    AND NOT flag
+                    AND latest_rank > :last{}
+        """.format(''.join(ranks), ''.join(keep))
+
+        if not policy['DELETE_QUICKSAVES']:
+            query += " AND x4_filename NOT LIKE 'quicksave%' "
+        if not policy['DELETE_AUTOSAVES']:
+            query += " AND x4_filename NOT LIKE 'autosave%' "
+        if not policy['DELETE_SAVES']:
+            query += " AND x4_filename NOT LIKE 'save%' "
+
+        return query + ")", params
+
+    def preview_retention(self, policy=None):
+        """a dry run of the retention policy, see _retention_query
+
+        Args:
+            policy (dict): default None. backup settings to override
+
+        Returns:
+            dict: count, the number of backups the policy would mark for
+                  deletion, bytes, their total size, and playthroughs,
+                  a list of dicts with the name, count and bytes of
+                  every playthrough
+        """
+        query, params = self._retention_query(policy)
+        query += """
+            SELECT p.name, count(*), total(c.file_size)
+            FROM candidates AS c
+            JOIN playthroughs AS p ON p.id = c.playthrough_id
+            GROUP BY p.name
+            ORDER BY total(c.file_size) DESC
+        """
+        preview = {
+            'count': 0,
+            'bytes': 0,
+            'playthroughs': []
+        }
+        try:
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            for name, count, size in cursor.execute(query, params):
+                preview['count'] += count
+                preview['bytes'] += int(size)
+                preview['playthroughs'].append({
+                    'name': name,
+                    'count': count,
+                    'bytes': int(size)
+                })
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return preview
+
+    def apply_retention(self, policy=None):
+        """marks the backups pruned by the retention policy for deletion,
+        in a single statement. see _retention_query
+
+        Args:
+            policy (dict): default None. backup settings to override
+
+        Returns:
+            int: the number of backups marked for deletion
+        """
+        query, params = self._retention_query(policy)
+        query += """
+            UPDATE backups SET "delete" = TRUE
+            WHERE file_hash IN (SELECT file_hash FROM candidates)
+        """
+        self._invalidate()
+        try:
+            # the cursor rowcount isn't set for statements starting with WITH
+            changes = self.connection.total_changes
+            with self.connection as c:
+                c.execute(query, params)
+            return self.connection.total_changes - changes
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return 0
+
+    def get_eviction_candidates(self):
+        """returns the backups the disk quota may evict, see
+        SaveManager.enforce_quota
+
+        these are the backups marked for deletion which may be deleted, by
+        the same rule as get_deletable_backups, and the backups that
+        aren't flagged, aren't the latest backup of their playthrough branch
+        and have a savetype that may be deleted. Backups without a recorded
+        size and backups of archived playthroughs are never evicted
+
+        Returns:
+            list: tuples of file_hash, backup_filename, file_size,
+                  x4_filename, x4_save_time and delete
+        """
+        policy = self._retention_policy()
+        query = """
+            SELECT file_hash, backup_filename, file_size,
+                x4_filename, x4_save_time, "delete"
+            FROM (
+                SELECT
+                    *
+                    , row_number() OVER (
+                        PARTITION BY playthrough_id, branch
+                        ORDER BY x4_save_time DESC
+                    ) AS latest_rank
+                FROM backups
+                WHERE NOT "delete"
+            )
+            WHERE latest_rank > 1
+                AND NOT flag
+                AND file_size IS NOT NULL
+        """
+        if not policy['DELETE_QUICKSAVES']:
+            query += " AND x4_filename NOT LIKE 'quicksave%' "
+        if not policy['DELETE_AUTOSAVES']:
+            query += " AND x4_filename NOT LIKE 'autosave%' "
+        if not policy['DELETE_SAVES']:
+            query += " AND x4_filename NOT LIKE 'save%' "
+        query += """
+            UNION ALL
+            SELECT file_hash, backup_filename, file_size,
+                x4_filename, x4_save_time, "delete"
+            FROM backups
+            WHERE "delete"
+                AND {}
+                AND file_size IS NOT NULL
+        """.format(self._deletable_clause())
+        try:
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            return cursor.execute(query).fetchall()
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return []
+
     def add_backup(
             self,
             playthrough_id,
@@ -834,7 +2140,10 @@ by assigning it to another playthrough""".format(
             flag = False,
             notes = '',
             delete = False,
-            branch = "1 - main"
+            branch = "1 - main",
+            file_size = None,
+            uncompressed_size = None,
+            stored_mtime = None
     ):
         """adds a new backups to the backups table
         
@@ -859,6 +2168,9 @@ by assigning it to another playthrough""".format(
             delete (bool): sets the delete flag (default: false)
             branch (str): sets the playthrough branch for this backup.
                           default: 1 - main
+            file_size (int): the size of the backup file in bytes
+            uncompressed_size (int): the uncompressed size of the save in bytes
+            stored_mtime (float): the modification time of the backup file
         """
         query = """
         INSERT INTO backups (
@@ -880,10 +2192,14 @@ by assigning it to another playthrough""".format(
             flag,
             notes,
             "delete",
-            branch
+            branch,
+            file_size,
+            uncompressed_size,
+            stored_mtime
         )
-        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
         """
+        self._invalidate()
         try:
             with self.connection as c:
                 c.execute(query,(
@@ -905,15 +2221,592 @@ by assigning it to another playthrough""".format(
                     flag,
                     notes,
                     delete,
-                    branch
+                    branch,
+                    file_size,
+                    uncompressed_size,
+                    stored_mtime
                 ))
                 c.commit()
         except sqlite3.Error as e:
             self.controller.show_error(e)
     
+    def add_backups(self, backups, journal=()):
+        """adds many backups to the backups table in a single transaction,
+        together with their import journal entries. Backups whose hash
+        already exists are skipped
+
+        Args:
+            backups (list): list of dicts with the add_backup arguments
+            journal (list): list of dicts with the keys backup_filename,
+                            file_size, stored_mtime and file_hash
+        """
+        query = """
+        INSERT OR IGNORE INTO backups (
+            playthrough_id,
+            x4_filename,
+            x4_save_time,
+            file_hash,
+            backup_time,
+            backup_filename,
+            backup_duration,
+            game_version,
+            original_game_version,
+            playtime,
+            x4_start_type,
+            character_name,
+            company_name,
+            money,
+            moded,
+            flag,
+            notes,
+            "delete",
+            branch,
+            file_size,
+            uncompressed_size,
+            stored_mtime
+        )
+        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+        """
+        journal_query = """
+        INSERT OR REPLACE INTO import_journal (
+            backup_filename,
+            file_size,
+            stored_mtime,
+            file_hash
+        )
+        VALUES (?,?,?,?)
+        """
+        self._invalidate()
+        try:
+            with self.connection as c:
+                c.executemany(query, [(
+                    backup['playthrough_id'],
+                    backup['x4_filename'],
+                    backup['x4_save_time'],
+                    backup['file_hash'],
+                    backup['backup_time'],
+                    backup['backup_filename'],
+                    backup.get('backup_duration'),
+                    backup['game_version'],
+                    backup['original_game_version'],
+                    backup['playtime'],
+                    backup['x4_start_type'],
+                    backup['character_name'],
+                    backup.get('company_name', ''),
+                    backup['money'],
+                    backup['moded'],
+                    backup.get('flag', False),
+                    backup.get('notes', ''),
+                    backup.get('delete', False),
+                    backup.get('branch', "1 - main"),
+                    backup.get('file_size'),
+                    backup.get('uncompressed_size'),
+                    backup.get('stored_mtime')
+                ) for backup in backups])
+                c.executemany(journal_query, [(
+                    entry['backup_filename'],
+                    entry['file_size'],
+                    entry['stored_mtime'],
+                    entry['file_hash']
+                ) for entry in journal])
+                c.commit()
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+    def get_backup_fingerprints(self):
+        """returns the size and modification time of every backup file
+        known to the database, by backup filename. Includes the files
+        recorded in the import journal by an unfinished import
+
+        Returns:
+            dict: {backup_filename: (file_size, stored_mtime)}
+        """
+        query = """
+            SELECT backup_filename, file_size, stored_mtime
+            FROM backups
+            WHERE file_size IS NOT NULL
+            UNION ALL
+            SELECT backup_filename, file_size, stored_mtime
+            FROM import_journal
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            return {
+                row[0]: (row[1], row[2])
+                for row in cursor.execute(query)
+            }
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return {}
+
+    def get_backup_files(self):
+        """returns the size, modification time and hash of every backup
+        file known to the database, including the archived backups
+
+        Returns:
+            dict: {backup_filename: (file_size, stored_mtime, file_hash)}
+        """
+        query = """
+            SELECT backup_filename, file_size, stored_mtime, file_hash
+            FROM {}
+        """
+        archives_query = """
+            SELECT id FROM playthroughs
+            WHERE archive IS NOT NULL
+        """
+        files = {}
+        try:
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            archived_ids = [row[0] for row in cursor.execute(archives_query)]
+            # the archives are attached one at a time, so they don't have
+            # to be attached all at once
+            for table in ['backups'] + archived_ids:
+                if table != 'backups':
+                    table = "{}.backups".format(self._attach(table))
+                for row in cursor.execute(query.format(table)):
+                    files[row[0]] = (row[1], row[2], row[3])
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return files
+
+    def set_backup_filename(self, hash, backup_filename):
+        """updates the backup filename of a specific backup, used when
+        a backup file was renamed outside of the application
+
+        Args:
+            hash (str): the hash of the backup to update
+            backup_filename (str): the new name of the backup file
+        """
+        query = """
+            UPDATE {} SET backup_filename = ?
+            WHERE file_hash = ?
+        """
+        self._invalidate()
+        with self.connection as c:
+            try:
+                c.execute(query.format(self._backup_table(hash)), (
+                    backup_filename,
+                    hash,
+                ))
+                c.commit()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+    def clear_import_journal(self):
+        """empties the import journal once an import has completed
+        """
+        query = """
+            DELETE FROM import_journal
+        """
+        self._invalidate()
+        try:
+            with self.connection as c:
+                c.execute(query)
+                c.commit()
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+    def get_backups_for_hashes(self, hashes):
+        """returns the backups with the given hashes together with the name
+        of their playthrough, in one query for the main database and one
+        for every archive holding some of them
+
+        Args:
+            hashes (list): the file hashes to look up
+
+        Returns:
+            dict: {file_hash: backup dict} for the hashes that are backed up
+        """
+        query = """
+            SELECT
+                b.file_hash
+                , p.name
+                , b.backup_filename
+                , b.x4_save_time
+                , b.playtime
+                , b.branch
+                , b.character_name
+                , b.money
+                , b.notes
+                , b.game_version
+            FROM {} AS b
+            JOIN main.playthroughs AS p ON p.id = b.playthrough_id
+            WHERE b.file_hash IN (SELECT value FROM json_each(?))
+        """
+        archives_query = """
+            SELECT DISTINCT playthrough_id FROM archived_backups
+            WHERE file_hash IN (SELECT value FROM json_each(?))
+        """
+        params = (json.dumps(list(hashes)), )
+        backups = {}
+        try:
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            archived_ids = [
+                row[0] for row in cursor.execute(archives_query, params)
+            ]
+            for table in ['main.backups'] + archived_ids:
+                if table != 'main.backups':
+                    table = "{}.backups".format(self._attach(table))
+                for row in cursor.execute(query.format(table), params):
+                    backups[row[0]] = {
+                        'playthrough': row[1],
+                        'backup_filename': row[2],
+                        'x4_save_time': ctime(row[3]),
+                        'playtime': row[4],
+                        'branch': row[5],
+                        'character_name': row[6],
+                        'money': float(row[7] if row[7] else 0),
+                        'notes': row[8],
+                        'game_version': row[9]
+                    }
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return backups
+
+    def get_save_fingerprints(self):
+        """returns the cached hashes and headers of the X4 saves
+
+        Returns:
+            dict: {file_path: (file_size, mtime, file_hash, header)}, header
+                  is None when the save hasn't been peeked at
+        """
+        query = """
+            SELECT
+                file_path
+                , file_size
+                , mtime
+                , file_hash
+                , save_time
+                , game_version
+                , gametime
+                , playername
+                , money
+            FROM save_fingerprints
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.row_factory = None
+            return {
+                row[0]: (row[1], row[2], row[3], None if row[4] is None else {
+                    'save_time': row[4],
+                    'game_version': row[5],
+                    'gametime': row[6],
+                    'playername': row[7],
+                    'money': row[8]
+                })
+                for row in cursor.execute(query)
+            }
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return {}
+
+    def set_save_fingerprints(self, fingerprints, current_paths=None):
+        """caches the hashes of X4 saves by their size and modification time
+
+        Args:
+            fingerprints (list): (file_path, file_size, mtime, file_hash) tuples
+            current_paths (list): default None. when given, the cached
+                                  saves that aren't in it are removed
+        """
+        query = """
+            INSERT OR REPLACE INTO save_fingerprints (
+                file_path, file_size, mtime, file_hash
+            )
+            VALUES (?,?,?,?)
+        """
+        prune_query = """
+            DELETE FROM save_fingerprints
+            WHERE file_path NOT IN (SELECT value FROM json_each(?))
+        """
+        self._invalidate()
+        try:
+            with self.connection as c:
+                c.executemany(query, fingerprints)
+                if current_paths is not None:
+                    c.execute(prune_query, (json.dumps(list(current_paths)), ))
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+    def add_session_log(self, session_start, entry):
+        """records a backup made by the backup thread in the session log,
+        so the session history shown by the StartPage can stay short
+
+        Args:
+            session_start (float): when the backup session started
+            entry (BackupEntry): the finished backup
+
+        Returns:
+            int: the id of the log entry, None on errors
+        """
+        query = """
+            INSERT INTO backup_session_log (
+                session_start, x4save, backup_filename, backup_timespan, evicted
+            )
+            VALUES (?,?,?,?,?)
+        """
+        self._invalidate()
+        try:
+            with self.connection as c:
+                return c.execute(query, (
+                    session_start,
+                    entry.x4save,
+                    entry.backup_filename,
+                    entry.backup_timespan,
+                    entry.evicted
+                )).lastrowid
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return None
+
+    def prune_session_log(self, session_start):
+        """deletes the log entries of the backup sessions that started
+        before this one, only the current session is ever read back
+
+        Args:
+            session_start (float): when the current backup session started
+        """
+        query = """
+            DELETE FROM backup_session_log
+            WHERE session_start < ?
+        """
+        self._invalidate()
+        try:
+            with self.connection as c:
+                c.execute(query, (session_start, ))
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+    def get_session_log(self, session_start, before_id=None, limit=200):
+        """returns the backups of a backup session, newest first
+
+        Args:
+            session_start (float): when the backup session started
+            before_id (int): default None. only returns the entries logged
+                             before this one
+            limit (int): default 200. the maximum number of entries
+
+        Returns:
+            list: the log entries as dicts
+        """
+        query = """
+            SELECT id, x4save, backup_filename, backup_timespan, evicted
+            FROM backup_session_log
+            WHERE session_start = ?
+                AND (? IS NULL OR id < ?)
+            ORDER BY id DESC
+            LIMIT ?
+        """
+        try:
+            return self._read(
+                query,
+                (session_start, before_id, before_id, limit),
+                lambda cursor, row: {
+                    'id': row[0],
+                    'x4save': row[1],
+                    'backup_filename': row[2],
+                    'backup_timespan': row[3],
+                    'evicted': row[4]
+                }
+            )
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+        return []
+
+    def set_save_headers(self, headers):
+        """caches the headers read from X4 saves next to their fingerprint.
+        A header is dropped with its fingerprint when the save changes
+
+        Args:
+            headers (list): (file_path, header) tuples, the header as
+                            returned by SaveManager.extract_backup_details
+        """
+        query = """
+            UPDATE save_fingerprints
+            SET
+                save_time = :save_time
+                , game_version = :game_version
+                , gametime = :gametime
+                , playername = :playername
+                , money = :money
+            WHERE file_path = :file_path
+        """
+        self._invalidate()
+        try:
+            with self.connection as c:
+                c.executemany(query, [
+                    dict(header, file_path=path) for path, header in headers
+                ])
+        except sqlite3.Error as e:
+            self.controller.show_error(e)
+
+    @staticmethod
+    def get_library_version(dbpath):
+        """returns the schema version of another x4SaveManager database,
+        read through a read-only connection so that the database is left
+        untouched. sqlite3 errors are raised to the caller
+
+        Args:
+            dbpath (str): the full path to the other database
+        """
+        connection = sqlite3.connect(
+            pathlib.Path(dbpath).resolve().as_uri() + "?mode=ro",
+            uri=True
+        )
+        try:
+            version, = connection.execute("PRAGMA user_version").fetchone()
+            return version
+        finally:
+            connection.close()
+
+    @staticmethod
+    def copy_library(dbpath, destination):
+        """copies another x4SaveManager database through a read-only
+        connection, to migrate the copy instead of the database itself.
+        sqlite3 errors are raised to the caller
+
+        Args:
+            dbpath (str): the full path to the other database
+            destination (str): the full path of the copy
+        """
+        source = sqlite3.connect(
+            pathlib.Path(dbpath).resolve().as_uri() + "?mode=ro",
+            uri=True
+        )
+        copy = sqlite3.connect(destination)
+        try:
+            source.backup(copy)
+        finally:
+            copy.close()
+            source.close()
+
+    def attach_library(self, dbpath):
+        """attaches another x4SaveManager database as the merge_source
+        schema, to merge its playthroughs and backups into this one.
+
+        Must be called outside of a transaction, sqlite3 errors are raised
+        to the caller
+
+        Args:
+            dbpath (str): the full path to the other database
+        """
+        self.connection.execute(
+            "ATTACH DATABASE ? AS merge_source",
+            (dbpath, )
+        )
+
+    def attach_library_archive(self, archive_path):
+        """attaches an archive database of the merge_source library as the
+        merge_archive schema, replacing the previously attached one
+
+        Args:
+            archive_path (str): the full path to the archive database
+        """
+        self.detach_library(archives_only=True)
+        self.connection.execute(
+            "ATTACH DATABASE ? AS merge_archive",
+            (archive_path, )
+        )
+
+    def detach_library(self, archives_only=False):
+        """detaches the merge_source library and its archive
+
+        Args:
+            archives_only (bool): default False. only detach the archive
+        """
+        cursor = self.connection.cursor()
+        cursor.row_factory = None
+        attached = [row[1] for row in cursor.execute("PRAGMA database_list")]
+        schemas = ['merge_archive'] if archives_only else ['merge_archive', 'merge_source']
+        for schema in schemas:
+            if schema in attached:
+                self.connection.execute("DETACH DATABASE {}".format(schema))
+
+    def get_library_archives(self):
+        """returns the archive filenames of the archived playthroughs of
+        the merge_source library
+        """
+        query = """
+            SELECT archive FROM merge_source.playthroughs
+            WHERE archive IS NOT NULL
+        """
+        cursor = self.connection.cursor()
+        cursor.row_factory = None
+        return [row[0] for row in cursor.execute(query)]
+
+    def merge_playthroughs(self):
+        """creates the playthroughs of the merge_source library which don't
+        exist in this library. Playthroughs are matched by name, so
+        playthroughs with the same name are merged
+
+        Returns:
+            int: the number of playthroughs created
+        """
+        query = """
+            INSERT INTO main.playthroughs (name, notes)
+            SELECT name, notes FROM merge_source.playthroughs
+            WHERE name NOT IN (SELECT name FROM main.playthroughs)
+            ORDER BY id
+        """
+        self._invalidate()
+        with self.connection as c:
+            return c.execute(query).rowcount
+
+    def get_merge_backups(self, schema='merge_source'):
+        """returns the backups of the merge_source library, or of its
+        attached archive, which are missing from this library, with
+        their playthrough ids remapped to this library's playthroughs.
+
+        sqlite3 errors are raised to the caller
+
+        Args:
+            schema (str): merge_source or merge_archive
+
+        Returns:
+            dict: total, the number of backups in the library, and backups,
+                  the missing backups as dicts of backups columns
+        """
+        count_query = """
+            SELECT count(*) FROM {}.backups
+        """.format(schema)
+        query = """
+            SELECT b.*, p.id AS merged_playthrough_id
+            FROM {}.backups AS b
+            JOIN merge_source.playthroughs AS source
+                ON source.id = b.playthrough_id
+            JOIN main.playthroughs AS p
+                ON p.name = source.name
+            WHERE NOT EXISTS (
+                SELECT 1 FROM main.backups AS m
+                WHERE m.file_hash = b.file_hash
+            )
+            AND NOT EXISTS (
+                SELECT 1 FROM main.archived_backups AS a
+                WHERE a.file_hash = b.file_hash
+            )
+            ORDER BY b.backup_time
+        """.format(schema)
+        cursor = self.connection.cursor()
+        cursor.row_factory = None
+        total, = cursor.execute(count_query).fetchone()
+        cursor.row_factory = sqlite3.Row
+        return {
+            'total': total,
+            'backups': [dict(row) for row in cursor.execute(query)]
+        }
+
     def migrations(self):
         """Creates the DB Schema on first load and for application updates
         """
+        self._invalidate()
         if self.version == 0:
             playthroughs_ddl = """
                 CREATE TABLE IF NOT EXISTS playthroughs (
@@ -990,5 +2883,546 @@ by assigning it to another playthrough""".format(
                     c.execute("PRAGMA user_version=3")
                     c.commit()
                 self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 3:
+            # full text search over the backup and playthrough notes.
+            # both are external content tables, so the text is not stored
+            # twice, and the triggers below keep the indexes in sync
+            backups_fts_ddl = """
+                CREATE VIRTUAL TABLE IF NOT EXISTS backups_fts USING fts5 (
+                    notes,
+                    branch,
+                    character_name,
+                    content='backups',
+                    content_rowid='rowid'
+                )
+            """
+            playthroughs_fts_ddl = """
+                CREATE VIRTUAL TABLE IF NOT EXISTS playthroughs_fts USING fts5 (
+                    notes,
+                    content='playthroughs',
+                    content_rowid='id'
+                )
+            """
+            triggers = [
+                """
+                CREATE TRIGGER IF NOT EXISTS backups_fts_insert
+                AFTER INSERT ON backups BEGIN
+                    INSERT INTO backups_fts (rowid, notes, branch, character_name)
+                    VALUES (new.rowid, new.notes, new.branch, new.character_name);
+                END
+                """,
+                """
+                CREATE TRIGGER IF NOT EXISTS backups_fts_delete
+                AFTER DELETE ON backups BEGIN
+                    INSERT INTO backups_fts (backups_fts, rowid, notes, branch, character_name)
+                    VALUES ('delete', old.rowid, old.notes, old.branch, old.character_name);
+                END
+                """,
+                """
+                CREATE TRIGGER IF NOT EXISTS backups_fts_update
+                AFTER UPDATE OF notes, branch, character_name ON backups BEGIN
+                    INSERT INTO backups_fts (backups_fts, rowid, notes, branch, character_name)
+                    VALUES ('delete', old.rowid, old.notes, old.branch, old.character_name);
+                    INSERT INTO backups_fts (rowid, notes, branch, character_name)
+                    VALUES (new.rowid, new.notes, new.branch, new.character_name);
+                END
+                """,
+                """
+                CREATE TRIGGER IF NOT EXISTS playthroughs_fts_insert
+                AFTER INSERT ON playthroughs BEGIN
+                    INSERT INTO playthroughs_fts (rowid, notes)
+                    VALUES (new.id, new.notes);
+                END
+                """,
+                """
+                CREATE TRIGGER IF NOT EXISTS playthroughs_fts_delete
+                AFTER DELETE ON playthroughs BEGIN
+                    INSERT INTO playthroughs_fts (playthroughs_fts, rowid, notes)
+                    VALUES ('delete', old.id, old.notes);
+                END
+                """,
+                """
+                CREATE TRIGGER IF NOT EXISTS playthroughs_fts_update
+                AFTER UPDATE OF notes ON playthroughs BEGIN
+                    INSERT INTO playthroughs_fts (playthroughs_fts, rowid, notes)
+                    VALUES ('delete', old.id, old.notes);
+                    INSERT INTO playthroughs_fts (rowid, notes)
+                    VALUES (new.id, new.notes);
+                END
+                """
+            ]
+            try:
+                with self.connection as c:
+                    c.execute(backups_fts_ddl)
+                    c.execute(playthroughs_fts_ddl)
+                    for trigger in triggers:
+                        c.execute(trigger)
+                    # index everything that already exists
+                    c.execute("INSERT INTO backups_fts (backups_fts) VALUES ('rebuild')")
+                    c.execute("INSERT INTO playthroughs_fts (playthroughs_fts) VALUES ('rebuild')")
+                    c.execute("PRAGMA user_version=4")
+                    c.commit()
+                self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 4:
+            # per playthrough and per branch summaries, maintained
+            # incrementally by triggers so the UI never has to aggregate
+            # over all the backups of a playthrough
+            stats_ddl = """
+                CREATE TABLE IF NOT EXISTS playthrough_stats (
+                    playthrough_id INTEGER PRIMARY KEY,
+                    backup_count INTEGER NOT NULL DEFAULT 0,
+                    latest_save_time TIMESTAMP,
+                    max_playtime NUMERIC,
+                    branch_count INTEGER NOT NULL DEFAULT 0
+                )
+            """
+            branches_ddl = """
+                CREATE TABLE IF NOT EXISTS playthrough_branches (
+                    playthrough_id INTEGER NOT NULL,
+                    branch TEXT NOT NULL,
+                    backup_count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (playthrough_id, branch)
+                ) WITHOUT ROWID
+            """
+            # used to recompute the latest save time and max playtime
+            # when the backup holding the current maximum goes away
+            indexes = [
+                """
+                CREATE INDEX IF NOT EXISTS backups_playthrough_save_time
+                ON backups (playthrough_id, x4_save_time)
+                """,
+                """
+                CREATE INDEX IF NOT EXISTS backups_playthrough_playtime
+                ON backups (playthrough_id, playtime)
+                """
+            ]
+            initial_stats = [
+                """
+                INSERT INTO playthrough_stats (
+                    playthrough_id,
+                    backup_count,
+                    latest_save_time,
+                    max_playtime
+                )
+                SELECT playthrough_id, count(*), max(x4_save_time), max(playtime)
+                FROM backups
+                GROUP BY playthrough_id
+                """,
+                """
+                INSERT INTO playthrough_branches (playthrough_id, branch, backup_count)
+                SELECT playthrough_id, coalesce(branch, ''), count(*)
+                FROM backups
+                GROUP BY playthrough_id, coalesce(branch, '')
+                """,
+                """
+                UPDATE playthrough_stats SET branch_count = (
+                    SELECT count(*) FROM playthrough_branches b
+                    WHERE b.playthrough_id = playthrough_stats.playthrough_id
+                )
+                """
+            ]
+            # statements to add the NEW row to the summaries
+            # and to remove the OLD row from the summaries
+            add_backup = """
+                INSERT INTO playthrough_stats (
+                    playthrough_id,
+                    backup_count,
+                    latest_save_time,
+                    max_playtime
+                )
+                VALUES (new.playthrough_id, 1, new.x4_save_time, new.playtime)
+                ON CONFLICT (playthrough_id) DO UPDATE SET
+                    backup_count = backup_count + 1,
+                    latest_save_time = CASE
+                        WHEN latest_save_time IS NULL
+                            OR excluded.latest_save_time > latest_save_time
+                        THEN excluded.latest_save_time
+                        ELSE latest_save_time END,
+                    max_playtime = CASE
+                        WHEN max_playtime IS NULL
+                            OR excluded.max_playtime > max_playtime
+                        THEN excluded.max_playtime
+                        ELSE max_playtime END;
+                INSERT INTO playthrough_branches (playthrough_id, branch, backup_count)
+                VALUES (new.playthrough_id, coalesce(new.branch, ''), 1)
+                ON CONFLICT (playthrough_id, branch) DO UPDATE SET
+                    backup_count = backup_count + 1;
+            """
+            remove_backup = """
+                UPDATE playthrough_stats SET
+                    backup_count = backup_count - 1,
+                    latest_save_time = CASE
+                        WHEN old.x4_save_time >= latest_save_time
+                        THEN (
+                            SELECT max(x4_save_time) FROM backups
+                            WHERE playthrough_id = old.playthrough_id
+                        )
+                        ELSE latest_save_time END,
+                    max_playtime = CASE
+                        WHEN old.playtime >= max_playtime
+                        THEN (
+                            SELECT max(playtime) FROM backups
+                            WHERE playthrough_id = old.playthrough_id
+                        )
+                        ELSE max_playtime END
+                WHERE playthrough_id = old.playthrough_id;
+                UPDATE playthrough_branches SET backup_count = backup_count - 1
+                WHERE playthrough_id = old.playthrough_id
+                    AND branch = coalesce(old.branch, '');
+                DELETE FROM playthrough_branches
+                WHERE playthrough_id = old.playthrough_id
+                    AND branch = coalesce(old.branch, '')
+                    AND backup_count <= 0;
+            """
+            triggers = [
+                """
+                CREATE TRIGGER IF NOT EXISTS playthrough_branches_insert
+                AFTER INSERT ON playthrough_branches BEGIN
+                    UPDATE playthrough_stats SET branch_count = branch_count + 1
+                    WHERE playthrough_id = new.playthrough_id;
+                END
+                """,
+                """
+                CREATE TRIGGER IF NOT EXISTS playthrough_branches_delete
+                AFTER DELETE ON playthrough_branches BEGIN
+                    UPDATE playthrough_stats SET branch_count = branch_count - 1
+                    WHERE playthrough_id = old.playthrough_id;
+                END
+                """,
+                """
+                CREATE TRIGGER IF NOT EXISTS backups_stats_insert
+                AFTER INSERT ON backups BEGIN
+                    {}
+                END
+                """.format(add_backup),
+                """
+                CREATE TRIGGER IF NOT EXISTS backups_stats_delete
+                AFTER DELETE ON backups BEGIN
+                    {}
+                END
+                """.format(remove_backup),
+                """
+                CREATE TRIGGER IF NOT EXISTS backups_stats_update
+                AFTER UPDATE OF playthrough_id, branch, x4_save_time, playtime
+                ON backups BEGIN
+                    {}
+                    {}
+                END
+                """.format(remove_backup, add_backup),
+                """
+                CREATE TRIGGER IF NOT EXISTS playthroughs_stats_delete
+                AFTER DELETE ON playthroughs BEGIN
+                    DELETE FROM playthrough_branches WHERE playthrough_id = old.id;
+                    DELETE FROM playthrough_stats WHERE playthrough_id = old.id;
+                END
+                """
+            ]
+            try:
+                with self.connection as c:
+                    c.execute(stats_ddl)
+                    c.execute(branches_ddl)
+                    for index in indexes:
+                        c.execute(index)
+                    for query in initial_stats:
+                        c.execute(query)
+                    for trigger in triggers:
+                        c.execute(trigger)
+                    c.execute("PRAGMA user_version=5")
+                    c.commit()
+                self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 5:
+            # storage metadata for each backup, so disk usage reports and
+            # size aware pruning never have to stat the backup files.
+            # existing rows are left NULL and filled by a backfill job
+            columns_ddl = [
+                """
+                ALTER TABLE backups
+                ADD COLUMN file_size INTEGER
+                """,
+                """
+                ALTER TABLE backups
+                ADD COLUMN uncompressed_size INTEGER
+                """,
+                """
+                ALTER TABLE backups
+                ADD COLUMN stored_mtime NUMERIC
+                """,
+                """
+                ALTER TABLE playthrough_stats
+                ADD COLUMN total_size INTEGER NOT NULL DEFAULT 0
+                """
+            ]
+            # the size totals are maintained by their own triggers. they
+            # upsert the stats row, so they don't depend on the order the
+            # stats triggers from the previous migration fire in
+            triggers = [
+                """
+                CREATE TRIGGER IF NOT EXISTS backups_size_insert
+                AFTER INSERT ON backups BEGIN
+                    INSERT INTO playthrough_stats (playthrough_id, total_size)
+                    VALUES (new.playthrough_id, coalesce(new.file_size, 0))
+                    ON CONFLICT (playthrough_id) DO UPDATE SET
+                        total_size = total_size + excluded.total_size;
+                END
+                """,
+                """
+                CREATE TRIGGER IF NOT EXISTS backups_size_delete
+                AFTER DELETE ON backups BEGIN
+                    UPDATE playthrough_stats
+                    SET total_size = total_size - coalesce(old.file_size, 0)
+                    WHERE playthrough_id = old.playthrough_id;
+                END
+                """,
+                """
+                CREATE TRIGGER IF NOT EXISTS backups_size_update
+                AFTER UPDATE OF playthrough_id, file_size ON backups BEGIN
+                    UPDATE playthrough_stats
+                    SET total_size = total_size - coalesce(old.file_size, 0)
+                    WHERE playthrough_id = old.playthrough_id;
+                    INSERT INTO playthrough_stats (playthrough_id, total_size)
+                    VALUES (new.playthrough_id, coalesce(new.file_size, 0))
+                    ON CONFLICT (playthrough_id) DO UPDATE SET
+                        total_size = total_size + excluded.total_size;
+                END
+                """
+            ]
+            # the backfill job looks for rows without a size
+            index = """
+                CREATE INDEX IF NOT EXISTS backups_missing_size
+                ON backups (file_hash) WHERE file_size IS NULL
+            """
+            try:
+                with self.connection as c:
+                    for ddl in columns_ddl:
+                        c.execute(ddl)
+                    for trigger in triggers:
+                        c.execute(trigger)
+                    c.execute(index)
+                    c.execute("PRAGMA user_version=6")
+                    c.commit()
+                self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 6:
+            # incremental auto vacuum lets idle maintenance give the free
+            # pages left by large deletions back in small steps. Changing
+            # the auto_vacuum mode of an existing database needs a VACUUM,
+            # which renumbers the backups rowids, so the full text index
+            # has to be rebuilt afterwards
+            try:
+                with self.connection as c:
+                    c.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                    c.execute("VACUUM")
+                    c.execute("INSERT INTO backups_fts (backups_fts) VALUES ('rebuild')")
+                    c.execute("PRAGMA user_version=7")
+                    c.commit()
+                self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 7:
+            # finished playthroughs can be archived into their own database
+            # file. archived_backups keeps the hashes of the archived backups
+            # in the main database, so hash lookups know which archive to
+            # attach without attaching them all
+            ddl = [
+                """
+                ALTER TABLE playthroughs
+                ADD COLUMN archive TEXT
+                """,
+                """
+                ALTER TABLE playthroughs
+                ADD COLUMN archived_size INTEGER
+                """,
+                """
+                CREATE TABLE IF NOT EXISTS archived_backups (
+                    file_hash TEXT PRIMARY KEY,
+                    playthrough_id INTEGER NOT NULL
+                ) WITHOUT ROWID
+                """,
+                """
+                CREATE INDEX IF NOT EXISTS archived_backups_playthrough
+                ON archived_backups (playthrough_id)
+                """
+            ]
+            try:
+                with self.connection as c:
+                    for query in ddl:
+                        c.execute(query)
+                    c.execute("PRAGMA user_version=8")
+                    c.commit()
+                self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 8:
+            # the files processed by an unfinished import, so an
+            # interrupted import can resume without reading them again
+            journal_ddl = """
+                CREATE TABLE IF NOT EXISTS import_journal (
+                    backup_filename TEXT PRIMARY KEY,
+                    file_size INTEGER,
+                    stored_mtime NUMERIC,
+                    file_hash TEXT
+                ) WITHOUT ROWID
+            """
+            try:
+                with self.connection as c:
+                    c.execute(journal_ddl)
+                    c.execute("PRAGMA user_version=9")
+                    c.commit()
+                self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 9:
+            # the retention window functions partition the backups which
+            # aren't marked for deletion by playthrough and branch
+            retention_index = """
+                CREATE INDEX IF NOT EXISTS backups_retention
+                ON backups (playthrough_id, branch, x4_save_time)
+                WHERE NOT "delete"
+            """
+            try:
+                with self.connection as c:
+                    c.execute(retention_index)
+                    c.execute("PRAGMA user_version=10")
+                    c.commit()
+                self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 10:
+            # the backups whose files are being deleted, so an interrupted
+            # deletion can be recovered
+            journal_ddl = """
+                CREATE TABLE IF NOT EXISTS delete_journal (
+                    file_hash TEXT PRIMARY KEY,
+                    backup_filename TEXT NOT NULL
+                ) WITHOUT ROWID
+            """
+            try:
+                with self.connection as c:
+                    c.execute(journal_ddl)
+                    c.execute("PRAGMA user_version=11")
+                    c.commit()
+                self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 11:
+            # the hashes of the X4 saves by their size and modification
+            # time, so unchanged saves don't have to be read again
+            fingerprints_ddl = """
+                CREATE TABLE IF NOT EXISTS save_fingerprints (
+                    file_path TEXT PRIMARY KEY,
+                    file_size INTEGER NOT NULL,
+                    mtime NUMERIC NOT NULL,
+                    file_hash TEXT NOT NULL
+                ) WITHOUT ROWID
+            """
+            try:
+                with self.connection as c:
+                    c.execute(fingerprints_ddl)
+                    c.execute("PRAGMA user_version=12")
+                    c.commit()
+                self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 12:
+            # the header of the X4 saves that aren't backed up, cached with
+            # their fingerprint so the inventory doesn't read them again
+            try:
+                with self.connection as c:
+                    for column in ('save_time', 'game_version', 'gametime', 'playername', 'money'):
+                        c.execute(
+                            "ALTER TABLE save_fingerprints ADD COLUMN {} TEXT".format(column)
+                        )
+                    c.execute("PRAGMA user_version=13")
+                    c.commit()
+                self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 13:
+            # the backups made by every backup session, the StartPage only
+            # keeps the latest ones and reads the others when asked to
+            log_ddl = """
+                CREATE TABLE IF NOT EXISTS backup_session_log (
+                    id INTEGER PRIMARY KEY,
+                    session_start NUMERIC NOT NULL,
+                    x4save TEXT,
+                    backup_filename TEXT,
+                    backup_timespan REAL,
+                    evicted INTEGER
+                )
+            """
+            log_index = """
+                CREATE INDEX IF NOT EXISTS backup_session_log_session
+                ON backup_session_log (session_start, id)
+            """
+            try:
+                with self.connection as c:
+                    c.execute(log_ddl)
+                    c.execute(log_index)
+                    c.execute("PRAGMA user_version=14")
+                    c.commit()
+                self.get_db_version()
+            except sqlite3.Error as e:
+                self.controller.show_error(e)
+
+        if self.version == 14:
+            # the filter bar reads the hashes of the backups that match its
+            # filters. backups_filter covers all the filtered columns, so
+            # filters which match most of a playthrough only read the index,
+            # the other indexes find the backups of the selective filters.
+            # flagged backups are rare so only they are indexed
+            filter_indexes = [
+                """
+                CREATE INDEX IF NOT EXISTS backups_filter
+                ON backups (
+                    playthrough_id,
+                    x4_filename,
+                    "delete",
+                    flag,
+                    game_version,
+                    character_name,
+                    playtime,
+                    branch,
+                    file_hash
+                )
+                """,
+                """
+                CREATE INDEX IF NOT EXISTS backups_playthrough_version
+                ON backups (playthrough_id, game_version)
+                """,
+                """
+                CREATE INDEX IF NOT EXISTS backups_playthrough_character
+                ON backups (playthrough_id, character_name)
+                """,
+                """
+                CREATE INDEX IF NOT EXISTS backups_flagged
+                ON backups (playthrough_id)
+                WHERE flag
+                """
+            ]
+            try:
+                with self.connection as c:
+                    for index in filter_indexes:
+                        c.execute(index)
+                    c.execute("PRAGMA user_version=15")
+                    c.commit()
+                self.get_db_version()
             except sqlite3.Error as e:
                 self.controller.show_error(e)
\ No newline at end of file
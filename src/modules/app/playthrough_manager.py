@@ -1,6 +1,7 @@
 """Holds the PlaythroughManager class
 
-PlaythroughManager is responsible for managing playthrough actions
+PlaythroughManager is responsible for managing playthrough actions.
+The actions which touch many backups run as jobs, see JobRunner
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
@@ -24,8 +25,10 @@ class PlaythroughManager():
         self.controller = controller
         self.backup_root = self.controller.app_settings.get_app_setting('BACKUPPATH')
 
-    def move_backups_to_index(self, backups, playthrough_id):
-        """moves backups to the specified playthrough
+    def move_backups_to_index(self, backups, playthrough_id, on_done=None,
+                              on_error=None):
+        """moves backups to the specified playthrough, as a job,
+        see move_backups_thread
         
         Args:
             backups (list): list of dictionaries in the form of:
@@ -34,28 +37,76 @@ class PlaythroughManager():
                             the specified hash and current filename
             playthrough_id (int): the id of the playthrough that the backup list
                                   will be associated with
-        """                
-        for back in backups:
-            try:
-                src = os.path.join(self.backup_root, back['filename'])
-                if os.path.exists(src):
-                    id=playthrough_id
-                    new_filename = re.sub("^id[0-9]*_", f"id{id}_", back['filename'])
-                    dst = os.path.join(self.backup_root, new_filename)
-                    os.rename(src, dst)
-                else:
-                    raise Exception("Backup File Doesn't Exist")
-                
-                self.controller.db.update_backup_playthrough(
-                    playthrough_id,
-                    new_filename,
-                    back['hash']
-                )
-            except Exception as e:
-                self.controller.show_error(e)
+            on_done (function): default None. called with the number of
+                                moved backups once the job is done
+            on_error (function): default None. called with the exception
+                                 when the job fails
+        """
+        def moved(summary):
+            if summary['errors']:
+                self.controller.show_error("\n".join(summary['errors'][:10]))
+            if on_done:
+                on_done(summary['moved'])
+
+        self.controller.jobs.submit(
+            "Move Backups",
+            self.move_backups_thread,
+            backups,
+            playthrough_id,
+            on_done=moved,
+            on_error=on_error,
+            show_progress=len(backups) > 1
+        )
+
+    def move_backups_thread(self, settings, cancel, progress, backups,
+                            playthrough_id):
+        """renames the backup files to the new playthrough id and
+        updates their database entries
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to stop moving the backups
+            progress (Queue): receives ('progress', (done, total, status))
+                              messages and a final ('finished', summary)
+            backups (list): see move_backups_to_index
+            playthrough_id (int): the id of the new playthrough
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        summary = {'moved': 0, 'errors': []}
+        try:
+            for done, back in enumerate(backups):
+                if cancel.is_set():
+                    break
+
+                progress.put(('progress', (done, len(backups), back['filename'])))
+                try:
+                    src = os.path.join(self.backup_root, back['filename'])
+                    if os.path.exists(src):
+                        id=playthrough_id
+                        new_filename = re.sub("^id[0-9]*_", f"id{id}_", back['filename'])
+                        dst = os.path.join(self.backup_root, new_filename)
+                        os.rename(src, dst)
+                    else:
+                        raise Exception("Backup File Doesn't Exist")
+
+                    db.update_backup_playthrough(
+                        playthrough_id,
+                        new_filename,
+                        back['hash']
+                    )
+                    summary['moved'] += 1
+                except Exception as e:
+                    summary['errors'].append("{}: {}".format(back['filename'], e))
+        finally:
+            db.connection.close()
+        progress.put(('finished', summary))
 
     def delete_playthrough(self):
-        """Deletes the currently selected playthrough
+        """Deletes the currently selected playthrough, as a job,
+        see delete_playthrough_thread
         """
         if self.controller.selected_playthrough:
             self.controller.show_question(
@@ -67,31 +118,195 @@ class PlaythroughManager():
             if not self.controller.check_modal():
                 return
 
-            backups = self.controller.db.get_backups_by_id(
-                self.controller.selected_playthrough["id"]
+            if self.controller.selected_playthrough.get("archived"):
+                self.release_archive(self.controller.selected_playthrough["id"])
+            self.controller.jobs.submit(
+                "Delete Playthrough",
+                self.delete_playthrough_thread,
+                dict(self.controller.selected_playthrough),
+                on_done=self.playthrough_deleted
             )
 
-            for backup in backups:
-                self.controller.db.backup_set_delete(
+    def delete_playthrough_thread(self, settings, cancel, progress,
+                                  playthrough):
+        """moves the backups of a playthrough to the __RECYCLE BIN__,
+        marked for deletion, and deletes the playthrough
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to stop before the playthrough is deleted
+            progress (Queue): receives ('progress', (done, total, status))
+                              messages and a final ('finished', result)
+            playthrough (dict): the playthrough to delete
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        result = {'playthrough': playthrough, 'deleted': False}
+        try:
+            # the backups are moved to the __RECYCLE BIN__, so they
+            # have to be back in the main database first
+            if playthrough.get("archived"):
+                db.unarchive_playthrough(playthrough["id"])
+
+            backups = db.get_backups_by_id(playthrough["id"])
+            for done, backup in enumerate(backups):
+                if cancel.is_set():
+                    break
+
+                progress.put(('progress', (done, len(backups), backup["backup_filename"])))
+                db.backup_set_delete(
                     backup["file_hash"],
                     move_playthrough = True
                 )
-
-            if self.controller.db.delete_playthrough_by_name(
-                self.controller.selected_playthrough["name"]
-            ):
-                self.controller.show_message(
-                    "Playthrough {} has been marked for deletion".format(
-                        self.controller.selected_playthrough["name"]
-                    )
-                )
-                self.controller.selected_playthrough = None
-                self.controller.startpage.refresh_playthroughs()
-                self.controller.startpage.playthroughs.selection_clear(0)
-                self.controller.statusbar.set_playthrough("None")
-                self.controller.top_menu.menu_backup.entryconfigure(
-                    'Start Backup',
-                    state='disabled'
+            else:
+                result['deleted'] = db.delete_playthrough_by_name(
+                    playthrough["name"]
                 )
-                self.controller.startpage.set_notes("")
+        finally:
+            db.connection.close()
+        progress.put(('finished', result))
+
+    def playthrough_deleted(self, result):
+        """callback once the delete playthrough job is done
+        """
+        playthrough = result['playthrough']
+        selected = self.controller.selected_playthrough
+        if selected and selected["id"] == playthrough["id"] and playthrough.get("archived"):
+            # a cancelled deletion leaves the backups unarchived
+            self.controller.selected_playthrough = dict(selected, archived=False)
+
+        if not result['deleted']:
+            self.controller.startpage.populate_tree()
+            return
+
+        self.controller.show_message(
+            "Playthrough {} has been marked for deletion".format(
+                playthrough["name"]
+            )
+        )
+        self.controller.startpage.refresh_playthroughs()
+        if selected and selected["id"] == playthrough["id"]:
+            self.controller.selected_playthrough = None
+            self.controller.startpage.playthroughs.selection_clear(0)
+            self.controller.statusbar.set_playthrough("None")
+            self.controller.top_menu.menu_backup.entryconfigure(
+                'Start Backup',
+                state='disabled'
+            )
+            self.controller.startpage.set_notes("")
+
+    def archive_playthrough(self):
+        """Archives the currently selected playthrough
+
+        the backups of the playthrough are moved to their own database file,
+        which keeps the main database small. The backup files themselves
+        are not moved
+        """
+        playthrough = self.controller.selected_playthrough
+        if not playthrough or playthrough.get("archived"):
+            return
+
+        self.controller.show_question(
+            """Are you sure you want to archive Playthrough:
+{}
+
+Archived backups are still listed and can be restored,
+but their notes are no longer included in searches.""".format(
+                playthrough["name"]
+            )
+        )
+        if not self.controller.check_modal():
+            return
+
+        self.release_archive(playthrough["id"])
+        self.controller.jobs.submit(
+            "Archive Playthrough",
+            self.archive_thread,
+            playthrough["id"],
+            True,
+            on_done=lambda archived: self.archive_done(playthrough, archived, True)
+        )
+
+    def unarchive_playthrough(self):
+        """Moves the backups of the currently selected, archived,
+        playthrough back into the main database
+        """
+        playthrough = self.controller.selected_playthrough
+        if not playthrough or not playthrough.get("archived"):
+            return
+
+        self.release_archive(playthrough["id"])
+        self.controller.jobs.submit(
+            "Unarchive Playthrough",
+            self.archive_thread,
+            playthrough["id"],
+            False,
+            on_done=lambda unarchived: self.archive_done(playthrough, unarchived, False)
+        )
+
+    def release_archive(self, playthrough_id):
+        """detaches the archive database of a playthrough from the
+        connections of the Tk main thread and the DB worker, as the
+        jobs move it on their own connection
+        """
+        self.controller.db.release_archive(playthrough_id)
+        self.controller.db_worker.submit('release_archive', playthrough_id)
+
+    def archive_thread(self, settings, cancel, progress, playthrough_id,
+                       archive):
+        """archives or unarchives the backups of a playthrough, see
+        Model.archive_playthrough
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set before the job starts to skip it
+            progress (Queue): receives a final ('finished', moved), True
+                              when the backups were moved
+            playthrough_id (int): the id of the playthrough
+            archive (bool): archives the playthrough when True,
+                            otherwise unarchives it
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        moved = False
+        try:
+            if not cancel.is_set():
+                if archive:
+                    moved = db.archive_playthrough(playthrough_id)
+                else:
+                    moved = db.unarchive_playthrough(playthrough_id)
+                if moved:
+                    db.after_large_mutation()
+        finally:
+            db.connection.close()
+        progress.put(('finished', moved))
 
+    def archive_done(self, playthrough, moved, archived):
+        """callback once the archive or unarchive job is done
+
+        Args:
+            playthrough (dict): the playthrough the job was started for
+            moved (bool): True when the backups were moved
+            archived (bool): True when the playthrough was archived
+        """
+        self.release_archive(playthrough["id"])
+        if not moved:
+            return
+
+        selected = self.controller.selected_playthrough
+        if selected and selected["id"] == playthrough["id"]:
+            self.controller.selected_playthrough = dict(
+                selected,
+                archived=archived
+            )
+            self.controller.startpage.populate_tree()
+        self.controller.show_message(
+            "Playthrough {} has been {}".format(
+                playthrough["name"],
+                'archived' if archived else 'unarchived'
+            )
+        )
@@ -14,7 +14,15 @@ import os
 import hashlib
 import datetime
 import shutil
-from time import sleep, perf_counter
+import tempfile
+from tkinter import filedialog
+import struct
+import heapq
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from time import perf_counter, monotonic
+from .formatter import Formatter
+from .backup_channel import BackupEntry
 
 if TYPE_CHECKING:
     from modules.gui import WindowController
@@ -22,6 +30,27 @@ if TYPE_CHECKING:
 class SaveManager():
     """SaveManager Class
     """
+    # how many backups the storage metadata backfill records per transaction
+    backfill_batch_size = 500
+    # the number of threads used to stat the backup files during the backfill
+    backfill_workers = 8
+    # the read size used when hashing files
+    hash_chunk_size = 1024 * 1024
+    # the import commits after this many files or seconds, whichever is first
+    import_batch_size = 100
+    import_batch_seconds = 1
+    # the inventory shows the hashed saves at least this often (seconds)
+    inventory_batch_seconds = 0.2
+    # the number of threads deleting backup files, kept low for network drives
+    delete_workers = 4
+    # how much evicting a backup of each savetype costs, manual saves are
+    # the most valuable. see eviction_cost
+    eviction_weights = {
+        'autosave': 1,
+        'quicksave': 2,
+        'save': 4
+    }
+
     def __init__(self, controller: WindowController):
         """Constructor
         Manages the backup save process
@@ -33,6 +62,8 @@ class SaveManager():
         self.backup_thread = None
         self.backup_in_progress = False
         self.cancel_backup = threading.Event()
+        self.import_job = None
+        self.delete_job = None
         self.temp_dir = os.path.join(
             self.controller.app_settings.get_app_setting(
                 'BACKUPPATH'
@@ -40,9 +71,14 @@ class SaveManager():
             'temp'
         )
 
-    def inventory_saves(self):
+    def list_saves(self):
+        """lists the X4 saves without reading them
+
+        Returns:
+            list: dicts with the name, path, size and mtime of every save
+        """
         x4_save_path = self.controller.app_settings.get_app_setting('X4SAVEPATH')
-        inventory = []
+        saves = []
         for file in os.scandir(x4_save_path):
             if (
                 not file.is_file() or 
@@ -50,20 +86,189 @@ class SaveManager():
                 'temp_save' in file.name
             ):
                 continue
-            
-            sha256 = hashlib.sha256()
-            with open(file.path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256.update(chunk)
-            hash = sha256.hexdigest()
-            
-            inventory.append({
-                'save_file': file,
-                'backup': self.controller.db.get_backup_by_hash(hash)
+
+            stat = file.stat()
+            saves.append({
+                'name': file.name,
+                'path': file.path,
+                'size': stat.st_size,
+                'mtime': stat.st_mtime
             })
-        return inventory
+        return saves
+
+    def start_inventory(self, saves, on_result, on_done):
+        """finds the backups of the X4 saves on a background thread,
+        see inventory_thread
+
+        Args:
+            saves (list): the saves returned by list_saves
+            on_result (function): called on the Tk main thread with
+                                  {file_path: (file_hash, backup, header, error)}
+                                  for every batch of resolved saves
+            on_done (function): called on the Tk main thread with the
+                                list of errors once all the saves are
+                                resolved
+
+        Returns:
+            Event: set it to cancel the inventory
+        """
+        return self.controller.jobs.submit(
+            "Find Backups of X4 Saves",
+            self.inventory_thread,
+            saves,
+            on_result=on_result,
+            on_done=on_done,
+            show_progress=False
+        ).cancel
+
+    def inventory_thread(self, settings, cancel, progress, saves):
+        """resolves the backups of the X4 saves, and reads the header of
+        the saves that aren't backed up.
+
+        saves whose size and modification time match the fingerprint
+        cache are resolved straight away, the others are hashed by a pool
+        of threads. The backups are looked up with one query per batch.
+        The headers are read by the same pool, stopping after the info
+        element, and are cached with the fingerprints. The saves which
+        can't be hashed or whose header can't be read are resolved with
+        the error
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to cancel the inventory
+            progress (Queue): receives ('result', {file_path: (file_hash, backup, header, error)})
+                              messages and a final ('finished', errors)
+            saves (list): the saves returned by list_saves
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        fingerprints = []
+        headers = []
+        errors = []
+
+        def collect(futures, handle, failed):
+            """hands the finished futures to handle, or to failed with the
+            exception when they raised, and sends the results they return
+            in batches
+            """
+            results = {}
+            sent = monotonic()
+            for future in as_completed(futures):
+                if cancel.is_set():
+                    for f in futures:
+                        f.cancel()
+                    break
+
+                try:
+                    results.update(handle(futures[future], future.result()))
+                except Exception as e:
+                    results.update(failed(futures[future], e))
+                if (
+                    len(results) >= self.import_batch_size or
+                    monotonic() - sent >= self.inventory_batch_seconds
+                ):
+                    progress.put(('result', results))
+                    results = {}
+                    sent = monotonic()
+            if results:
+                progress.put(('result', results))
+
+        try:
+            cache = db.get_save_fingerprints()
+            with ThreadPoolExecutor(max_workers=self.backfill_workers) as pool:
+                cached = {}
+                cached_headers = {}
+                to_hash = []
+                for save in saves:
+                    fingerprint = cache.get(save['path'])
+                    if fingerprint and fingerprint[:2] == (save['size'], save['mtime']):
+                        cached[save['path']] = fingerprint[2]
+                        cached_headers[save['path']] = fingerprint[3]
+                    else:
+                        to_hash.append(save)
+
+                peeks = {}
+
+                def resolve(hashes):
+                    """looks up the backups of hashed saves, and queues
+                    the saves without a backup or cached header for peeking
+                    """
+                    backups = db.get_backups_for_hashes(hashes.values())
+                    results = {}
+                    for path, hash in hashes.items():
+                        backup = backups.get(hash)
+                        header = None
+                        if not backup:
+                            header = cached_headers.get(path)
+                            if not header:
+                                peeks[pool.submit(self.extract_backup_details, path)] = (path, hash)
+                        results[path] = (hash, backup, header, None)
+                    return results
+
+                if cached:
+                    progress.put(('result', resolve(cached)))
+
+                def hashed(save, hash):
+                    if hash is None:
+                        # compute_file_hash returns None for missing files
+                        raise FileNotFoundError("the save no longer exists")
+                    fingerprints.append((
+                        save['path'],
+                        save['size'],
+                        save['mtime'],
+                        hash
+                    ))
+                    return resolve({save['path']: hash})
+
+                def peeked(save, header):
+                    path, hash = save
+                    headers.append((path, header))
+                    return {path: (hash, None, header, None)}
+
+                def hash_failed(save, error):
+                    errors.append("{}: {}".format(os.path.basename(save['path']), error))
+                    return {save['path']: (None, None, None, str(error))}
+
+                def peek_failed(save, error):
+                    path, hash = save
+                    errors.append("{}: {}".format(os.path.basename(path), error))
+                    return {path: (hash, None, None, str(error))}
+
+                collect(
+                    {
+                        pool.submit(self.compute_file_hash, save['path']): save
+                        for save in to_hash
+                    },
+                    hashed,
+                    hash_failed
+                )
+                collect(peeks, peeked, peek_failed)
+
+            db.set_save_fingerprints(
+                fingerprints,
+                current_paths=[save['path'] for save in saves]
+            )
+            db.set_save_headers(headers)
+        finally:
+            db.connection.close()
+            progress.put(('finished', errors))
     
     def import_backups(self):
+        """imports and re-indexes the backups found in the backup folder
+
+        the import runs as a job, with the backup files read by a pool
+        of worker processes, and shows its progress in a progress window
+        which can cancel it. Backups already in the database are
+        skipped by their size and modification time, and every imported
+        file is recorded in the import journal, so a cancelled or
+        interrupted import resumes where it stopped
+        """
+        if self.import_job and not self.import_job.finished:
+            self.import_job.focus()
+            return
+
         message = """Are you sure you want to start the import process?
 
 Note: this may take some time to re-import and re-index all previous backups
@@ -74,187 +279,1289 @@ Note: this may take some time to re-import and re-index all previous backups
         if not self.controller.check_modal():
             return
         
-        self.controller.set_cursor(type='wait')
-        self.controller.event_generate("<<ImportingBackups>>")
-        self.controller.update()
         backup_root = self.controller.app_settings.get_app_setting('BACKUPPATH')
-
-        playthroughs_deleted = False
-
         if not os.path.exists(backup_root):
             self.controller.show_error('Cannot Find backup folder. Please check your settings')
             return
-        
-        for file in os.scandir(backup_root):
-            if '.xml.gz' not in file.name:
-                continue
-            
-            timer_start = perf_counter()
-            now = datetime.datetime.now()
 
-            hash = self.compute_file_hash(file.path)
+        self.controller.event_generate("<<ImportingBackups>>")
+        self.import_job = self.controller.jobs.submit(
+            "Import Backups",
+            self.import_backups_thread,
+            on_done=self.import_done
+        )
 
-            # test to see if the backup already exists and skip if it exists
-            if self.controller.db.get_backup_by_hash(hash):
-                continue
+    def import_done(self, summary):
+        """shows the import summary once the import job is done
+        """
+        self.controller.event_generate("<<BackupIdle>>")
+        self.controller.startpage.populate_tree()
 
-            id = file.name.split('_')[0].replace('id', '')
+        message = "import {}: {} of {} backup files processed, {} backups imported".format(
+            'cancelled' if summary['cancelled'] else 'complete',
+            summary['done'],
+            summary['total'],
+            summary['imported']
+        )
+        if summary['cancelled']:
+            message += "\n\nRun the import again to resume it"
+        if summary['errors']:
+            message += "\n\n{} backup files could not be read:\n{}".format(
+                len(summary['errors']),
+                "\n".join(summary['errors'][:10])
+            )
+        if summary['orphaned']:
+            message += """
 
+Note: Some backups did not have a matching playthrough
+      These backups have had their delete flag set,
+      please verify the items in the __RECYCLE BIN__
+"""
+        self.controller.show_message(message)
+
+    def import_backups_thread(self, settings, cancel, progress):
+        """the import process, which is handed to a dedicated thread
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to cancel the import
+            progress (Queue): receives ('progress', (done, total, status))
+                              messages and a final ('finished', summary)
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        backup_root = settings["APP"]["BACKUPPATH"]
+        summary = {
+            'done': 0,
+            'total': 0,
+            'imported': 0,
+            'orphaned': 0,
+            'errors': [],
+            'cancelled': False
+        }
+
+        try:
+            # files whose size and modification time match a backup or an
+            # import journal entry are already indexed, and aren't read again
+            known = db.get_backup_fingerprints()
+            pending = []
+            for file in os.scandir(backup_root):
+                if not file.is_file() or '.xml.gz' not in file.name:
+                    continue
+
+                summary['total'] += 1
+                stat = file.stat()
+                if known.get(file.name) == (stat.st_size, stat.st_mtime):
+                    summary['done'] += 1
+                    continue
+                pending.append(file.path)
+
+            progress.put(('progress', (
+                summary['done'],
+                summary['total'],
+                "Reading backup files"
+            )))
+
+            playthrough_ids = {
+                str(playthrough['id']) for playthrough in db.get_playthroughs()
+            }
+            seen = set()
+            backups = []
+            journal = []
+            last_commit = monotonic()
+            with ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn')
+            ) as pool:
+                futures = [
+                    pool.submit(SaveManager.read_backup_file, path)
+                    for path in pending
+                ]
+                for future in as_completed(futures):
+                    if cancel.is_set():
+                        summary['cancelled'] = True
+                        for f in futures:
+                            f.cancel()
+                        break
+
+                    summary['done'] += 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        summary['errors'].append(str(e))
+                        continue
+
+                    filename = os.path.basename(result['file_path'])
+                    file_hash = result['file_hash']
+                    journal.append({
+                        'backup_filename': filename,
+                        'file_size': result['storage']['file_size'],
+                        'stored_mtime': result['storage']['stored_mtime'],
+                        'file_hash': file_hash
+                    })
+
+                    if file_hash not in seen and not db.check_backup_exists(file_hash):
+                        seen.add(file_hash)
+                        backups.append(self._imported_backup(
+                            filename,
+                            result,
+                            playthrough_ids
+                        ))
+                        if backups[-1]['delete']:
+                            summary['orphaned'] += 1
+
+                    if (
+                        len(journal) >= self.import_batch_size or
+                        monotonic() - last_commit >= self.import_batch_seconds
+                    ):
+                        db.add_backups(backups, journal)
+                        summary['imported'] += len(backups)
+                        backups = []
+                        journal = []
+                        last_commit = monotonic()
+
+                    progress.put(('progress', (
+                        summary['done'],
+                        summary['total'],
+                        filename
+                    )))
+
+            db.add_backups(backups, journal)
+            summary['imported'] += len(backups)
+
+            # a complete import leaves nothing to resume
+            if not summary['cancelled']:
+                db.clear_import_journal()
+            db.after_large_mutation()
+        except Exception as e:
+            summary['errors'].append(str(e))
+        finally:
+            db.connection.close()
+            progress.put(('finished', summary))
+
+    def _imported_backup(self, filename, result, playthrough_ids):
+        """builds the backups row for an imported backup file
+
+        Args:
+            filename (str): the backup filename
+            result (dict): the result of read_backup_file
+            playthrough_ids (set): the ids of the existing playthroughs
+        """
+        details = result['details']
+        storage = result['storage']
+        id = filename.split('_')[0].replace('id', '')
+
+        return {
+            'playthrough_id': id,
+            'x4_filename': 'unknown - imported',
+            'x4_save_time': details['save_time'],
+            'file_hash': result['file_hash'],
+            'backup_time': datetime.datetime.now().timestamp(),
+            'backup_filename': filename,
+            'backup_duration': result['duration'],
+            'game_version': details['game_version'],
+            'original_game_version': details['original_version'],
+            'playtime': details['gametime'],
+            'x4_start_type': details['start_type'],
+            'character_name': details['playername'],
+            'money': details['money'],
+            'moded': details['modified'],
             # if the playthrough ID exists don't set the delete flag
             # if not, then set the delete flag and let the user move them
+            'delete': id not in playthrough_ids,
+            'file_size': storage['file_size'],
+            'uncompressed_size': storage['uncompressed_size'],
+            'stored_mtime': storage['stored_mtime']
+        }
 
-            if self.controller.db.get_playthrough_by_id(id):
-                deleted_flag = False
-            else:
-                deleted_flag = True
-                playthroughs_deleted = True
+    def start_reconcile(self, on_progress, on_done):
+        """compares the backup folder with the database on a background
+        thread, see reconcile_thread
+
+        Returns:
+            Event: set it to cancel the reconciliation
+        """
+        return self.controller.jobs.submit(
+            "Reconcile Backups",
+            self.reconcile_thread,
+            on_progress=on_progress,
+            on_done=on_done,
+            show_progress=False
+        ).cancel
+
+    def reconcile_thread(self, settings, cancel, progress):
+        """compares the backup folder with the database.
+
+        The directory listing is compared with the backup filenames in the
+        database using set operations. Files known to the database whose
+        size and modification time still match are not read at all, only
+        unknown files and files that changed are hashed, which is what
+        tells renamed files apart from orphan files.
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to cancel the reconciliation
+            progress (Queue): receives ('progress', (done, total, status))
+                              messages and a final ('finished', report)
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        backup_root = settings["APP"]["BACKUPPATH"]
+        timer_start = perf_counter()
+        report = {
+            'files': 0,
+            'backups': 0,
+            'ok': 0,
+            'orphans': [],
+            'missing': [],
+            'renamed': [],
+            'modified': [],
+            'duplicates': [],
+            'errors': [],
+            'cancelled': False,
+            'seconds': 0
+        }
+
+        try:
+            disk = {}
+            for file in os.scandir(backup_root):
+                if file.is_file() and '.xml.gz' in file.name:
+                    stat = file.stat()
+                    disk[file.name] = (stat.st_size, stat.st_mtime)
+            known = db.get_backup_files()
+            report['files'] = len(disk)
+            report['backups'] = len(known)
+
+            unknown = disk.keys() - known.keys()
+            missing = known.keys() - disk.keys()
+            # backups without a recorded size can't be compared,
+            # and are trusted until the storage backfill covers them
+            changed = {
+                name for name in disk.keys() & known.keys()
+                if known[name][0] is not None and known[name][:2] != disk[name]
+            }
+            report['ok'] = len(disk) - len(unknown) - len(changed)
+
+            missing_by_hash = {known[name][2]: name for name in missing}
+            to_hash = sorted(unknown) + sorted(changed)
+            touched = []
+            progress.put(('progress', (0, len(to_hash), "Hashing unknown files")))
+
+            with ThreadPoolExecutor(max_workers=self.backfill_workers) as pool:
+                futures = {
+                    pool.submit(
+                        self.compute_file_hash,
+                        os.path.join(backup_root, name)
+                    ): name for name in to_hash
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    if cancel.is_set():
+                        report['cancelled'] = True
+                        for f in futures:
+                            f.cancel()
+                        break
+
+                    name = futures[future]
+                    try:
+                        file_hash = future.result()
+                    except Exception as e:
+                        report['errors'].append("{}: {}".format(name, e))
+                        continue
+
+                    if name in changed:
+                        if file_hash == known[name][2]:
+                            # only the modification time changed
+                            report['ok'] += 1
+                            touched.append(name)
+                        else:
+                            report['modified'].append(name)
+                    elif file_hash in missing_by_hash:
+                        old_name = missing_by_hash.pop(file_hash)
+                        missing.discard(old_name)
+                        report['renamed'].append({
+                            'old_filename': old_name,
+                            'backup_filename': name,
+                            'file_hash': file_hash
+                        })
+                    elif db.check_backup_exists(file_hash):
+                        report['duplicates'].append(name)
+                    else:
+                        report['orphans'].append(name)
+
+                    progress.put(('progress', (done, len(to_hash), name)))
+
+            report['missing'] = [
+                {'backup_filename': name, 'file_hash': known[name][2]}
+                for name in sorted(missing)
+            ]
+
+            # record the new modification times, so the next
+            # reconciliation doesn't hash these files again
+            storage = []
+            for name in touched:
+                metadata = self.get_storage_metadata(os.path.join(backup_root, name))
+                metadata['file_hash'] = known[name][2]
+                storage.append(metadata)
+            if storage:
+                db.update_storage_metadata(storage)
+        except Exception as e:
+            report['errors'].append(str(e))
+        finally:
+            db.connection.close()
+            report['seconds'] = perf_counter() - timer_start
+            progress.put(('finished', report))
+
+    def start_save_scan(self, on_progress, on_done):
+        """reads all the X4 saves on a background thread and proposes
+        playthroughs for them, see scan_saves_thread
+
+        Returns:
+            Event: set it to cancel the scan
+        """
+        return self.controller.jobs.submit(
+            "Scan X4 Saves",
+            self.scan_saves_thread,
+            on_progress=on_progress,
+            on_done=on_done,
+            show_progress=False
+        ).cancel
 
-            details = self.extract_backup_details(
-                backup_fullpath=file.path
+    def scan_saves_thread(self, settings, cancel, progress):
+        """reads the header of every X4 save that hasn't been backed up
+        yet, in a pool of worker processes, and groups them into proposed
+        playthroughs by character name, start type and original game version
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to cancel the scan
+            progress (Queue): receives ('progress', (done, total, status))
+                              messages and a final ('finished', report)
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        x4_save_path = settings["APP"]["X4SAVEPATH"]
+        report = {
+            'groups': [],
+            'backed_up': 0,
+            'errors': [],
+            'cancelled': False
+        }
+
+        try:
+            paths = [
+                file.path for file in os.scandir(x4_save_path)
+                if file.is_file()
+                    and 'xml.gz' in file.name
+                    and 'temp_save' not in file.name
+            ]
+            progress.put(('progress', (0, len(paths), "Reading X4 saves")))
+
+            groups = {}
+            with ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn')
+            ) as pool:
+                futures = [
+                    pool.submit(SaveManager.read_backup_file, path)
+                    for path in paths
+                ]
+                for done, future in enumerate(as_completed(futures), start=1):
+                    if cancel.is_set():
+                        report['cancelled'] = True
+                        for f in futures:
+                            f.cancel()
+                        break
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        report['errors'].append(str(e))
+                        continue
+
+                    if db.check_backup_exists(result['file_hash']):
+                        report['backed_up'] += 1
+                    else:
+                        details = result['details']
+                        groups.setdefault((
+                            details['playername'],
+                            details['start_type'],
+                            details['original_version']
+                        ), []).append(result)
+
+                    progress.put(('progress', (
+                        done,
+                        len(paths),
+                        os.path.basename(result['file_path'])
+                    )))
+
+            names = [
+                "{} - {}".format(key[0] or 'Unknown', key[1] or 'Unknown')
+                for key in groups
+            ]
+            for name, (key, saves) in zip(names, groups.items()):
+                # the same character and start with another original
+                # game version is a different playthrough
+                if names.count(name) > 1:
+                    name = "{} - {}".format(name, key[2])
+                report['groups'].append({
+                    'name': name,
+                    'character_name': key[0],
+                    'x4_start_type': key[1],
+                    'original_game_version': key[2],
+                    'saves': sorted(
+                        saves,
+                        key=lambda save: save['details']['save_time']
+                    )
+                })
+        except Exception as e:
+            report['errors'].append(str(e))
+        finally:
+            db.connection.close()
+            progress.put(('finished', report))
+
+    def start_ingest(self, groups, on_progress, on_done):
+        """backs up the saves of the confirmed playthrough groups on a
+        background thread, see ingest_thread
+
+        Returns:
+            Event: set it to cancel the ingest
+        """
+        return self.controller.jobs.submit(
+            "Ingest X4 Saves",
+            self.ingest_thread,
+            groups,
+            on_progress=on_progress,
+            on_done=on_done,
+            show_progress=False
+        ).cancel
+
+    def ingest_thread(self, settings, cancel, progress, groups):
+        """creates the playthroughs of the confirmed groups, or uses the
+        existing playthroughs with the same name, and backs up their saves.
+
+        the saves are copied in parallel, verified against the hash read
+        by the scan, and committed in batches. When cancelled, the copies
+        already running are still committed
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to cancel the ingest
+            progress (Queue): receives ('progress', (done, total, status))
+                              messages and a final ('finished', summary)
+            groups (list): the groups proposed by scan_saves_thread
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        backup_path = settings["APP"]["BACKUPPATH"]
+        summary = {
+            'playthroughs': 0,
+            'ingested': 0,
+            'total': sum(len(group['saves']) for group in groups),
+            'errors': [],
+            'cancelled': False
+        }
+        used_names = set()
+        done = 0
+
+        try:
+            for group in groups:
+                if cancel.is_set():
+                    summary['cancelled'] = True
+                    break
+
+                playthrough = db.get_playthrough_by_name(group['name'])
+                if not playthrough:
+                    db.save_playthrough(group['name'])
+                    playthrough = db.get_playthrough_by_name(group['name'])
+                    summary['playthroughs'] += 1
+
+                backups = []
+                with ThreadPoolExecutor(max_workers=self.backfill_workers) as pool:
+                    futures = {}
+                    for save in group['saves']:
+                        mtime = (
+                            save['storage']['stored_mtime'] or
+                            datetime.datetime.now().timestamp()
+                        )
+                        backup_filename = self._unique_backup_filename(
+                            backup_path,
+                            playthrough['id'],
+                            datetime.datetime.fromtimestamp(mtime).strftime(
+                                "%Y%m%d-%H%M%S"
+                            ),
+                            used_names
+                        )
+                        futures[pool.submit(
+                            self._copy_backup,
+                            save['file_path'],
+                            os.path.join(backup_path, backup_filename),
+                            save['file_hash']
+                        )] = (save, backup_filename)
+
+                    for future in as_completed(futures):
+                        if cancel.is_set() and not summary['cancelled']:
+                            # drop the queued copies, the running ones land
+                            # in the backup folder and are committed below
+                            summary['cancelled'] = True
+                            for f in futures:
+                                f.cancel()
+                        if future.cancelled():
+                            continue
+
+                        done += 1
+                        save, backup_filename = futures[future]
+                        try:
+                            duration = future.result()
+                        except Exception as e:
+                            summary['errors'].append("{}: {}".format(
+                                os.path.basename(save['file_path']),
+                                e
+                            ))
+                            continue
+
+                        backups.append(self._ingested_backup(
+                            playthrough['id'],
+                            save,
+                            backup_path,
+                            backup_filename,
+                            duration
+                        ))
+                        if len(backups) >= self.import_batch_size:
+                            db.add_backups(backups)
+                            summary['ingested'] += len(backups)
+                            backups = []
+
+                        progress.put(('progress', (
+                            done,
+                            summary['total'],
+                            group['name']
+                        )))
+
+                db.add_backups(backups)
+                summary['ingested'] += len(backups)
+
+            db.after_large_mutation()
+        except Exception as e:
+            summary['errors'].append(str(e))
+        finally:
+            db.connection.close()
+            progress.put(('finished', summary))
+
+    def _unique_backup_filename(self, backup_path, playthrough_id, stamp,
+                                used_names):
+        """returns an unused backup filename for a playthrough
+
+        Args:
+            backup_path (str): the backup folder
+            playthrough_id (int): the playthrough of the backup
+            stamp (str): the rest of the name, usually the backup time
+            used_names (set): the names already handed out, updated
+        """
+        name = "id{}_{}".format(playthrough_id, stamp)
+        backup_filename = "{}.xml.gz".format(name)
+        count = 0
+        while (
+            backup_filename in used_names or
+            os.path.exists(os.path.join(backup_path, backup_filename))
+        ):
+            count += 1
+            backup_filename = "{}-{}.xml.gz".format(name, count)
+
+        used_names.add(backup_filename)
+        return backup_filename
+
+    @staticmethod
+    def _copy_backup(source, destination, file_hash):
+        """copies a save to the backup folder, hashing it in the same pass.
+        The copy is removed when the save was overwritten since it was
+        scanned, as its header would no longer match the scanned details
+
+        Returns:
+            float: how long the copy took
+        """
+        timer_start = perf_counter()
+        try:
+            SaveManager._copy_verified(source, destination, file_hash)
+        except ValueError:
+            raise ValueError("the save changed since the scan, scan the saves again")
+
+        return perf_counter() - timer_start
+
+    def _ingested_backup(self, playthrough_id, save, backup_path,
+                         backup_filename, duration):
+        """builds the backups row for an ingested save
+
+        Args:
+            playthrough_id (int): the playthrough of the save
+            save (dict): the result of read_backup_file for the save
+            backup_path (str): the backup folder
+            backup_filename (str): the name of the backup file
+            duration (float): how long the copy took
+        """
+        details = save['details']
+        storage = save['storage']
+
+        return {
+            'playthrough_id': playthrough_id,
+            'x4_filename': os.path.basename(save['file_path']),
+            'x4_save_time': details['save_time'],
+            'file_hash': save['file_hash'],
+            'backup_time': datetime.datetime.now().timestamp(),
+            'backup_filename': backup_filename,
+            'backup_duration': save['duration'] + duration,
+            'game_version': details['game_version'],
+            'original_game_version': details['original_version'],
+            'playtime': details['gametime'],
+            'x4_start_type': details['start_type'],
+            'character_name': details['playername'],
+            'money': details['money'],
+            'moded': details['modified'],
+            'file_size': storage['file_size'],
+            'uncompressed_size': storage['uncompressed_size'],
+            'stored_mtime': os.path.getmtime(
+                os.path.join(backup_path, backup_filename)
             )
+        }
+
+    def merge_library(self):
+        """merges the playthroughs and backups of another x4SaveManager
+        library, from another PC for example, into this one
+
+        the merge runs as a job and shows its progress in a progress
+        window which can cancel it, see merge_library_thread
+        """
+        dbpath = filedialog.askopenfilename(
+            parent=self.controller,
+            title="Select the x4SaveManager database to merge",
+            filetypes=(("SQLite Database", "*.db"), ("All Files", "*.*"))
+        )
+        if not dbpath:
+            return
+
+        if os.path.realpath(dbpath) == os.path.realpath(
+            self.controller.app_settings.get_app_setting('DBPATH')
+        ):
+            self.controller.show_error("Cannot merge the library with itself")
+            return
+
+        backup_path = filedialog.askdirectory(
+            parent=self.controller,
+            title="Select the backup folder of the library to merge",
+            initialdir=os.path.dirname(dbpath)
+        )
+        if not backup_path:
+            return
+
+        message = """Are you sure you want to merge this library?
+
+Database: {}
+Backups: {}
+
+Playthroughs with the same name are merged, and only the backups
+which are missing from this library are copied
+""".format(dbpath, backup_path)
+        self.controller.show_question(message)
+        if not self.controller.check_modal():
+            return
 
-            timer_stop = perf_counter()
-            backup_timespan = timer_stop - timer_start
-
-            self.controller.db.add_backup(
-                playthrough_id = id,
-                x4_filename = 'unknown - imported',
-                x4_save_time = details['save_time'],
-                file_hash = hash,
-                backup_time = now.timestamp(),
-                backup_filename = file.name,
-                backup_duration = backup_timespan,
-                game_version = details['game_version'],
-                original_game_version = details['original_version'],
-                playtime = details['gametime'],
-                x4_start_type = details['start_type'],
-                character_name = details['playername'],
-                money = details['money'],
-                moded = details['modified'],
-                delete = deleted_flag
+        def merge_done(summary):
+            self.controller.startpage.refresh_playthroughs()
+            message = "merge {}: {} playthroughs created, {} of {} backups merged, {} already in this library in {:0.2f} seconds".format(
+                'cancelled' if summary['cancelled'] else 'complete',
+                summary['playthroughs'],
+                summary['merged'],
+                summary['missing'],
+                summary['duplicates'],
+                summary['seconds']
             )
-        
-        self.controller.event_generate("<<BackupIdle>>")
-        self.controller.set_cursor(type='')
-        if playthroughs_deleted:
-            self.controller.show_message("""import complete
+            if summary['errors']:
+                message += "\n\n{} errors:\n{}".format(
+                    len(summary['errors']),
+                    "\n".join(summary['errors'][:10])
+                )
+            self.controller.show_message(message)
 
-Note: Some backups did not have a matching playthrough
-      These backups have had their delete flag set,
-      please verify the items in the __RECYCLE BIN__
-""")
-        else:
-            self.controller.show_message('import complete')
+        self.controller.jobs.submit(
+            "Merge Library",
+            self.merge_library_thread,
+            dbpath,
+            backup_path,
+            on_done=merge_done
+        )
+
+    def merge_library_thread(self, settings, cancel, progress, dbpath,
+                             library_backup_path):
+        """merges another library into this one.
+
+        the other database is attached, its playthroughs are matched by
+        name and its backups deduplicated by hash in SQL. Only the missing
+        backup files are copied, in parallel and verified against their
+        hash, and are committed in batches. When cancelled, the copies
+        already running are still committed.
+
+        the other database is never written to, when its schema is older
+        than ours a migrated copy of it is merged instead
 
-    def mark_old_backups(self, silent=False):
-        """Tries to find backups that can be pruned.
-        Sets the deleted flag for all backups that can be pruned
-        
         Args:
-            silent (bool): default False. set to True to display a message if
-                            no deletion candidiate backups are found
-        """
-        old_backups = self.controller.db.get_old_backups()
-        last_backups = self.controller.db.get_latest_backups()
-        marked = 0
-        if old_backups:
-            for backup in old_backups:
-                # make sure this backup is not one of the latest backups
-                # we never mark for deletion ond of the latest backups
-                # configure the number to keep in the backup settings
-                if backup['file_hash'] in last_backups:
-                    continue
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to cancel the merge
+            progress (Queue): receives ('progress', (done, total, status))
+                              messages and a final ('finished', summary)
+            dbpath (str): the full path to the database to merge
+            library_backup_path (str): the backup folder of that database
+        """
+        from modules.app import Model
+        timer_start = perf_counter()
+        backup_path = settings["APP"]["BACKUPPATH"]
+        summary = {
+            'playthroughs': 0,
+            'merged': 0,
+            'missing': 0,
+            'duplicates': 0,
+            'errors': [],
+            'cancelled': False,
+            'seconds': 0
+        }
+        db = None
+        temp_dir = None
+
+        try:
+            if not os.path.isfile(dbpath):
+                raise FileNotFoundError("Cannot find {}".format(dbpath))
+
+            db = Model(self.controller, settings["APP"]['DBPATH'])
+            source_path = dbpath
+            source_version = Model.get_library_version(dbpath)
+            if source_version > db.version:
+                raise ValueError(
+                    "{} was created by a newer version of x4SaveManager".format(dbpath)
+                )
+            if source_version < db.version:
+                # bring a copy of the other library up to date
+                temp_dir = tempfile.mkdtemp(prefix="x4SaveManager_merge_")
+                source_path = os.path.join(temp_dir, os.path.basename(dbpath))
+                Model.copy_library(dbpath, source_path)
+                Model(self.controller, source_path).connection.close()
+
+            db.attach_library(source_path)
+            summary['playthroughs'] = db.merge_playthroughs()
+
+            # the backups of archived playthroughs are in the archive
+            # databases next to the other library
+            sources = [('merge_source', None)] + [
+                ('merge_archive', os.path.join(
+                    os.path.dirname(dbpath),
+                    'archive',
+                    archive
+                ))
+                for archive in db.get_library_archives()
+            ]
+            used_names = set()
+            done = 0
+            for schema, archive_path in sources:
+                if cancel.is_set():
+                    summary['cancelled'] = True
+                    break
+
+                if archive_path:
+                    if not os.path.isfile(archive_path):
+                        summary['errors'].append(
+                            "Cannot find archive {}".format(archive_path)
+                        )
+                        continue
+                    db.attach_library_archive(archive_path)
+
+                merge = db.get_merge_backups(schema)
+                summary['missing'] += len(merge['backups'])
+                summary['duplicates'] += merge['total'] - len(merge['backups'])
+
+                backups = []
+                with ThreadPoolExecutor(max_workers=self.backfill_workers) as pool:
+                    futures = {}
+                    for backup in merge['backups']:
+                        stamp = backup['backup_filename'].split('_', 1)[-1]
+                        if stamp.endswith('.xml.gz'):
+                            stamp = stamp[:-len('.xml.gz')]
+                        backup['playthrough_id'] = backup.pop('merged_playthrough_id')
+                        backup['old_filename'] = backup['backup_filename']
+                        backup['backup_filename'] = self._unique_backup_filename(
+                            backup_path,
+                            backup['playthrough_id'],
+                            stamp,
+                            used_names
+                        )
+                        futures[pool.submit(
+                            self._copy_verified,
+                            os.path.join(library_backup_path, backup['old_filename']),
+                            os.path.join(backup_path, backup['backup_filename']),
+                            backup['file_hash']
+                        )] = backup
+
+                    for future in as_completed(futures):
+                        if cancel.is_set() and not summary['cancelled']:
+                            # drop the queued copies, the running ones land
+                            # in the backup folder and are committed below
+                            summary['cancelled'] = True
+                            for f in futures:
+                                f.cancel()
+                        if future.cancelled():
+                            continue
+
+                        done += 1
+                        backup = futures[future]
+                        try:
+                            backup.update(future.result())
+                        except Exception as e:
+                            summary['errors'].append("{}: {}".format(
+                                backup['old_filename'],
+                                e
+                            ))
+                            continue
+
+                        backups.append(backup)
+                        if len(backups) >= self.import_batch_size:
+                            db.add_backups(backups)
+                            summary['merged'] += len(backups)
+                            backups = []
+
+                        progress.put(('progress', (
+                            done,
+                            summary['missing'],
+                            backup['old_filename']
+                        )))
+
+                db.add_backups(backups)
+                summary['merged'] += len(backups)
+
+            db.detach_library()
+            db.after_large_mutation()
+        except Exception as e:
+            summary['errors'].append(str(e))
+        finally:
+            if db:
+                db.connection.close()
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+            summary['seconds'] = perf_counter() - timer_start
+            progress.put(('finished', summary))
+
+    @staticmethod
+    def _copy_verified(source, destination, file_hash):
+        """copies a backup file, hashing it in the same pass, and removes
+        the copy if its hash doesn't match the expected one
+
+        Returns:
+            dict: the storage metadata of the copy
+        """
+        sha256 = hashlib.sha256()
+        with open(source, "rb") as src:
+            try:
+                with open(destination, "wb") as dst:
+                    for chunk in iter(lambda: src.read(SaveManager.hash_chunk_size), b""):
+                        sha256.update(chunk)
+                        dst.write(chunk)
+                if sha256.hexdigest() != file_hash:
+                    raise ValueError("hash mismatch, the backup file was modified")
+            except Exception:
+                if os.path.exists(destination):
+                    os.remove(destination)
+                raise
+
+        shutil.copystat(source, destination)
+        return SaveManager.get_storage_metadata(destination)
+
+    def fix_renamed_backups(self, renamed, on_done=None):
+        """points the database to the new names of renamed backup files,
+        as a job, see fix_renamed_thread
+
+        Args:
+            renamed (list): the renamed entries of a reconciliation report
+            on_done (function): default None. called once the database
+                                is updated
+        """
+        self.controller.jobs.submit(
+            "Fix Renamed Backups",
+            self.fix_renamed_thread,
+            renamed,
+            on_done=on_done
+        )
+
+    def fix_renamed_thread(self, settings, cancel, progress, renamed):
+        """records the new names, and the storage metadata, of renamed
+        backup files
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to stop updating the backups
+            progress (Queue): receives ('progress', (done, total, status))
+                              messages and a final ('finished', count)
+            renamed (list): the renamed entries of a reconciliation report
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        backup_root = settings["APP"]["BACKUPPATH"]
+        storage = []
+        try:
+            for done, backup in enumerate(renamed):
+                if cancel.is_set():
+                    break
 
-                marked += 1
-                self.controller.db.backup_set_delete(
-                    backup['file_hash']
+                progress.put(('progress', (done, len(renamed), backup['backup_filename'])))
+                db.set_backup_filename(
+                    backup['file_hash'],
+                    backup['backup_filename']
                 )
+                metadata = self.get_storage_metadata(
+                    os.path.join(backup_root, backup['backup_filename'])
+                )
+                metadata['file_hash'] = backup['file_hash']
+                storage.append(metadata)
+
+            db.update_storage_metadata(storage)
+        finally:
+            db.connection.close()
+        progress.put(('finished', len(storage)))
+
+    def mark_old_backups(self, silent=False, on_done=None):
+        """Tries to find backups that can be pruned.
+        Sets the deleted flag for all backups that can be pruned,
+        see Model.apply_retention
+
+        the retention policy is previewed, and applied, as jobs,
+        see retention_thread
+        
+        Args:
+            silent (bool): default False. set to True to mark the backups
+                           without confirmation, and to not display a
+                           message if no deletion candidiate backups are found
+            on_done (function): default None. called once the backups are
+                                marked, or when there are none to mark
+        """
+        def marked(count):
+            self.controller.startpage.populate_tree()
             self.controller.show_message("Marked {} Old Backups For Deletion".format(
-                marked
+                count
             ))
+            if on_done:
+                on_done()
+
+        self.controller.jobs.submit(
+            "Find Old Backups",
+            self.retention_thread,
+            False,
+            on_done=lambda preview: self.confirm_retention(
+                preview,
+                silent,
+                marked,
+                on_done
+            ),
+            show_progress=False
+        )
+
+    def confirm_retention(self, preview, silent, marked, on_done):
+        """callback with the retention preview, asks to mark the old
+        backups and starts marking them, see mark_old_backups
+        """
+        if preview is None:
             return
+
+        if not preview['count']:
+            if not silent:
+                self.controller.show_message("No Backups were candidates for deletion with the current settings")
+            if on_done:
+                on_done()
+            return
+
         if not silent:
-            self.controller.show_message("No Backups were candidates for deletion with the current settings")
+            self.controller.show_question("""Mark {} Old Backups ({}) For Deletion?
+
+{}
+""".format(
+                preview['count'],
+                Formatter.size(preview['bytes']),
+                "\n".join(
+                    "{}: {} backups, {}".format(
+                        playthrough['name'],
+                        playthrough['count'],
+                        Formatter.size(playthrough['bytes'])
+                    )
+                    for playthrough in preview['playthroughs'][:10]
+                )
+            ))
+            if not self.controller.check_modal():
+                return
+
+        self.controller.jobs.submit(
+            "Mark Old Backups",
+            self.retention_thread,
+            True,
+            on_done=marked,
+            show_progress=False
+        )
+
+    def retention_thread(self, settings, cancel, progress, apply):
+        """previews or applies the retention policy
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set before the job starts to skip it
+            progress (Queue): receives a final ('finished', result), the
+                              preview or the number of marked backups
+            apply (bool): marks the backups when True, otherwise
+                          only previews the policy
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        result = None
+        try:
+            if not cancel.is_set():
+                result = db.apply_retention() if apply else db.preview_retention()
+        finally:
+            db.connection.close()
+        progress.put(('finished', result))
     
     def delete_backups(self, silent=False):
         """Deletes all backups that have been marked for deletion
+
+        the backups are counted, and deleted once confirmed, as jobs,
+        see count_deletable_thread and delete_backups_thread
         
         Args:
             silent (bool): default False. set to True to hide all confirmation messages
         """
-        backups_to_delete = self.controller.db.get_backups_to_delete()
+        if self.delete_job and not self.delete_job.finished:
+            self.delete_job.focus()
+            return False
+
+        self.delete_job = self.controller.jobs.submit(
+            "Count Backups",
+            self.count_deletable_thread,
+            on_done=lambda deletable: self.confirm_deletion(deletable, silent),
+            show_progress=False
+        )
+        return True
+
+    def count_deletable_thread(self, settings, cancel, progress):
+        """counts the backups marked for deletion, see
+        Model.count_deletable_backups
 
-        if len(backups_to_delete) == 0:
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set before the job starts to skip it
+            progress (Queue): receives a final ('finished', counts)
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        result = None
+        try:
+            if not cancel.is_set():
+                result = db.count_deletable_backups()
+        finally:
+            db.connection.close()
+        progress.put(('finished', result))
+
+    def confirm_deletion(self, deletable, silent):
+        """callback with the counted backups, asks to delete them and
+        starts deleting them, see delete_backups
+        """
+        if deletable is None:
+            return
+
+        blocked_message = """Current settings are prohibiting the deletion of
+ one or more of the backups marked for deletion.
+
+Review which save types to delete in settings under backup settings
+and validate the the backups you want to delete are not flagged (flag = True)
+"""
+
+        if deletable['count'] == 0:
             if not silent:
-                self.controller.show_message("There are no backups marked for deletion")
-            return False
+                if deletable['blocked']:
+                    self.controller.show_message(blocked_message)
+                else:
+                    self.controller.show_message("There are no backups marked for deletion")
+            return
         
         if not silent:
             self.controller.show_question("""Are you sure you want to delete all backups that have been marked for deletion?
 
+{} backups, {}
+
 WARNING: this will delete both the backup file and the database entry.
 WARNING: this action cannot be reversed.
-""")
+""".format(
+                deletable['count'],
+                Formatter.size(deletable['bytes'])
+            ))
             if not self.controller.check_modal():
                 self.controller.show_message("Deletion Cancelled")
-                return False
-        
-        try:
-            deletion_error = False
-            for backup in backups_to_delete:
-                perform_delete = False
-                backup_file_path = os.path.join(
-                    self.controller.app_settings.get_app_setting('BACKUPPATH'),
-                    backup['backup_filename']
+                return
+
+        def deletion_done(summary):
+            self.controller.startpage.populate_tree()
+
+            if silent and not summary['errors']:
+                return
+
+            message = "deletion {}: {} of {} backups deleted, {} freed in {:0.2f} seconds".format(
+                'cancelled' if summary['cancelled'] else 'complete',
+                summary['deleted'],
+                summary['total'],
+                Formatter.size(summary['bytes']),
+                summary['seconds']
+            )
+            if summary['errors']:
+                message += "\n\n{} backups could not be deleted:\n{}".format(
+                    len(summary['errors']),
+                    "\n".join(summary['errors'][:10])
                 )
+            if summary['blocked'] and not silent:
+                message += "\n\n" + blocked_message
+            self.controller.show_message(message)
 
-                if (
-                    self.controller.app_settings.get_app_setting(
-                        'DELETE_QUICKSAVES',
-                        category="BACKUP"
-                    ) 
-                    and backup['x4_filename'].startswith('quicksave')
-                    and not backup['flag']
-                ):
-                    perform_delete = True
+        self.delete_job = self.controller.jobs.submit(
+            "Delete Backups",
+            self.delete_backups_thread,
+            on_done=deletion_done,
+            show_progress=not silent
+        )
 
-                if (
-                    self.controller.app_settings.get_app_setting(
-                        'DELETE_AUTOSAVES',
-                        category="BACKUP"
-                    ) 
-                    and backup['x4_filename'].startswith('autosave')
-                    and not backup['flag']
-                ):
-                    perform_delete = True
+    def delete_backups_thread(self, settings, cancel, progress):
+        """deletes the backups that may be deleted, see
+        Model.get_deletable_backups
 
-                if (
-                    self.controller.app_settings.get_app_setting(
-                        'DELETE_SAVES',
-                        category="BACKUP"
-                    ) 
-                    and backup['x4_filename'].startswith('save')
-                    and not backup['flag']
-                ):
-                    perform_delete = True
+        the files are deleted in batches by a bounded pool of threads.
+        Every batch is recorded in the delete journal before its files are
+        deleted, and its database rows are deleted in a single transaction
+        afterwards, so an interrupted deletion can be recovered
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to cancel the deletion
+            progress (Queue): receives ('progress', (done, total, status))
+                              messages and a final ('finished', summary)
+        """
+        from modules.app import Model
+        timer_start = perf_counter()
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        backup_path = settings["APP"]["BACKUPPATH"]
+        summary = {
+            'deleted': 0,
+            'bytes': 0,
+            'total': 0,
+            'blocked': 0,
+            'errors': [],
+            'cancelled': False,
+            'seconds': 0
+        }
+
+        try:
+            self.recover_deletions(db, backup_path)
+            deletable = db.get_deletable_backups()
+            backups = deletable['backups']
+            summary['total'] = len(backups)
+            summary['blocked'] = deletable['blocked']
+
+            with ThreadPoolExecutor(max_workers=self.delete_workers) as pool:
+                for start in range(0, len(backups), self.import_batch_size):
+                    if cancel.is_set():
+                        summary['cancelled'] = True
+                        break
+
+                    batch = backups[start:start + self.import_batch_size]
+                    db.journal_deletions(batch)
+                    deleted = []
+                    failed = []
+                    for backup, error in zip(batch, pool.map(
+                        self._remove_backup_file,
+                        [os.path.join(backup_path, backup[1]) for backup in batch]
+                    )):
+                        if error:
+                            failed.append(backup[0])
+                            summary['errors'].append(
+                                "{}: {}".format(backup[1], error)
+                            )
+                        else:
+                            deleted.append(backup[0])
+                            summary['bytes'] += backup[2] or 0
+                    db.commit_deletions(deleted, failed)
+                    summary['deleted'] += len(deleted)
+
+                    progress.put(('progress', (
+                        start + len(batch),
+                        len(backups),
+                        "Deleting backups"
+                    )))
+
+            db.after_large_mutation()
+        except Exception as e:
+            summary['errors'].append(str(e))
+        finally:
+            db.connection.close()
+            summary['seconds'] = perf_counter() - timer_start
+            progress.put(('finished', summary))
+
+    @staticmethod
+    def _remove_backup_file(file_path):
+        """deletes a backup file, a file that is already gone counts
+        as deleted
+
+        Returns:
+            str: the error, or None when the file was deleted
+        """
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            return str(e)
+
+        return None
+
+    def recover_deletions(self, db=None, backup_path=None):
+        """finishes a deletion that was interrupted, using the delete
+        journal: backups whose file is gone are deleted from the database,
+        the others stay marked for deletion
 
-                if perform_delete:
-                    os.remove(backup_file_path)
-                    self.controller.db.delete_backup(backup['file_hash'])
+        Args:
+            db (Model): default the main Model. the Model of the calling thread
+            backup_path (str): default the BACKUPPATH setting
+        """
+        db = db or self.controller.db
+        backup_path = backup_path or self.controller.app_settings.get_app_setting(
+            'BACKUPPATH'
+        )
+        deleted = []
+        failed = []
+        try:
+            for file_hash, backup_filename in db.get_delete_journal():
+                if os.path.exists(os.path.join(backup_path, backup_filename)):
+                    failed.append(file_hash)
                 else:
-                    deletion_error = True
-            
-            if deletion_error and not silent:
-                self.controller.show_message("""Current settings are prohibiting the deletion of
- one or more of the backups marked for deletion.
+                    deleted.append(file_hash)
 
-Review which save types to delete in settings under backup settings
-and validate the the backups you want to delete are not flagged (flag = True)
-""")
-            return True
+            if deleted or failed:
+                db.commit_deletions(deleted, failed)
         except Exception as e:
             self.controller.show_error(e)
-            return False
 
     def stop_backup(self):
         """Stops the backup process/thread
@@ -269,26 +1576,35 @@ and validate the the backups you want to delete are not flagged (flag = True)
         """starts the backup process/thread
         """
         self.cancel_backup.clear()
-        self.controller.startpage.set_progress_count(0)
+        self.controller.backup_channel.reset(
+            self.controller.app_settings.get_app_setting(
+                'BACKUPFREQUENCY_SECONDS',
+                category="BACKUP"
+            )
+        )
         self.backup_in_progress = True
         self.controller.startpage.show_backup_frame()
         self.backup_thread = threading.Thread(
             target=self.start_backup_thread,
             args=(
                 self.controller.app_settings.app_settings,
-                self.controller.message_queue,
+                self.controller.backup_channel,
                 self.controller.selected_playthrough
             )
         )
         self.controller.event_generate("<<BackupThreadStarted>>")
         self.backup_thread.start()
     
-    def restore_backup(self, backup_filename, x4_save_slot):
+    def restore_backup(self, backup_filename, x4_save_slot, file_hash):
         """resotres a backup to a given X4 save location
 
+        the restore runs as a job and shows its progress in a progress
+        window which can cancel it, see restore_backup_thread
+
         Args:
             backup_filename (str): the backup filename to restore
             x4_save_slot (str): the x4 save name to restore to
+            file_hash (str): the hash of the backup, to verify the restore
         """
         message=f"""
 Are you sure you want to restore backup: {backup_filename}
@@ -306,10 +1622,6 @@ WARNING: this will overwrite the X4 save file if it exists.
             self.controller.app_settings.get_app_setting('BACKUPPATH'),
             backup_filename
         )
-        x4_save_path = os.path.join(
-            self.controller.app_settings.get_app_setting('X4SAVEPATH'),
-            f"{x4_save_slot}.xml.gz"
-        )
         if not os.path.exists(backup_path):
             self.controller.show_error("Backup file not found, Restore Failed")
             return
@@ -317,26 +1629,119 @@ WARNING: this will overwrite the X4 save file if it exists.
         if not os.path.exists(self.controller.app_settings.get_app_setting('X4SAVEPATH')):
             self.controller.show_error("X4 Save Folder not found, Restore Failed")
             return
-        
+
+        def restore_done(result):
+            if result['error']:
+                self.controller.show_error("Restore Failed: {}".format(result['error']))
+            elif result['cancelled']:
+                self.controller.show_message("Restore Cancelled")
+            elif result['skipped']:
+                self.controller.show_message("X4 slot {} already holds this backup".format(
+                    x4_save_slot
+                ))
+            else:
+                self.controller.show_message("Backup Successfully restored to X4 slot {}".format(
+                    x4_save_slot
+                ))
+
+        self.controller.jobs.submit(
+            "Restore Backup",
+            self.restore_backup_thread,
+            backup_filename,
+            x4_save_slot,
+            file_hash,
+            on_done=restore_done
+        )
+
+    def restore_backup_thread(self, settings, cancel, progress,
+                              backup_filename, x4_save_slot, file_hash):
+        """restores a backup to an X4 save slot without ever leaving a
+        partial save in the slot.
+
+        the backup is streamed into a temporary file in the X4 save folder,
+        hashing it in the same pass. Only when the hash matches the backup's
+        hash is the temporary file synced to disk and moved into the slot.
+        The copy is skipped when the slot already holds the backup
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to cancel the restore
+            progress (Queue): receives ('progress', (done, total, status))
+                              messages and a final ('finished', result)
+            backup_filename (str): the backup filename to restore
+            x4_save_slot (str): the x4 save name to restore to
+            file_hash (str): the hash of the backup
+        """
+        backup_path = os.path.join(settings["APP"]["BACKUPPATH"], backup_filename)
+        x4_save_folder = settings["APP"]["X4SAVEPATH"]
+        x4_save_path = os.path.join(x4_save_folder, f"{x4_save_slot}.xml.gz")
+        # the temporary name must not look like a save to X4 or the backup thread
+        temp_path = os.path.join(x4_save_folder, f".{x4_save_slot}.restoring")
+        result = {
+            'skipped': False,
+            'cancelled': False,
+            'error': None
+        }
+
         try:
-            shutil.copyfile(backup_path, x4_save_path)
-            self.controller.show_message("Backup Successfully restored to X4 slot {}".format(
-                x4_save_slot
-            ))
+            total = os.path.getsize(backup_path)
+            status = f"Restoring {backup_filename} to {x4_save_slot}"
+            progress.put(('progress', (0, total, status)))
+
+            # the slot's fingerprint, its size and then its hash
+            if (
+                os.path.exists(x4_save_path)
+                and os.path.getsize(x4_save_path) == total
+                and self.compute_file_hash(x4_save_path) == file_hash
+            ):
+                result['skipped'] = True
+                return
+
+            sha256 = hashlib.sha256()
+            done = 0
+            with open(backup_path, "rb") as src, open(temp_path, "wb") as dst:
+                for chunk in iter(lambda: src.read(self.hash_chunk_size), b""):
+                    if cancel.is_set():
+                        result['cancelled'] = True
+                        break
+                    sha256.update(chunk)
+                    dst.write(chunk)
+                    done += len(chunk)
+                    progress.put(('progress', (done, total, status)))
+                else:
+                    if sha256.hexdigest() != file_hash:
+                        result['error'] = "the backup file doesn't match its hash"
+                    else:
+                        dst.flush()
+                        os.fsync(dst.fileno())
+
+            if result['cancelled'] or result['error']:
+                os.remove(temp_path)
+                return
+
+            os.replace(temp_path, x4_save_path)
         except Exception as e:
-            self.controller.show_error(e)
-        
+            result['error'] = str(e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        finally:
+            progress.put(('finished', result))
 
-    def start_backup_thread(self, settings, message_queue, playthrough):
+    def start_backup_thread(self, settings, channel, playthrough):
         """This is the main backup process which is handed to a dedicated
         thread.
+
+        The progress is published to the channel, which the StartPage
+        polls, so the thread never waits on the GUI
         
         Args:
             settings (AppSettings): an instance of AppSettings to access the 
                                     main application settings from a seperate
                                     thread
-            message_queue (Queue): a thread save queue to pass messages back 
-                                   and forth between threads
+            channel (BackupChannel): receives the backup progress snapshots
+                                     and the finished backups
             playthrough (List): an instance of the currently selected playthrough
         """
         from modules.app import Model
@@ -354,30 +1759,22 @@ WARNING: this will overwrite the X4 save file if it exists.
             if '.xml' in file.name:
                 os.remove(file.path)
 
-        # create our data dictionary that we return through the messaging queue
-        # and enter the main backup loop
-        data = {}
-        data['loops'] = 0
-        data['x4saves'] = []
+        # the session log only grows during this session
+        db.prune_session_log(channel.session_start)
+
+        # enter the main backup loop
+        loops = 0
         while True:
             countdown = save_seconds
-            data['processing'] = 0
             # sleep while we wait for the next loop
             while countdown  >= 0:
-                self.controller.event_generate("<<UpdateBackupProgress>>")
-                data['countdown'] = countdown
+                channel.publish(loops=loops, countdown=countdown)
                 countdown -= 1
-                message_queue.put(data)
-                self.controller.event_generate("<<NewQueueData>>")
-
-                sleep(1)
-                if self.cancel_backup.is_set():
-                    self.controller.event_generate("<<RefreshBackupTreeview>>")
+                if self.cancel_backup.wait(1):
                     break
 
             # make sure we aren't canceled before continuing
             if self.cancel_backup.is_set():
-                self.controller.event_generate("<<RefreshBackupTreeview>>")
                 break
             
             # check to see if we have any x4saves that haven't been backed up
@@ -401,7 +1798,6 @@ WARNING: this will overwrite the X4 save file if it exists.
 
                 # file has not been backed up
                 # get the now time
-                self.controller.event_generate("<<BackupRunning>>")
                 now = datetime.datetime.now()
                 timer_start = perf_counter()
                 backup_filename = "id{}_{}.xml.gz".format(
@@ -412,25 +1808,26 @@ WARNING: this will overwrite the X4 save file if it exists.
                     backup_path,
                     backup_filename
                 )
-                data['x4saves'].append({
-                    'x4save': file.name,
-                    'backup_filename': backup_filename,
-                    'hash': hash
-                })
+                entry = BackupEntry(
+                    x4save=file.name,
+                    backup_filename=backup_filename,
+                    hash=hash,
+                    backup_timespan=None,
+                    evicted=0,
+                    log_id=None
+                )
 
                 try:
-                    data['processing'] = 1
-                    message_queue.put(data)
-                    self.controller.event_generate("<<NewQueueData>>")
+                    channel.publish(processing=entry)
                     shutil.copyfile(file.path, backup_fullpath)
                     
                     details = self.extract_backup_details(
                         backup_fullpath=backup_fullpath
                     )
+                    storage = self.get_storage_metadata(backup_fullpath)
 
                     timer_stop = perf_counter()
                     backup_timespan = timer_stop - timer_start
-                    data['x4saves'][-1]['backup_timespan'] = backup_timespan
 
                     db.add_backup(
                         playthrough_id = playthrough['id'],
@@ -446,29 +1843,249 @@ WARNING: this will overwrite the X4 save file if it exists.
                         x4_start_type = details['start_type'],
                         character_name = details['playername'],
                         money = details['money'],
-                        moded = details['modified']
+                        moded = details['modified'],
+                        file_size = storage['file_size'],
+                        uncompressed_size = storage['uncompressed_size'],
+                        stored_mtime = storage['stored_mtime']
                     )
-                    self.controller.event_generate("<<BackupThreadStarted>>")
+                    evicted, shortfall = self.enforce_quota(db, settings)
+                    warning = None
+                    if shortfall:
+                        warning = "The backups are {} over the disk quota, which only flagged, latest or archived backups are left to meet".format(
+                            Formatter.size(shortfall)
+                        )
+                    channel.publish(warning=warning)
+                    entry = entry._replace(
+                        backup_timespan=backup_timespan,
+                        evicted=len(evicted)
+                    )
+                    channel.finish(entry._replace(
+                        log_id=db.add_session_log(channel.session_start, entry)
+                    ))
                 except Exception as e:
                     raise e
             
             # done with this loop, get ready for the next
-            data['loops'] += 1
+            loops += 1
     
-    def compute_file_hash(self, file_path):
+    @classmethod
+    def eviction_cost(cls, x4_filename, x4_save_time, delete, now):
+        """returns the cost of evicting a backup, the cheapest backups
+        are evicted first.
+
+        backups marked for deletion cost nothing, others cost the weight
+        of their savetype divided by their age in days plus one
+
+        Args:
+            x4_filename (str): the X4 save name, which gives the savetype
+            x4_save_time (float): when the save was made
+            delete (bool): True if the backup is marked for deletion
+            now (float): the current timestamp
+        """
+        if delete:
+            return 0
+
+        weight = next(
+            (
+                weight for savetype, weight in cls.eviction_weights.items()
+                if (x4_filename or '').startswith(savetype)
+            ),
+            1
+        )
+        age_days = max(now - (x4_save_time or 0), 0) / 86400
+        return weight / (1 + age_days)
+
+    def enforce_quota(self, db, settings):
+        """evicts the cheapest backups until the backup store is under the
+        QUOTA_MB backup setting, see eviction_cost and
+        Model.get_eviction_candidates
+
+        the sizes come from the database, so no backup files are read.
+        Archived, flagged and the latest backups are never evicted, when
+        the quota can't be met without them only the backups already marked
+        for deletion are evicted and the shortfall is returned, so that the
+        library isn't emptied to chase a quota it can never meet.
+        The evictions go through the delete journal, see delete_backups_thread
+
+        Args:
+            db (Model): the Model of the calling thread
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+
+        Returns:
+            tuple: the hashes of the evicted backups, and the number of bytes
+                   the backups stay over the quota when it can't be met
+        """
+        quota = (settings["BACKUP"].get("QUOTA_MB") or 0) * 1024 * 1024
+        total = db.get_total_backup_size() or 0
+        if not quota or total <= quota:
+            return [], 0
+
+        backup_path = settings["APP"]["BACKUPPATH"]
+        now = datetime.datetime.now().timestamp()
+        candidates = db.get_eviction_candidates()
+        shortfall = max(
+            total - sum(candidate[2] for candidate in candidates) - quota,
+            0
+        )
+        heap = [
+            (
+                self.eviction_cost(x4_filename, x4_save_time, delete, now),
+                x4_save_time or 0,
+                file_hash,
+                backup_filename,
+                file_size
+            )
+            for file_hash, backup_filename, file_size, x4_filename, x4_save_time, delete
+            in candidates
+            if delete or not shortfall
+        ]
+        heapq.heapify(heap)
+
+        evictions = []
+        while heap and total > quota:
+            _, _, file_hash, backup_filename, file_size = heapq.heappop(heap)
+            total -= file_size
+            evictions.append((file_hash, backup_filename))
+
+        db.journal_deletions(evictions)
+        evicted = []
+        failed = []
+        for file_hash, backup_filename in evictions:
+            if self._remove_backup_file(os.path.join(backup_path, backup_filename)):
+                failed.append(file_hash)
+            else:
+                evicted.append(file_hash)
+        db.commit_deletions(evicted, failed)
+
+        return evicted, shortfall
+
+    def start_storage_backfill(self):
+        """records the storage metadata for backups that were made before
+        it was tracked. Runs once as a job and does nothing if all the
+        backups already have it
+        """
+        if not self.controller.db.get_backups_missing_storage_metadata():
+            return
+
+        self.controller.jobs.submit(
+            "Record Backup Sizes",
+            self.storage_backfill_thread,
+            on_done=lambda *args: self.controller.startpage.populate_tree(),
+            show_progress=False
+        )
+
+    def storage_backfill_thread(self, settings, cancel, progress):
+        """stats the backup files in parallel and records their storage
+        metadata in batches
+
+        backups whose file can't be found are skipped and left for
+        the next run, as are the backups left when the job is cancelled
+
+        Args:
+            settings (AppSettings): an instance of AppSettings to access the
+                                    main application settings from a seperate
+                                    thread
+            cancel (Event): set to stop the backfill
+            progress (Queue): receives ('progress', (done, total, status))
+                              messages and a final ('finished', None)
+        """
+        from modules.app import Model
+        db = Model(self.controller, settings["APP"]['DBPATH'])
+        backup_path = settings["APP"]["BACKUPPATH"]
+
+        try:
+            backups = db.get_backups_missing_storage_metadata()
+            paths = [
+                os.path.join(backup_path, backup['backup_filename'])
+                for backup in backups
+            ]
+
+            batch = []
+            with ThreadPoolExecutor(max_workers=self.backfill_workers) as pool:
+                for done, (backup, storage) in enumerate(zip(
+                    backups,
+                    pool.map(self.get_storage_metadata, paths)
+                )):
+                    if cancel.is_set():
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        break
+
+                    progress.put(('progress', (done, len(backups), backup['backup_filename'])))
+                    if storage['file_size'] is None:
+                        continue
+
+                    storage['file_hash'] = backup['file_hash']
+                    batch.append(storage)
+                    if len(batch) >= self.backfill_batch_size:
+                        db.update_storage_metadata(batch)
+                        batch = []
+
+            if batch:
+                db.update_storage_metadata(batch)
+
+            db.after_large_mutation()
+        finally:
+            db.connection.close()
+        progress.put(('finished', None))
+
+    @staticmethod
+    def get_storage_metadata(file_path):
+        """returns the size, uncompressed size and modification time
+        of a gzipped X4 save or backup file.
+
+        the uncompressed size is read from the gzip ISIZE trailer (the
+        last 4 bytes of the file), so it is the uncompressed size modulo
+        2^32, and it's only exact for files with a single gzip member.
+
+        Args:
+            file_path (str): the full path to the file
+
+        Returns:
+            dict: file_size, uncompressed_size and stored_mtime.
+                  all None if the file can't be read
+        """
+        storage = {
+            'file_size': None,
+            'uncompressed_size': None,
+            'stored_mtime': None
+        }
+        try:
+            stat = os.stat(file_path)
+            storage['file_size'] = stat.st_size
+            storage['stored_mtime'] = stat.st_mtime
+            if stat.st_size >= 4:
+                with open(file_path, 'rb') as f:
+                    f.seek(-4, os.SEEK_END)
+                    storage['uncompressed_size'], = struct.unpack(
+                        '<I',
+                        f.read(4)
+                    )
+        except OSError:
+            pass
+
+        return storage
+
+    @staticmethod
+    def compute_file_hash(file_path):
         sha256 = hashlib.sha256()
         if os.path.exists(file_path):
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
+                for chunk in iter(lambda: f.read(SaveManager.hash_chunk_size), b""):
                     sha256.update(chunk)
             return sha256.hexdigest()
 
-    def extract_backup_details(self, backup_fullpath):
-        """uncompresses an X4 save file and extracts details from the XML
+    @staticmethod
+    def extract_backup_details(backup_fullpath):
+        """extracts details from the XML of an X4 save file
+
+        the XML is parsed straight from the gzip stream, and parsing
+        stops after the info element, so only the start of the save
+        is ever uncompressed
         
         Args:
             backup_fullpath (str): the full path to the backed up X4 save file
-            tempfilepath (str): the full path to temporary extracted backup file
         """
         save_details = {
             'save_time': '',
@@ -481,73 +2098,83 @@ WARNING: this will overwrite the X4 save file if it exists.
             'money': ''
         }
 
-        now = datetime.datetime.now()
-
-        if not os.path.exists(self.temp_dir):
-            os.makedirs(self.temp_dir)
-
-        tempfilepath = os.path.join(
-            self.temp_dir,
-            f'{now.strftime("%Y%m%d-%H%M%S")}.xml'
-        )
-
-        # extract the xml to a temp file in chunks so we don't kill memory
         with gzip.open(backup_fullpath, 'rb') as f_in:
-            with open(tempfilepath, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out, 4096)
-        
-        #search the xml in a memory friendly way
-        context = etree.iterparse(
-            tempfilepath,
-            # in order to save memory as we process the save file
-            # we have to match on all major tags and clear them
-            # from memory as we go, searching and recording what we need
-            # this way the element.clear() calls works as expected
-            # and it can clear no-longer needed elements from memory
-            tag=(
-                'savegame','info','save','game','player','patches','universe',
-                'factions','jobs','god','controltextures','component',
-                'conections','connection','connected','offset','physics',
-                'economylog','stats','log','messages','script','md',
-                'missions','aidirector','operations','ventures',
-                'notifications','ui','signatures'
+            #search the xml in a memory friendly way
+            context = etree.iterparse(
+                f_in,
+                # in order to save memory as we process the save file
+                # we have to match on all major tags and clear them
+                # from memory as we go, searching and recording what we need
+                # this way the element.clear() calls works as expected
+                # and it can clear no-longer needed elements from memory
+                tag=(
+                    'savegame','info','save','game','player','patches','universe',
+                    'factions','jobs','god','controltextures','component',
+                    'conections','connection','connected','offset','physics',
+                    'economylog','stats','log','messages','script','md',
+                    'missions','aidirector','operations','ventures',
+                    'notifications','ui','signatures'
+                )
             )
-        )
         
-        for event, element in context:
-            if element.tag == 'save':
-                save_details['save_time'] = element.attrib['date'] if 'date' in element.attrib else ''
+            for event, element in context:
+                if element.tag == 'save':
+                    save_details['save_time'] = element.attrib['date'] if 'date' in element.attrib else ''
             
-            if element.tag == 'game':
-                save_details['game_version'] = "{} build {}".format(
-                    element.attrib['version'] if 'version' in element.attrib else '',
-                    element.attrib['build'] if 'build' in element.attrib else ''
-                )
-                save_details['original_version'] = "{} build {}".format(
-                    element.attrib['original'] if 'original' in element.attrib else '',
-                    element.attrib['originalbuild'] if 'originalbuild' in element.attrib else ''
-                )
-                save_details['modified'] = element.attrib['modified'] if 'modified' in element.attrib else ''
-                save_details['gametime'] = element.attrib['time'] if 'time' in element.attrib else ''
-                save_details['start_type'] = element.attrib['start'] if 'start' in element.attrib else ''
-
-            if element.tag == 'player':
-                save_details['playername'] = element.attrib['name'] if 'name' in element.attrib else ''
-                save_details['money'] = element.attrib['money'] if 'money' in element.attrib else ''
-
-            # while we can process the whole file in a memory
-            # efficient way, for now we can stop afer info
-            # as all the details we are interested in are
-            # available at the start of the file before the universe
-            if element.tag == 'info':
-                element.clear()
-                break
+                if element.tag == 'game':
+                    save_details['game_version'] = "{} build {}".format(
+                        element.attrib['version'] if 'version' in element.attrib else '',
+                        element.attrib['build'] if 'build' in element.attrib else ''
+                    )
+                    save_details['original_version'] = "{} build {}".format(
+                        element.attrib['original'] if 'original' in element.attrib else '',
+                        element.attrib['originalbuild'] if 'originalbuild' in element.attrib else ''
+                    )
+                    save_details['modified'] = element.attrib['modified'] if 'modified' in element.attrib else ''
+                    save_details['gametime'] = element.attrib['time'] if 'time' in element.attrib else ''
+                    save_details['start_type'] = element.attrib['start'] if 'start' in element.attrib else ''
+
+                if element.tag == 'player':
+                    save_details['playername'] = element.attrib['name'] if 'name' in element.attrib else ''
+                    save_details['money'] = element.attrib['money'] if 'money' in element.attrib else ''
+
+                # while we can process the whole file in a memory
+                # efficient way, for now we can stop afer info
+                # as all the details we are interested in are
+                # available at the start of the file before the universe
+                if element.tag == 'info':
+                    element.clear()
+                    break
             
-            # clear the elements that we are matching on
-            # as we process the file to keep memory usage down
-            element.clear()
+                # clear the elements that we are matching on
+                # as we process the file to keep memory usage down
+                element.clear()
         
-        del context
-        os.remove(tempfilepath)
+            del context
 
         return save_details
+
+    @staticmethod
+    def read_backup_file(file_path):
+        """reads everything the import needs from a backup file.
+        Runs in the import worker processes
+
+        Args:
+            file_path (str): the full path to the backup file
+
+        Returns:
+            dict: the file_hash, details, storage metadata and duration
+                  of the backup file
+        """
+        timer_start = perf_counter()
+        storage = SaveManager.get_storage_metadata(file_path)
+        file_hash = SaveManager.compute_file_hash(file_path)
+        details = SaveManager.extract_backup_details(file_path)
+
+        return {
+            'file_path': file_path,
+            'file_hash': file_hash,
+            'details': details,
+            'storage': storage,
+            'duration': perf_counter() - timer_start
+        }
@@ -9,4 +9,5 @@ from .playthrough_page import Playthrough
 from .settings_page import Settings
 from .start_page import StartPage
 from .status_bar import StatusBar
-from .about_page import About
\ No newline at end of file
+from .about_page import About
+from .progress_page import Progress
\ No newline at end of file
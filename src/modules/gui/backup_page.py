@@ -516,32 +516,53 @@ All backups assigned to __RECYCLE BIN__ must have the Delete checkbox selected.
 Please choose a playthrough that isn't '__RECYCLE BIN__'""")
             return
         
+        changes = {
+            'playthrough_id': pid,
+            'branch': self.branches_dropdown.get(),
+            'flag': self.flag_var.get(),
+            'file_hash': self.selected_backup['file_hash'],
+            'notes': self.text_editor.get('1.0', 'end'),
+            'delete': self.delete_var.get()
+        }
         if self.selected_backup['playthrough_id'] != pid:
-            # playthrough has changed, so update the playthrough properly first
+            # playthrough has changed, so update the playthrough properly
+            # first, the changes are saved once the backup is moved
+            self.save_button.state(['disabled'])
             self.controller.playthrough_manager.move_backups_to_index(
                 backups=[{
                     'hash': self.selected_backup['file_hash'],
                     'filename': self.selected_backup['backup_filename']
                 },],
-                playthrough_id=pid
-            )
-            # refresh the filename because of the move that just happened
-            self.selected_backup = self.controller.db.get_backup_by_hash(
-                self.selected_backup['file_hash']
+                playthrough_id=pid,
+                on_done=lambda moved: self.save_changes(changes),
+                on_error=lambda e: self.save_button.state(['!disabled'])
             )
-            self.bfn_var.set(self.selected_backup['backup_filename'])
-        
-        if self.controller.db.save_backup(
-            playthrough_id=pid,
-            branch=self.branches_dropdown.get(),
-            flag=self.flag_var.get(),
-            file_hash=self.selected_backup['file_hash'],
-            notes=self.text_editor.get('1.0', 'end'),
-            delete=self.delete_var.get()
-        ):
+            return
+
+        self.save_changes(changes)
+
+    def save_changes(self, changes):
+        """persists the changes of the backup to the DB
+
+        Args:
+            changes (dict): the keyword arguments for Model.save_backup
+        """
+        saved = self.controller.db.save_backup(**changes)
+        if saved:
             self.controller.startpage.populate_tree()
+        if not self.winfo_exists():
+            return
+
+        # refresh the filename in case the backup was just moved
+        self.selected_backup = self.controller.db.get_backup_by_hash(
+            changes['file_hash']
+        )
+        self.bfn_var.set(self.selected_backup['backup_filename'])
+        if saved:
             self.status_label_var.set('Saved Successfully')
             self.save_button.state(['disabled'])
+        else:
+            self.save_button.state(['!disabled'])
         
     def close(self):
         """Closes the window"""
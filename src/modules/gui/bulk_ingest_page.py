@@ -0,0 +1,329 @@
+"""BulkIngest Class
+
+Responsible for backing up a whole X4 save folder into playthroughs
+"""
+import tkinter as tk
+from tkinter import ttk
+from .new_page_root import NewPageRoot
+
+class BulkIngest(NewPageRoot):
+    """reads every X4 save that hasn't been backed up, proposes playthroughs
+    for them and backs them up once the user confirms the grouping
+    """
+    def __init__(self, caller, controller):
+        """Constructor
+
+        Args:
+            caller (tk.Tk): the caller object
+            controller (WindowController): the application controller
+        """
+        super().__init__(caller, controller)
+
+        self.set_title("Ingest X4 Save Folder")
+        self.minsize(800,300)
+        self.status_var = tk.StringVar()
+        self.name_var = tk.StringVar()
+        self.groups = {}
+        self.excluded = set()
+        self.cancel_job = None
+
+        tree_frame = tk.Frame(
+            self
+        )
+        tree_frame.grid(
+            column=0,
+            row=0,
+            sticky=(tk.W, tk.N, tk.E, tk.S)
+        )
+        tree_frame.grid_columnconfigure(0, weight=1)
+        tree_frame.grid_rowconfigure(0, weight=1)
+        self.tree = ttk.Treeview(
+            tree_frame,
+            columns=(
+                'Include',
+                'Character',
+                'StartType',
+                'OriginalVersion',
+                'Saves'
+            ),
+            selectmode='browse'
+        )
+        self.tree.grid(
+            column=0,
+            row=0,
+            sticky=(tk.N, tk.E, tk.S, tk.W)
+        )
+        tree_v_scroll = ttk.Scrollbar(
+            tree_frame,
+            orient='vertical',
+            command=self.tree.yview
+        )
+        self.tree['yscrollcommand'] = tree_v_scroll.set
+        tree_v_scroll.grid(
+            column=1,
+            row=0,
+            sticky=(tk.N, tk.S)
+        )
+
+        self.tree.column('#0', width=250, anchor='w')
+        self.tree.heading('#0', text='Playthrough')
+        self.tree.column('Include', width=60, anchor='center')
+        self.tree.heading('Include', text='Include')
+        self.tree.column('Character', width=120, anchor='w')
+        self.tree.heading('Character', text='Character')
+        self.tree.column('StartType', width=150, anchor='w')
+        self.tree.heading('StartType', text='Start Type')
+        self.tree.column('OriginalVersion', width=100, anchor='w')
+        self.tree.heading('OriginalVersion', text='Original Version')
+        self.tree.column('Saves', width=60, anchor='e')
+        self.tree.heading('Saves', text='Saves')
+        self.tree.bind('<<TreeviewSelect>>', self.group_selected)
+        self.tree.bind('<Double-1>', self.toggle_include)
+
+        name_frame = tk.Frame(
+            self
+        )
+        name_frame.grid(
+            column=0,
+            row=1,
+            sticky=(tk.W, tk.E),
+            pady=(5,0)
+        )
+        name_frame.grid_columnconfigure(1, weight=1)
+        ttk.Label(
+            name_frame,
+            text="Playthrough Name:"
+        ).grid(
+            column=0,
+            row=0,
+            padx=2
+        )
+        self.name_entry = ttk.Entry(
+            name_frame,
+            textvariable=self.name_var,
+            state='disabled'
+        )
+        self.name_entry.grid(
+            column=1,
+            row=0,
+            sticky=(tk.W, tk.E)
+        )
+        self.name_entry.bind('<Return>', self.rename_group)
+        self.rename_button = ttk.Button(
+            name_frame,
+            text="Rename",
+            command=self.rename_group,
+            state='disabled'
+        )
+        self.rename_button.grid(
+            column=2,
+            row=0,
+            padx=2
+        )
+
+        bottom_frame = tk.Frame(
+            self
+        )
+        bottom_frame.grid(
+            column=0,
+            row=2,
+            sticky=(tk.W, tk.E),
+            pady=(5,0)
+        )
+        bottom_frame.grid_columnconfigure(0, weight=1)
+        ttk.Label(
+            bottom_frame,
+            textvariable=self.status_var,
+            anchor=tk.W
+        ).grid(
+            column=0,
+            row=0,
+            sticky=(tk.W, tk.E)
+        )
+        self.progressbar = ttk.Progressbar(
+            bottom_frame,
+            orient='horizontal',
+            mode='determinate',
+            length=150
+        )
+        self.progressbar.grid(
+            column=1,
+            row=0,
+            padx=2
+        )
+        self.ingest_button = ttk.Button(
+            bottom_frame,
+            text="Ingest",
+            command=self.ingest,
+            state='disabled'
+        )
+        self.ingest_button.grid(
+            column=2,
+            row=0,
+            padx=2
+        )
+        self.cancel_button = ttk.Button(
+            bottom_frame,
+            text="Cancel",
+            command=self.cancel
+        )
+        self.cancel_button.grid(
+            column=3,
+            row=0,
+            padx=2
+        )
+        self.bind('<Destroy>', self.closed)
+
+        self.show_window()
+        self.status_var.set("Reading the X4 saves...")
+        self.cancel_job = self.controller.save_manager.start_save_scan(
+            self.show_progress,
+            self.show_groups
+        )
+
+    def show_progress(self, done, total, status):
+        """callback with the scan and ingest progress
+        """
+        if not self.winfo_exists():
+            return
+
+        self.progressbar['maximum'] = max(total, 1)
+        self.progressbar['value'] = done
+        self.status_var.set("{} ({:,} of {:,})".format(status, done, total))
+
+    def show_groups(self, report):
+        """callback with the proposed playthroughs
+
+        Args:
+            report (dict): the report created by SaveManager.scan_saves_thread
+        """
+        if not self.winfo_exists():
+            return
+
+        self.cancel_job = None
+        self.progressbar['value'] = self.progressbar['maximum']
+        self.cancel_button.state(['!disabled'])
+        for group in report['groups']:
+            iid = self.tree.insert('', 'end', text=group['name'], values=(
+                'Yes',
+                group['character_name'],
+                group['x4_start_type'],
+                group['original_game_version'],
+                len(group['saves'])
+            ))
+            self.groups[iid] = group
+            for save in group['saves']:
+                self.tree.insert(iid, 'end', text=save['details']['save_time'], values=(
+                    '',
+                    '',
+                    '',
+                    save['details']['game_version'],
+                    ''
+                ))
+
+        self.status_var.set(
+            "{}{:,} playthroughs with {:,} saves to back up, {:,} already backed up, {:,} errors".format(
+                'Cancelled: ' if report['cancelled'] else '',
+                len(report['groups']),
+                sum(len(group['saves']) for group in report['groups']),
+                report['backed_up'],
+                len(report['errors'])
+            )
+        )
+        if report['errors']:
+            self.controller.show_error("\n".join(report['errors'][:20]))
+        if self.groups and not report['cancelled']:
+            self.ingest_button.state(['!disabled'])
+
+    def group_selected(self, *args):
+        """shows the name of the selected playthrough for renaming
+        """
+        selected = self.tree.selection()
+        if not selected or selected[0] not in self.groups:
+            self.name_var.set('')
+            self.name_entry.state(['disabled'])
+            self.rename_button.state(['disabled'])
+            return
+
+        self.name_var.set(self.groups[selected[0]]['name'])
+        self.name_entry.state(['!disabled'])
+        self.rename_button.state(['!disabled'])
+
+    def rename_group(self, *args):
+        """renames the selected playthrough. Saves are added to an existing
+        playthrough with the same name
+        """
+        selected = self.tree.selection()
+        name = self.name_var.get().strip()
+        if not selected or selected[0] not in self.groups or not name:
+            return
+
+        self.groups[selected[0]]['name'] = name
+        self.tree.item(selected[0], text=name)
+
+    def toggle_include(self, event):
+        """includes or excludes the double clicked playthrough
+        """
+        iid = self.tree.identify_row(event.y)
+        if iid not in self.groups:
+            return
+
+        if iid in self.excluded:
+            self.excluded.remove(iid)
+            self.tree.set(iid, 'Include', 'Yes')
+        else:
+            self.excluded.add(iid)
+            self.tree.set(iid, 'Include', 'No')
+
+    def ingest(self):
+        """backs up the included playthroughs
+        """
+        groups = [
+            group for iid, group in self.groups.items()
+            if iid not in self.excluded
+        ]
+        if not groups:
+            return
+
+        self.ingest_button.state(['disabled'])
+        self.rename_button.state(['disabled'])
+        self.name_entry.state(['disabled'])
+        self.tree.state(['disabled'])
+        self.cancel_job = self.controller.save_manager.start_ingest(
+            groups,
+            self.show_progress,
+            self.ingest_done
+        )
+
+    def ingest_done(self, summary):
+        """callback with the ingest summary
+        """
+        self.cancel_job = None
+        self.controller.startpage.refresh_playthroughs()
+        message = "{}Created {:,} playthroughs and backed up {:,} of {:,} saves".format(
+            'Cancelled: ' if summary['cancelled'] else '',
+            summary['playthroughs'],
+            summary['ingested'],
+            summary['total']
+        )
+        if summary['errors']:
+            message += "\n\nErrors:\n" + "\n".join(summary['errors'][:20])
+        self.controller.show_message(message)
+        if self.winfo_exists():
+            self.destroy()
+
+    def cancel(self):
+        """cancels a running scan or ingest, or closes the window
+        """
+        if self.cancel_job:
+            self.cancel_job.set()
+            self.cancel_button.state(['disabled'])
+            self.status_var.set("Cancelling...")
+        else:
+            self.destroy()
+
+    def closed(self, event):
+        """cancels a running scan or ingest when the window is closed
+        """
+        if event.widget == self and self.cancel_job:
+            self.cancel_job.set()
@@ -4,8 +4,8 @@ Responsible for showing the inventory to backup mapping
 """
 import tkinter as tk
 from tkinter import ttk
+from time import ctime
 from .new_page_root import NewPageRoot
-from os import path
 
 class Inventory(NewPageRoot):
     """shows the X4 save to backup mapping
@@ -41,6 +41,7 @@ class Inventory(NewPageRoot):
             'Branch',
             'Character',
             'Money',
+            'Version',
             'Notes'
         )
         self.tree = ttk.Treeview(
@@ -68,39 +69,96 @@ class Inventory(NewPageRoot):
         self.tree.heading('Character', text='Character')
         self.tree.column('Money', width=100, anchor='w')
         self.tree.heading('Money', text='Money')
+        self.tree.column('Version', width=100, anchor='w')
+        self.tree.heading('Version', text='Version')
         self.tree.column('Notes', width=200, anchor='w')
         self.tree.heading('Notes', text='Notes')
 
-        # display the window, show a wait cursor and populate the page
-        # the window must be displayed in order for the wait cursor to be
-        # displayed
-        self.controller.set_cursor(type="wait")
+        self.cancel_inventory = None
+        self.bind('<Destroy>', self.closed)
+
+        # the saves are listed straight away, their backups are filled in
+        # as the saves are hashed in the background
         self.show_window()
         self.populate_tree()
-        self.controller.set_cursor(type='')
-        
 
     def populate_tree(self):
-        # populate the tree with saves that match the selected playthrough
-        for save in self.controller.save_manager.inventory_saves():
-            if save['backup']:
-                playthrough = self.controller.db.get_playthrough_by_id(
-                    save['backup']['playthrough_id']
-                )['name']
-                self.tree.insert('', 'end', text=save['save_file'].name, values=(
-                    playthrough,
-                    save['backup']['backup_filename'],
-                    save['backup']['x4_save_time'],
-                    "{:0.2f}".format(save['backup']['playtime']/60/60),
-                    save['backup']['branch'],
-                    save['backup']['character_name'],
-                    "${:,.0f}".format(save['backup']['money']),
-                    save['backup']['notes'].partition('\n')[0]
+        # list the saves, and look up their backups in the background
+        saves = self.controller.save_manager.list_saves()
+        for save in saves:
+            self.tree.insert('', 'end', iid=save['path'], text=save['name'], values=(
+                '',
+                'checking...',
+                '',
+                '',
+                '',
+                '',
+                '',
+                '',
+                ''
+            ))
+        self.cancel_inventory = self.controller.save_manager.start_inventory(
+            saves,
+            self.show_backups,
+            self.inventory_done
+        )
+
+    def show_backups(self, saves):
+        """callback with the backups of a batch of hashed saves, and the
+        header of the saves that aren't backed up once they are read
+
+        Args:
+            saves (dict): {file_path: (file_hash, backup, header, error)}
+        """
+        if not self.winfo_exists():
+            return
+
+        for path, (hash, backup, header, error) in saves.items():
+            if not self.tree.exists(path):
+                continue
+
+            if backup:
+                self.tree.item(path, values=(
+                    backup['playthrough'],
+                    backup['backup_filename'],
+                    backup['x4_save_time'],
+                    "{:0.2f}".format(backup['playtime']/60/60),
+                    backup['branch'],
+                    backup['character_name'],
+                    "${:,.0f}".format(backup['money']),
+                    backup['game_version'],
+                    backup['notes'].partition('\n')[0]
+                ))
+            elif header:
+                self.tree.item(path, values=(
+                    '',
+                    'None',
+                    ctime(float(header['save_time'])) if header['save_time'] else '',
+                    "{:0.2f}".format(float(header['gametime'])/60/60) if header['gametime'] else '',
+                    '',
+                    header['playername'],
+                    "${:,.0f}".format(float(header['money'])) if header['money'] else '',
+                    header['game_version'],
+                    ''
+                ))
+            elif error:
+                # the save couldn't be hashed, or its header couldn't be read
+                self.tree.item(path, values=(
+                    '',
+                    'None' if hash else '',
+                    'unreadable',
+                    '',
+                    '',
+                    '',
+                    '',
+                    '',
+                    ''
                 ))
             else:
-                self.tree.insert('', 'end', text=save['save_file'].name, values=(
+                self.tree.item(path, values=(
                     '',
                     'None',
+                    'reading...',
                     '',
                     '',
                     '',
@@ -108,3 +166,29 @@ class Inventory(NewPageRoot):
                     '',
                     ''
                 ))
+
+    def inventory_done(self, errors):
+        """callback once all the saves are resolved, clears the saves
+        whose header wasn't read and shows the saves that couldn't be read
+
+        Args:
+            errors (list): the saves that couldn't be hashed or read
+        """
+        self.cancel_inventory = None
+        if not self.winfo_exists():
+            return
+
+        for path in self.tree.get_children():
+            if self.tree.set(path, 'SaveTime') == 'reading...':
+                self.tree.set(path, 'SaveTime', '')
+        if errors:
+            self.controller.show_error("{} X4 saves could not be read:\n{}".format(
+                len(errors),
+                "\n".join(errors[:10])
+            ))
+
+    def closed(self, event):
+        """stops hashing the saves when the window is closed
+        """
+        if event.widget == self and self.cancel_inventory:
+            self.cancel_inventory.set()
@@ -9,6 +9,8 @@ from .settings_page import Settings
 from .playthrough_page import Playthrough
 from .about_page import About
 from .inventory_page import Inventory
+from .reconcile_page import Reconcile
+from .bulk_ingest_page import BulkIngest
 
 if TYPE_CHECKING:
     from modules.gui import WindowController
@@ -27,6 +29,8 @@ class MainMenu():
         self.about = None
         self.add_playthrough = None
         self.inventory = None
+        self.reconcile = None
+        self.bulk_ingest = None
         #create our top level menu's
         menubar = Menu(controller)
         self.controller['menu'] = menubar
@@ -45,6 +49,10 @@ class MainMenu():
             label='Create Playthrough',
             command=self.open_add_playthrough
         )
+        self.menu_file.add_command(
+            label='Merge Library',
+            command=self.merge_library
+        )
         self.menu_file.add_separator()
         self.menu_file.add_command(label='Exit', command=self.controller.destroy)
 
@@ -57,6 +65,14 @@ class MainMenu():
             label='Delete Selected Playthrough',
             command=self.delete_playthrough
         )
+        self.menu_edit.add_command(
+            label='Archive Selected Playthrough',
+            command=self.archive_playthrough
+        )
+        self.menu_edit.add_command(
+            label='Unarchive Selected Playthrough',
+            command=self.unarchive_playthrough
+        )
         self.menu_edit.add_separator()
         self.menu_edit.add_command(label='Settings', command=self.open_settings)
 
@@ -76,6 +92,14 @@ class MainMenu():
             label='Import and Re-Index old backups',
             command=self.import_backups
         )
+        self.menu_backup.add_command(
+            label='Reconcile Backup Folder',
+            command=self.reconcile_backups
+        )
+        self.menu_backup.add_command(
+            label='Ingest X4 Save Folder',
+            command=self.ingest_saves
+        )
         self.menu_backup.add_command(
             label='Mark Old Backups For Deletion',
             command=self.mark_old_backups
@@ -116,13 +140,53 @@ class MainMenu():
         """
         if self.inventory == None:
             self.inventory = Inventory(self, self.controller)
-            self.inventory.bind('<Destroy>', self.add_inventory_closed)
+            self.inventory.bind('<Destroy>', self.add_inventory_closed, add='+')
         else:
             self.inventory.focus()
 
     def import_backups(self):
         self.controller.save_manager.import_backups()
 
+    def merge_library(self):
+        self.controller.save_manager.merge_library()
+
+    def reconcile_backups(self):
+        """Opens the reconcile window
+
+        Used to only open 1 reconcile window at a time
+        """
+        if self.reconcile == None:
+            self.reconcile = Reconcile(self, self.controller)
+            self.reconcile.bind('<Destroy>', self.reconcile_closed, add='+')
+        else:
+            self.reconcile.focus()
+
+    def reconcile_closed(self, event):
+        """Callback when the reconcile window is closed
+
+        the Destroy event is also sent for every child widget,
+        so we only reset when the window itself is destroyed
+        """
+        if event.widget == self.reconcile:
+            self.reconcile = None
+
+    def ingest_saves(self):
+        """Opens the bulk ingest window
+
+        Used to only open 1 bulk ingest window at a time
+        """
+        if self.bulk_ingest == None:
+            self.bulk_ingest = BulkIngest(self, self.controller)
+            self.bulk_ingest.bind('<Destroy>', self.bulk_ingest_closed, add='+')
+        else:
+            self.bulk_ingest.focus()
+
+    def bulk_ingest_closed(self, event):
+        """Callback when the bulk ingest window is closed
+        """
+        if event.widget == self.bulk_ingest:
+            self.bulk_ingest = None
+
     def add_inventory_closed(self, *args):
         """Callback when the inventory screen is closed
         
@@ -132,14 +196,18 @@ class MainMenu():
 
     def mark_old_backups(self):
         self.controller.save_manager.mark_old_backups()
-        self.controller.startpage.populate_tree()
 
     def delete_backups(self):
         self.controller.save_manager.delete_backups()
-        self.controller.startpage.populate_tree()
     
     def delete_playthrough(self):
         self.controller.playthrough_manager.delete_playthrough()
+
+    def archive_playthrough(self):
+        self.controller.playthrough_manager.archive_playthrough()
+
+    def unarchive_playthrough(self):
+        self.controller.playthrough_manager.unarchive_playthrough()
     
     def open_settings(self):
         """Open the application settings window
@@ -0,0 +1,102 @@
+"""Progress Class
+
+Responsible for showing the progress of long running background
+operations, and allowing the user to cancel them
+"""
+import tkinter as tk
+from tkinter import ttk
+from .new_page_root import NewPageRoot
+
+class Progress(NewPageRoot):
+    """shows a progress bar, a status line and a cancel button
+    """
+    def __init__(self, caller, controller, title, on_cancel=None):
+        """Constructor
+
+        Args:
+            caller (tk.Tk): the caller object
+            controller (WindowController): the application controller
+            title (str): the window title
+            on_cancel (function): called when the user presses cancel
+        """
+        super().__init__(caller, controller)
+
+        self.set_title(title)
+        self.minsize(450,100)
+        self.on_cancel = on_cancel
+        self.status_var = tk.StringVar()
+        self.count_var = tk.StringVar()
+
+        ttk.Label(
+            self,
+            textvariable=self.status_var,
+            anchor=tk.W
+        ).grid(
+            column=0,
+            row=0,
+            columnspan=2,
+            sticky=(tk.W, tk.E)
+        )
+        self.progressbar = ttk.Progressbar(
+            self,
+            orient='horizontal',
+            mode='determinate',
+            length=430
+        )
+        self.progressbar.grid(
+            column=0,
+            row=1,
+            columnspan=2,
+            pady=5,
+            sticky=(tk.W, tk.E)
+        )
+        ttk.Label(
+            self,
+            textvariable=self.count_var,
+            anchor=tk.W
+        ).grid(
+            column=0,
+            row=2,
+            sticky=(tk.W, tk.E)
+        )
+        self.cancel_button = ttk.Button(
+            self,
+            text="Cancel",
+            command=self.cancel
+        )
+        self.cancel_button.grid(
+            column=1,
+            row=2,
+            sticky=tk.E
+        )
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        self.show_window()
+
+    def set_progress(self, done, total, status=None):
+        """updates the progress bar and the status line
+
+        Args:
+            done (int): the number of items processed
+            total (int): the total number of items
+            status (str): the status line text
+        """
+        self.progressbar['maximum'] = max(total, 1)
+        self.progressbar['value'] = done
+        self.count_var.set("{:,} of {:,}".format(done, total))
+        if status is not None:
+            self.status_var.set(status)
+
+    def cancel(self):
+        """callback for the cancel button and the window close button.
+        The window stays open until the operation has stopped
+        """
+        self.cancel_button.state(['disabled'])
+        self.status_var.set("Cancelling...")
+        if self.on_cancel:
+            self.on_cancel()
+
+    def finish(self):
+        """closes the progress window once the operation has stopped
+        """
+        self.destroy()
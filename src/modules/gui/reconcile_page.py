@@ -0,0 +1,260 @@
+"""Reconcile Class
+
+Responsible for showing the differences between the backup folder
+and the database
+"""
+import tkinter as tk
+from tkinter import ttk
+from .new_page_root import NewPageRoot
+
+class Reconcile(NewPageRoot):
+    """runs a reconciliation scan and shows its report
+    """
+    def __init__(self, caller, controller):
+        """Constructor
+
+        Args:
+            caller (tk.Tk): the caller object
+            controller (WindowController): the application controller
+        """
+        super().__init__(caller, controller)
+
+        self.set_title("Reconcile Backup Folder")
+        self.minsize(800,300)
+        self.status_var = tk.StringVar()
+        self.report = None
+        self.cancel_scan = None
+
+        tree_frame = tk.Frame(
+            self
+        )
+        tree_frame.grid(
+            column=0,
+            row=0,
+            sticky=(tk.W, tk.N, tk.E, tk.S)
+        )
+        tree_frame.grid_columnconfigure(0, weight=1)
+        tree_frame.grid_rowconfigure(0, weight=1)
+        self.tree = ttk.Treeview(
+            tree_frame,
+            columns=(
+                'Status',
+                'BackupFile',
+                'Details'
+            ),
+            show='headings',
+            selectmode='none'
+        )
+        self.tree.grid(
+            column=0,
+            row=0,
+            sticky=(tk.N, tk.E, tk.S, tk.W)
+        )
+        tree_v_scroll = ttk.Scrollbar(
+            tree_frame,
+            orient='vertical',
+            command=self.tree.yview
+        )
+        self.tree['yscrollcommand'] = tree_v_scroll.set
+        tree_v_scroll.grid(
+            column=1,
+            row=0,
+            sticky=(tk.N, tk.S)
+        )
+
+        self.tree.column('Status', width=100, anchor='w')
+        self.tree.heading('Status', text='Status')
+        self.tree.column('BackupFile', width=220, anchor='w')
+        self.tree.heading('BackupFile', text='BackupFile')
+        self.tree.column('Details', width=400, anchor='w')
+        self.tree.heading('Details', text='Details')
+
+        bottom_frame = tk.Frame(
+            self
+        )
+        bottom_frame.grid(
+            column=0,
+            row=1,
+            sticky=(tk.W, tk.E),
+            pady=(5,0)
+        )
+        bottom_frame.grid_columnconfigure(0, weight=1)
+        ttk.Label(
+            bottom_frame,
+            textvariable=self.status_var,
+            anchor=tk.W
+        ).grid(
+            column=0,
+            row=0,
+            sticky=(tk.W, tk.E)
+        )
+        self.progressbar = ttk.Progressbar(
+            bottom_frame,
+            orient='horizontal',
+            mode='determinate',
+            length=150
+        )
+        self.progressbar.grid(
+            column=1,
+            row=0,
+            padx=2
+        )
+        self.fix_button = ttk.Button(
+            bottom_frame,
+            text="Fix Renamed",
+            command=self.fix_renamed,
+            state='disabled'
+        )
+        self.fix_button.grid(
+            column=2,
+            row=0,
+            padx=2
+        )
+        self.import_button = ttk.Button(
+            bottom_frame,
+            text="Import Orphans",
+            command=self.import_orphans,
+            state='disabled'
+        )
+        self.import_button.grid(
+            column=3,
+            row=0,
+            padx=2
+        )
+        self.rescan_button = ttk.Button(
+            bottom_frame,
+            text="Rescan",
+            command=self.scan,
+            state='disabled'
+        )
+        self.rescan_button.grid(
+            column=4,
+            row=0,
+            padx=2
+        )
+        self.bind('<Destroy>', self.closed)
+
+        self.show_window()
+        self.scan()
+
+    def scan(self):
+        """starts a reconciliation scan
+        """
+        for button in (self.fix_button, self.import_button, self.rescan_button):
+            button.state(['disabled'])
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self.status_var.set("Scanning the backup folder...")
+        self.progressbar['value'] = 0
+        self.cancel_scan = self.controller.save_manager.start_reconcile(
+            self.show_progress,
+            self.show_report
+        )
+
+    def show_progress(self, done, total, status):
+        """callback with the scan progress
+        """
+        if not self.winfo_exists():
+            return
+
+        self.progressbar['maximum'] = max(total, 1)
+        self.progressbar['value'] = done
+        self.status_var.set("{} ({:,} of {:,})".format(status, done, total))
+
+    def show_report(self, report):
+        """callback with the reconciliation report
+
+        Args:
+            report (dict): the report created by SaveManager.reconcile_thread
+        """
+        if not self.winfo_exists():
+            return
+
+        self.cancel_scan = None
+        self.report = report
+        self.progressbar['value'] = self.progressbar['maximum']
+
+        for name in report['orphans']:
+            self.tree.insert('', 'end', values=(
+                'orphan',
+                name,
+                'not in the database'
+            ))
+        for backup in report['missing']:
+            self.tree.insert('', 'end', values=(
+                'missing',
+                backup['backup_filename'],
+                'backup file not found'
+            ))
+        for backup in report['renamed']:
+            self.tree.insert('', 'end', values=(
+                'renamed',
+                backup['backup_filename'],
+                "was {}".format(backup['old_filename'])
+            ))
+        for name in report['modified']:
+            self.tree.insert('', 'end', values=(
+                'modified',
+                name,
+                'contents differ from the backup in the database'
+            ))
+        for name in report['duplicates']:
+            self.tree.insert('', 'end', values=(
+                'duplicate',
+                name,
+                'copy of a backup stored under another name'
+            ))
+        for error in report['errors']:
+            self.tree.insert('', 'end', values=(
+                'error',
+                '',
+                error
+            ))
+
+        self.status_var.set(
+            "{}{:,} files, {:,} backups, {:,} ok, {} orphan, {} missing, {} renamed, {} modified in {:0.2f} seconds".format(
+                'Cancelled: ' if report['cancelled'] else '',
+                report['files'],
+                report['backups'],
+                report['ok'],
+                len(report['orphans']),
+                len(report['missing']),
+                len(report['renamed']),
+                len(report['modified']),
+                report['seconds']
+            )
+        )
+        self.rescan_button.state(['!disabled'])
+        if report['renamed']:
+            self.fix_button.state(['!disabled'])
+        if report['orphans']:
+            self.import_button.state(['!disabled'])
+
+    def fix_renamed(self):
+        """updates the database with the new names of the renamed backups
+        """
+        self.fix_button.state(['disabled'])
+        self.controller.save_manager.fix_renamed_backups(
+            self.report['renamed'],
+            on_done=self.renamed_fixed
+        )
+
+    def renamed_fixed(self, count):
+        """callback once the renamed backups are updated, scans the
+        backup folder again
+        """
+        self.controller.startpage.populate_tree()
+        if self.winfo_exists():
+            self.scan()
+
+    def import_orphans(self):
+        """imports the orphan files with the import process, which skips
+        the files that are already in the database without reading them
+        """
+        self.controller.save_manager.import_backups()
+
+    def closed(self, event):
+        """cancels a running scan when the window is closed
+        """
+        if event.widget == self and self.cancel_scan:
+            self.cancel_scan.set()
@@ -0,0 +1,240 @@
+"""Search Class
+
+Responsible for showing the full text search results for the backup and
+playthrough notes across all playthroughs
+"""
+import tkinter as tk
+from tkinter import ttk
+from .new_page_root import NewPageRoot
+from .backup_page import Backup
+
+class Search(NewPageRoot):
+    """shows ranked, paged search results across all playthroughs
+    """
+    page_size = 50
+
+    def __init__(self, caller, controller, text=''):
+        """Constructor
+
+        Args:
+            caller (tk.Tk): the caller object
+            controller (WindowController): the application controller
+            text (str): the initial text to search for
+        """
+        super().__init__(caller, controller)
+
+        self.set_title("Search Notes")
+        self.minsize(800,300)
+        self.search_var = tk.StringVar()
+        self.status_var = tk.StringVar()
+        self.page = 0
+        self.hits = []
+
+        search_frame = tk.Frame(
+            self
+        )
+        search_frame.grid(
+            column=0,
+            row=0,
+            sticky=(tk.W, tk.E),
+            pady=(0,5)
+        )
+        search_frame.grid_columnconfigure(1, weight=1)
+        ttk.Label(search_frame, text="Search:").grid(
+            column=0,
+            row=0,
+            sticky=tk.E
+        )
+        self.search_entry = ttk.Entry(
+            search_frame,
+            textvariable=self.search_var
+        )
+        self.search_entry.grid(
+            column=1,
+            row=0,
+            padx=2,
+            sticky=(tk.E, tk.W)
+        )
+        ttk.Button(
+            search_frame,
+            text="Search",
+            command=self.new_search
+        ).grid(
+            column=2,
+            row=0,
+            padx=2
+        )
+        self.search_entry.bind("<Return>", self.new_search)
+
+        tree_frame = tk.Frame(
+            self
+        )
+        tree_frame.grid(
+            column=0,
+            row=1,
+            sticky=(tk.W, tk.N, tk.E, tk.S)
+        )
+        tree_frame.grid_columnconfigure(0, weight=1)
+        tree_frame.grid_rowconfigure(0, weight=1)
+        self.rowconfigure(0, weight=0)
+        self.rowconfigure(1, weight=1)
+        self.tree = ttk.Treeview(
+            tree_frame,
+            columns=(
+                'Type',
+                'Playthrough',
+                'BackupFile',
+                'SaveTime',
+                'Match'
+            ),
+            show='headings',
+            selectmode='browse'
+        )
+        self.tree.grid(
+            column=0,
+            row=0,
+            sticky=(tk.N, tk.E, tk.S, tk.W)
+        )
+        tree_v_scroll = ttk.Scrollbar(
+            tree_frame,
+            orient='vertical',
+            command=self.tree.yview
+        )
+        self.tree['yscrollcommand'] = tree_v_scroll.set
+        tree_v_scroll.grid(
+            column=1,
+            row=0,
+            sticky=(tk.N, tk.S)
+        )
+
+        self.tree.column('Type', width=80, anchor='w')
+        self.tree.heading('Type', text='Type')
+        self.tree.column('Playthrough', width=160, anchor='w')
+        self.tree.heading('Playthrough', text='Playthrough')
+        self.tree.column('BackupFile', width=180, anchor='w')
+        self.tree.heading('BackupFile', text='BackupFile')
+        self.tree.column('SaveTime', width=160, anchor='w')
+        self.tree.heading('SaveTime', text='SaveTime')
+        self.tree.column('Match', width=300, anchor='w')
+        self.tree.heading('Match', text='Match')
+        self.tree.bind("<Double-1>", self.open_hit)
+
+        bottom_frame = tk.Frame(
+            self
+        )
+        bottom_frame.grid(
+            column=0,
+            row=2,
+            sticky=(tk.W, tk.E),
+            pady=(5,0)
+        )
+        bottom_frame.grid_columnconfigure(0, weight=1)
+        ttk.Label(
+            bottom_frame,
+            textvariable=self.status_var,
+            anchor=tk.W
+        ).grid(
+            column=0,
+            row=0,
+            sticky=(tk.W, tk.E)
+        )
+        self.prev_button = ttk.Button(
+            bottom_frame,
+            text="Previous",
+            command=self.previous_page,
+            state='disabled'
+        )
+        self.prev_button.grid(
+            column=1,
+            row=0,
+            padx=2
+        )
+        self.next_button = ttk.Button(
+            bottom_frame,
+            text="Next",
+            command=self.next_page,
+            state='disabled'
+        )
+        self.next_button.grid(
+            column=2,
+            row=0,
+            padx=2
+        )
+
+        self.show_window()
+        self.search(text)
+
+    def search(self, text):
+        """starts a new search for text, showing the first page of results
+
+        Args:
+            text (str): the text to search for
+        """
+        self.search_var.set(text)
+        self.page = 0
+        self.populate_tree()
+
+    def new_search(self, *args):
+        """callback for the search button and the return key
+        """
+        self.search(self.search_var.get())
+
+    def next_page(self):
+        self.page += 1
+        self.populate_tree()
+
+    def previous_page(self):
+        if self.page > 0:
+            self.page -= 1
+        self.populate_tree()
+
+    def populate_tree(self):
+        """runs the search for the current page and populates the treeview
+        """
+        # we ask for one extra hit to know if there is a next page
+        hits = self.controller.db.search(
+            self.search_var.get(),
+            limit=self.page_size + 1,
+            offset=self.page * self.page_size
+        ) or []
+        has_next = len(hits) > self.page_size
+        self.hits = hits[:self.page_size]
+
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+
+        for index, hit in enumerate(self.hits):
+            self.tree.insert('', 'end', iid=index, values=(
+                hit['kind'],
+                hit['playthrough_name'] or '',
+                hit['backup_filename'] or '',
+                hit['x4_save_time'],
+                " ".join(hit['snippet'].split())
+            ))
+
+        if self.hits:
+            self.status_var.set("Showing results {} to {}".format(
+                self.page * self.page_size + 1,
+                self.page * self.page_size + len(self.hits)
+            ))
+        else:
+            self.status_var.set("No results found")
+
+        self.prev_button.state(['!disabled' if self.page > 0 else 'disabled'])
+        self.next_button.state(['!disabled' if has_next else 'disabled'])
+
+    def open_hit(self, event):
+        """Callback when a search result is double clicked
+
+        backups are opened in the edit backup window, and playthroughs are
+        selected on the main page
+        """
+        index = self.tree.selection()
+        if not index:
+            return
+
+        hit = self.hits[int(index[0])]
+        if hit['kind'] == 'backup':
+            Backup(self, self.controller, hit['file_hash'])
+        elif hit['playthrough_name']:
+            self.controller.startpage.show_playthrough(hit['playthrough_name'])
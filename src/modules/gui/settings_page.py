@@ -7,7 +7,7 @@ from .messages import MessageWindow
 from .new_page_root import NewPageRoot
 from os import path
 from pathlib import PurePath
-from modules.app import Validate
+from modules.app import Validate, Formatter
 from idlelib.tooltip import Hovertip
 
 class Settings(NewPageRoot):
@@ -30,6 +30,11 @@ class Settings(NewPageRoot):
         self.backup_path_text = tk.StringVar()
         self.old_backup_days_text = tk.StringVar()
         self.do_not_delete_backups_text = tk.StringVar()
+        self.keep_hourly_text = tk.StringVar()
+        self.keep_daily_text = tk.StringVar()
+        self.keep_weekly_text = tk.StringVar()
+        self.retention_preview_text = tk.StringVar()
+        self.quota_text = tk.StringVar()
         self.x4save_path_text = tk.StringVar()
         self.backup_frequency_text = tk.StringVar()
         self.check_int_wrapper = (
@@ -155,6 +160,35 @@ class Settings(NewPageRoot):
             "The number of seconds to wait\nbefore checking for new X4 Save files"
         )
 
+        ttk.Label(backup_page, text='Backup Quota (MB):').grid(
+            column=0,
+            row=2,
+            sticky=tk.W
+        )
+        self.quota = tk.Entry(
+            backup_page,
+            textvariable=self.quota_text,
+            validate='key',
+            validatecommand=self.check_int_wrapper
+        )
+        self.quota.grid(
+            column=1,
+            row=2,
+            sticky=(tk.W, tk.E)
+        )
+        Hovertip(
+            self.quota,
+            """Keep the backup folder under this size. 0 disables the quota.
+
+After every backup, backups are deleted until the quota is met:
+backups marked for deletion first, then the oldest autosaves,
+quicksaves and normal saves, in that order of preference.
+
+NOTE:
+  flagged backups, the latest backup of every playthrough branch
+  and savetypes that are not eligible for deletion are never deleted."""
+        )
+
         pruning_frame = tk.LabelFrame(
             backup_page,
             text="Backup Pruning/Deletion settings"
@@ -361,9 +395,166 @@ Note:
   In the X4 load screen, these correlate to the 1 through 10 save slots"""
         )
 
+        retention_tiers = (
+            ('Keep hourly backups for (hours):', 'keep_hourly', 'hour'),
+            ('Keep daily backups for (days):', 'keep_daily', 'day'),
+            ('Keep weekly backups for (weeks):', 'keep_weekly', 'week'),
+        )
+        for row, (label, name, period) in enumerate(retention_tiers, start=7):
+            tk.Label(pruning_frame, text=label).grid(
+                column=0,
+                row=row,
+                pady=2,
+                sticky=tk.E
+            )
+            entry = tk.Entry(
+                pruning_frame,
+                textvariable=getattr(self, "{}_text".format(name)),
+                validate='key',
+                validatecommand=self.check_int_wrapper
+            )
+            entry.grid(
+                column=1,
+                row=row,
+                sticky=(tk.W, tk.E)
+            )
+            setattr(self, name, entry)
+            Hovertip(
+                entry,
+                """Keep the latest backup of every {0} of a playthrough branch
+while it's younger than this, even if it's an old backup.
+0 disables this tier.
+
+NOTE:
+  ages are counted from now, so this tier only keeps backups
+  when it's longer than the "Old Backups (days)" setting.""".format(period)
+            )
+
+        ttk.Button(
+            pruning_frame,
+            text='Preview',
+            command=self.preview_retention
+        ).grid(
+            column=0,
+            row=10,
+            pady=2,
+            sticky=tk.E
+        )
+        ttk.Label(
+            pruning_frame,
+            textvariable=self.retention_preview_text,
+            anchor=tk.W
+        ).grid(
+            column=1,
+            row=10,
+            sticky=(tk.W, tk.E)
+        )
+
+        # database details page
+        db_page = ttk.Frame(nb, padding=5)
+        db_page.grid_columnconfigure(1, weight=1)
+        self.cache_info_text = tk.StringVar()
+        self.db_size_text = tk.StringVar()
+        self.free_pages_text = tk.StringVar()
+        self.integrity_text = tk.StringVar()
+
+        ttk.Label(db_page, text='Query Cache:').grid(
+            column=0,
+            row=0,
+            sticky=(tk.W, tk.N)
+        )
+        cache_info = ttk.Label(
+            db_page,
+            textvariable=self.cache_info_text,
+            anchor=tk.W
+        )
+        cache_info.grid(
+            column=1,
+            row=0,
+            sticky=(tk.W, tk.E)
+        )
+        ttk.Button(
+            db_page,
+            text='Refresh',
+            command=self.refresh_db_info
+        ).grid(
+            column=2,
+            row=0,
+            sticky=(tk.E, tk.N),
+            padx=2
+        )
+        Hovertip(
+            cache_info,
+            """Repeated queries from the main window are answered from
+the query cache instead of the database. Hits are queries
+that did not touch the database."""
+        )
+        ttk.Label(db_page, text='Database Size:').grid(
+            column=0,
+            row=1,
+            sticky=(tk.W, tk.N)
+        )
+        ttk.Label(
+            db_page,
+            textvariable=self.db_size_text,
+            anchor=tk.W
+        ).grid(
+            column=1,
+            row=1,
+            sticky=(tk.W, tk.E)
+        )
+        ttk.Label(db_page, text='Free Pages:').grid(
+            column=0,
+            row=2,
+            sticky=(tk.W, tk.N)
+        )
+        free_pages = ttk.Label(
+            db_page,
+            textvariable=self.free_pages_text,
+            anchor=tk.W
+        )
+        free_pages.grid(
+            column=1,
+            row=2,
+            sticky=(tk.W, tk.E)
+        )
+        Hovertip(
+            free_pages,
+            """Pages left unused by deleted backups.
+They are given back to the file system in small steps
+while the application is idle."""
+        )
+        ttk.Label(db_page, text='Integrity Check:').grid(
+            column=0,
+            row=3,
+            sticky=(tk.W, tk.N)
+        )
+        ttk.Label(
+            db_page,
+            textvariable=self.integrity_text,
+            anchor=tk.W
+        ).grid(
+            column=1,
+            row=3,
+            sticky=(tk.W, tk.E)
+        )
+        self.integrity_button = ttk.Button(
+            db_page,
+            text='Run Check',
+            command=self.run_integrity_check
+        )
+        self.integrity_button.grid(
+            column=2,
+            row=3,
+            sticky=(tk.E, tk.N),
+            padx=2
+        )
+        self.integrity_text.set('not run')
+
         # add the pages to our notebook
         nb.add(app_page, text="App Settings")
         nb.add(backup_page, text="Backup Settings")
+        nb.add(db_page, text="Database")
         nb.grid(
             column=0,
             columnspan=4,
@@ -414,12 +605,17 @@ Note:
         )
         
         self.get_settings()
+        self.refresh_db_info()
         self.db_path_text.trace_add('write', self.check_changes)
         self.backup_path_text.trace_add('write', self.check_changes)
         self.x4save_path_text.trace_add('write', self.check_changes)
         self.backup_frequency_text.trace_add('write', self.check_changes)
         self.old_backup_days_text.trace_add('write', self.check_changes)
         self.do_not_delete_backups_text.trace_add('write', self.check_changes)
+        self.keep_hourly_text.trace_add('write', self.check_changes)
+        self.keep_daily_text.trace_add('write', self.check_changes)
+        self.keep_weekly_text.trace_add('write', self.check_changes)
+        self.quota_text.trace_add('write', self.check_changes)
         self.protocol("WM_DELETE_WINDOW", self.close)
         
         self.show_window()
@@ -450,6 +646,30 @@ Note:
                 category='BACKUP'
             )
         )
+        self.keep_hourly_text.set(
+            self.controller.app_settings.get_app_setting(
+                'KEEP_HOURLY',
+                category='BACKUP'
+            )
+        )
+        self.keep_daily_text.set(
+            self.controller.app_settings.get_app_setting(
+                'KEEP_DAILY',
+                category='BACKUP'
+            )
+        )
+        self.keep_weekly_text.set(
+            self.controller.app_settings.get_app_setting(
+                'KEEP_WEEKLY',
+                category='BACKUP'
+            )
+        )
+        self.quota_text.set(
+            self.controller.app_settings.get_app_setting(
+                'QUOTA_MB',
+                category='BACKUP'
+            )
+        )
         self.backup_frequency_text.set(
             self.controller.app_settings.get_app_setting(
                 'BACKUPFREQUENCY_SECONDS',
@@ -487,6 +707,63 @@ Note:
             )
         )
 
+    def refresh_db_info(self):
+        """shows the current database statistics on the database page
+        """
+        cache = self.controller.db.cache_info()
+        self.cache_info_text.set(
+            "{} hits, {} misses, {} of {} entries used".format(
+                cache['hits'],
+                cache['misses'],
+                cache['size'],
+                cache['max_size']
+            )
+        )
+
+        info = self.controller.db.get_db_info()
+        if info:
+            self.db_size_text.set("{} ({:,} pages)".format(
+                Formatter.size(info['size']),
+                info['page_count']
+            ))
+            self.free_pages_text.set("{:,} ({:0.1%}), auto vacuum: {}".format(
+                info['free_pages'],
+                info['free_ratio'],
+                info['auto_vacuum']
+            ))
+
+    def run_integrity_check(self):
+        """runs the database integrity check on the DB worker thread
+        """
+        self.integrity_button.state(['disabled'])
+        self.integrity_text.set('running...')
+        self.controller.db_worker.submit(
+            'integrity_check',
+            key='integrity_check',
+            callback=self.show_integrity_check
+        )
+
+    def show_integrity_check(self, check):
+        """Callback which displays the results of run_integrity_check
+
+        Args:
+            check (dict): the integrity check results
+        """
+        if not self.winfo_exists():
+            return
+
+        self.integrity_button.state(['!disabled'])
+        if not check:
+            self.integrity_text.set('failed to run')
+            return
+
+        self.integrity_text.set("{} in {:0.2f} seconds".format(
+            'ok' if check['ok'] else "{} problems found".format(
+                len(check['results'])
+            ),
+            check['seconds']
+        ))
+
     def check_changes(self, *args, clear_status=True):
         """callback to detect changes and enable/disable the save button
 
@@ -555,6 +832,20 @@ Note:
         else:
             self.do_not_delete_backups.config(background="White")
 
+        for name in ('KEEP_HOURLY', 'KEEP_DAILY', 'KEEP_WEEKLY', 'QUOTA_MB'):
+            entry = getattr(self, name.lower().replace('_mb', ''))
+            if ( len(entry.get()) > 0
+                 and not int(entry.get()) ==
+                 self.controller.app_settings.get_app_setting(
+                    name,
+                    category="BACKUP"
+                 )
+               ):
+                data_changed = True
+                entry.config(background="Yellow")
+            else:
+                entry.config(background="White")
+
         if (
             self.controller.app_settings.get_app_setting(
                 "DELETE_QUICKSAVES",
@@ -600,6 +891,42 @@ Note:
         else:
             self.save.state(['disabled'])
             
+    def preview_retention(self):
+        """callback for the pruning preview button
+
+        shows how many backups pruning would mark for deletion with the
+        settings as they are entered, without saving them
+        """
+        policy = {
+            'DELETE_OLD_DAYS': int(self.old_backup_days.get() or 0),
+            'DO_NOT_DELETE_LAST': int(self.do_not_delete_backups.get() or 0),
+            'DELETE_QUICKSAVES': self.delete_quicksaves_var.get(),
+            'DELETE_AUTOSAVES': self.delete_autosaves_var.get(),
+            'DELETE_SAVES': self.delete_saves_var.get(),
+            'KEEP_HOURLY': int(self.keep_hourly.get() or 0),
+            'KEEP_DAILY': int(self.keep_daily.get() or 0),
+            'KEEP_WEEKLY': int(self.keep_weekly.get() or 0)
+        }
+        self.controller.db_worker.submit(
+            'preview_retention',
+            policy,
+            key='retention_preview',
+            callback=self.show_retention_preview
+        )
+
+    def show_retention_preview(self, preview):
+        """callback with the pruning dry run results
+        """
+        if not self.winfo_exists():
+            return
+
+        self.retention_preview_text.set(
+            "{:,} backups ({}) would be marked for deletion".format(
+                preview['count'],
+                Formatter.size(preview['bytes'])
+            )
+        )
+
     def flag_change(self):
         """Callback for the checkboxes on change
         """
@@ -654,6 +981,17 @@ Note:
             int(self.do_not_delete_backups.get()),
             category="BACKUP"
         )
+        for name in ('KEEP_HOURLY', 'KEEP_DAILY', 'KEEP_WEEKLY'):
+            self.controller.app_settings.update_app_setting(
+                name,
+                int(getattr(self, name.lower()).get() or 0),
+                category="BACKUP"
+            )
+        self.controller.app_settings.update_app_setting(
+            'QUOTA_MB',
+            int(self.quota.get() or 0),
+            category="BACKUP"
+        )
         self.controller.app_settings.update_app_setting(
             'DELETE_QUICKSAVES',
             self.delete_quicksaves_var.get(),
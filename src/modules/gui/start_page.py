@@ -7,11 +7,15 @@ from typing import TYPE_CHECKING
 
 import tkinter as tk
 import os
+from collections import deque
+from time import ctime
 from tkinter import ttk
-from modules.app import Validate
+from modules.app import Validate, Formatter, BackupListing
 from .messages import MessageWindow
 from .playthrough_page import Playthrough
 from .backup_page import Backup
+from .search_page import Search
+from .virtual_tree import VirtualTree
 
 if TYPE_CHECKING:
     from modules.gui import WindowController
@@ -22,6 +26,21 @@ class StartPage(ttk.Frame):
     Args:
         tk (Frame): inherits from tk.Frame
     """
+    # how often (ms) the backup progress is shown while a backup runs
+    progress_poll_ms = 250
+    # how often (ms) it is checked while the window is minimized
+    progress_poll_minimized_ms = 2000
+    # the number of backups of the session history kept in the backup frame
+    session_history_lines = 200
+    # the number of older backups read from the session log at a time
+    session_history_page = 200
+    # how long (ms) the filter bar waits for the user to stop typing
+    filter_debounce_ms = 300
+    # the choices of the filter bar dropdowns with fixed values
+    filter_choices = {
+        'savetype': ('All', 'autosave', 'quicksave', 'save'),
+        'flag': ('All', 'Flagged', 'Not Flagged')
+    }
 
     def __init__(self, parent, controller: WindowController, **kwargs):
         """initializes the StatusPage
@@ -37,14 +56,33 @@ class StartPage(ttk.Frame):
         self.playthrousghs_var = tk.StringVar()
         self.backup_note_var = tk.StringVar()
         self.backup_flag_checkbox_var = tk.BooleanVar()
+        self.search_var = tk.StringVar()
+        self.stats_var = tk.StringVar()
+        self.search_window = None
         self.modalresult = None
         self.selected_branch = None
         self.user_selected_branch = None
-        self.progressbar_count = self.controller.app_settings.get_app_setting(
-            'BACKUPFREQUENCY_SECONDS',
-            category="BACKUP"
-        )
-        self.last_backup_processed = None
+        self.progress_poller = None
+        self.shown_processing = None
+        self.shown_warning = None
+        self.backup_status_var = tk.StringVar()
+        # the session log ids of the backups in the session history
+        self.history_ids = deque()
+        self.history_limit = self.session_history_lines
+        self.listing = BackupListing([])
+        # the filter bar, see backup_filters
+        self.filter_vars = {
+            'savetype': tk.StringVar(value='All'),
+            'flag': tk.StringVar(value='All'),
+            'game_version': tk.StringVar(value='All'),
+            'character': tk.StringVar(value='All'),
+            'min_hours': tk.StringVar(),
+            'max_hours': tk.StringVar(),
+            'text': tk.StringVar()
+        }
+        self.filter_count_var = tk.StringVar()
+        self.filter_timer = None
+        self.filtered_hashes = None
         self.tree_cursort = {
             'column': 'x4_save_time',
             'direction': 'ASC',
@@ -227,6 +265,31 @@ class StartPage(ttk.Frame):
             row=1,
             sticky=(tk.N, tk.S)
         )
+        ttk.Label(
+            self.backup_data_frame,
+            textvariable=self.backup_status_var,
+            anchor=tk.W
+        ).grid(
+            column=0,
+            columnspan=3,
+            row=2,
+            padx=2,
+            pady=2,
+            sticky=(tk.W, tk.E)
+        )
+        self.earlier_button = ttk.Button(
+            self.backup_data_frame,
+            text="Show Earlier Backups",
+            command=self.show_earlier_history
+        )
+        self.earlier_button.grid(
+            column=3,
+            columnspan=2,
+            row=2,
+            padx=2,
+            pady=2,
+            sticky=tk.E
+        )
         # add a main pane with two sides for resizable East and West sections
         self.pane = tk.PanedWindow(
             self,
@@ -319,6 +382,37 @@ class StartPage(ttk.Frame):
             sticky=(tk.N, tk.S)
         )
 
+        # search section
+        search_frame = ttk.LabelFrame(lframe, text="Search Notes")
+        search_frame.grid_columnconfigure(0, weight=1)
+        search_frame.grid(
+            column=0,
+            row=2,
+            ipadx=5,
+            ipady=3,
+            sticky=(tk.W, tk.E, tk.S)
+        )
+        self.search_entry = ttk.Entry(
+            search_frame,
+            textvariable=self.search_var
+        )
+        self.search_entry.grid(
+            column=0,
+            row=0,
+            padx=2,
+            sticky=(tk.E, tk.W)
+        )
+        ttk.Button(
+            search_frame,
+            text="Search",
+            command=self.open_search
+        ).grid(
+            column=1,
+            row=0,
+            padx=2
+        )
+        self.search_entry.bind("<Return>", self.open_search)
+
         self.playthroughs.bind("<<ListboxSelect>>", self.select_playthrough)
         self.playthroughs.bind("<Double-1>", self.edit_playthrough)
 
@@ -328,7 +422,7 @@ class StartPage(ttk.Frame):
             text='Details',
             padding=5
         )
-        details_frame.grid_rowconfigure(1, weight=1)
+        details_frame.grid_rowconfigure(2, weight=1)
         details_frame.grid_columnconfigure(0, weight=1)
         details_frame.grid(
             column=2,
@@ -380,19 +474,26 @@ class StartPage(ttk.Frame):
             row=1,
             sticky=(tk.W, tk.E)
         )
-
-        tree_frame = tk.Frame(
-            details_frame
+        stats_label = ttk.Label(
+            notes_frame,
+            textvariable=self.stats_var,
+            anchor=tk.W
         )
-        tree_frame.grid(
+        stats_label.grid(
             column=0,
-            row=1,
-            sticky=(tk.W, tk.N, tk.E, tk.S)
+            columnspan=2,
+            row=2,
+            sticky=(tk.W, tk.E),
+            pady=(5,0)
         )
-        tree_frame.grid_columnconfigure(0, weight=1)
-        tree_frame.grid_rowconfigure(0, weight=1)
-        self.tree = ttk.Treeview(
-            tree_frame,
+
+        self.build_filter_bar(details_frame)
+
+        # only the visible backups are in the treeview, the others
+        # are paged in from the backup listing as the list is scrolled
+        self.backup_list = VirtualTree(
+            details_frame,
+            self.fetch_backups,
             columns=(
                 'SaveTime',
                 'Branch',
@@ -415,23 +516,12 @@ class StartPage(ttk.Frame):
                 'Notes'
             )
         )
-        self.tree.grid(
+        self.backup_list.grid(
             column=0,
-            row=0,
-            sticky=(tk.N, tk.E, tk.S, tk.W)
-        )
-
-        tree_v_scroll = ttk.Scrollbar(
-            tree_frame,
-            orient='vertical',
-            command=self.tree.yview
-        )
-        self.tree['yscrollcommand'] = tree_v_scroll.set
-        tree_v_scroll.grid(
-            column=1,
-            row=0,
-            sticky=(tk.N, tk.S)
+            row=2,
+            sticky=(tk.W, tk.N, tk.E, tk.S)
         )
+        self.tree = self.backup_list.tree
 
         self.up_arrow = tk.PhotoImage(
             file=os.path.join(self.controller.approot, 'img', 'up_arrow.png')
@@ -476,13 +566,126 @@ class StartPage(ttk.Frame):
         self.pane.add(lframe, minsize=250)
         self.pane.add(details_frame, minsize=200)
 
+    def build_filter_bar(self, parent):
+        """builds the filter bar above the backup treeview
+
+        Args:
+            parent (tk.Frame): the details frame
+        """
+        filter_frame = ttk.Frame(parent)
+        filter_frame.grid(
+            column=0,
+            row=1,
+            sticky=(tk.W, tk.E),
+            pady=(0,5)
+        )
+        filter_frame.grid_columnconfigure(8, weight=1)
+
+        dropdowns = (
+            ('savetype', 'Type:', 0, 0),
+            ('flag', 'Flag:', 2, 0),
+            ('game_version', 'Version:', 4, 0),
+            ('character', 'Character:', 6, 0)
+        )
+        self.filter_dropdowns = {}
+        for name, text, column, row in dropdowns:
+            ttk.Label(filter_frame, text=text).grid(
+                column=column,
+                row=row,
+                padx=2,
+                sticky=tk.E
+            )
+            dropdown = ttk.Combobox(
+                filter_frame,
+                textvariable=self.filter_vars[name],
+                values=self.filter_choices.get(name, ('All', )),
+                state='readonly',
+                width=12
+            )
+            dropdown.grid(
+                column=column + 1,
+                row=row,
+                padx=2,
+                pady=2,
+                sticky=tk.W
+            )
+            self.filter_dropdowns[name] = dropdown
+
+        ttk.Label(filter_frame, text="Hours:").grid(
+            column=0,
+            row=1,
+            padx=2,
+            sticky=tk.E
+        )
+        hours_frame = ttk.Frame(filter_frame)
+        hours_frame.grid(
+            column=1,
+            row=1,
+            padx=2,
+            pady=2,
+            sticky=tk.W
+        )
+        ttk.Entry(
+            hours_frame,
+            textvariable=self.filter_vars['min_hours'],
+            width=5
+        ).grid(column=0, row=0)
+        ttk.Label(hours_frame, text="to").grid(column=1, row=0, padx=2)
+        ttk.Entry(
+            hours_frame,
+            textvariable=self.filter_vars['max_hours'],
+            width=5
+        ).grid(column=2, row=0)
+
+        ttk.Label(filter_frame, text="Text:").grid(
+            column=2,
+            row=1,
+            padx=2,
+            sticky=tk.E
+        )
+        ttk.Entry(
+            filter_frame,
+            textvariable=self.filter_vars['text']
+        ).grid(
+            column=3,
+            columnspan=4,
+            row=1,
+            padx=2,
+            pady=2,
+            sticky=(tk.W, tk.E)
+        )
+        ttk.Button(
+            filter_frame,
+            text="Clear",
+            command=self.clear_filters_clicked
+        ).grid(
+            column=7,
+            row=1,
+            padx=2,
+            sticky=tk.W
+        )
+        ttk.Label(
+            filter_frame,
+            textvariable=self.filter_count_var,
+            anchor=tk.E
+        ).grid(
+            column=8,
+            row=0,
+            rowspan=2,
+            padx=2,
+            sticky=tk.E
+        )
+
+        for var in self.filter_vars.values():
+            var.trace_add('write', self.filter_changed)
+
     def treeview_right_click(self, event):
         """Right click context menu for the treeview
 
         Allows actions for multiple backups, such as editing and moving
         the backups to another playthrough
         """
-        indexes = self.tree.selection()
+        indexes = self.backup_list.selection()
         menu = tk.Menu(self, tearoff=0)
         
         menu.add_command(label="Edit", command=lambda: self.edit_save(indexes))
@@ -555,7 +758,7 @@ class StartPage(ttk.Frame):
         """Callback to edit the backup that the user double clicked
         in the treeview
         """
-        index = self.tree.selection()
+        index = self.backup_list.selection()
         if index:
             self.edit_save(index)
         
@@ -563,23 +766,19 @@ class StartPage(ttk.Frame):
         """Open the edit backup window
         """
         # we ignore multi-selections and just edit the first selection          
-        item = self.tree.item(indexes[0])
-        Backup(self, self.controller, item['values'][8])
+        Backup(self, self.controller, indexes[0])
         
     def set_backup_deleted(self, indexes):
         """Removes the delete mark from the currently selected backups
         """
 
-        for idx in indexes:
-            item = self.tree.item(idx)
-            hash= item['values'][8]
-            filename=item['text']
+        for hash in indexes:
             backup = self.controller.db.get_backup_by_hash(hash)
             if not backup['flag']:
                 self.controller.db.backup_set_delete(hash)
             else:
                 self.controller.show_error("Can't set backup {} for deletion as it has been flagged".format(
-                    filename
+                    backup['backup_filename']
                 ))
         
         self.populate_tree()
@@ -597,22 +796,24 @@ class StartPage(ttk.Frame):
             return
         
         # figure out which backup is selected, and pass it to save_manager to restore
-        item = self.tree.item(indexes[0])
-        filename=item['text']
-        self.controller.save_manager.restore_backup(filename, slot)
+        hash = indexes[0]
+        backup = self.controller.db.get_backup_by_hash(hash)
+        self.controller.save_manager.restore_backup(backup['backup_filename'], slot, hash)
         
     def set_branch(self, indexes, branch):
         """Sets the branch name on currently selected backups
         """
-        for idx in indexes:
-            item = self.tree.item(idx)
-            hash= item['values'][8]
+        for hash in indexes:
             self.controller.db.set_branch(
                 branch=branch,
                 hash=hash
             )
         
-        self.populate_tree()
+        # the backups leave the listing when another branch is displayed
+        if self.user_selected_branch:
+            self.populate_tree()
+        else:
+            self.patch_tree(indexes)
 
     def display_branch(self, branch):
         if branch == 'All':
@@ -621,16 +822,13 @@ class StartPage(ttk.Frame):
         else:
             self.user_selected_branch = branch
             self.controller.statusbar.set_branch_filter(branch)
-        self.populate_tree()
+        self.populate_tree(reset=True)
 
     def unset_backup_deleted(self, indexes):
         """Removes the delete mark from the currently selected backups
         """
 
-        for idx in indexes:
-            item = self.tree.item(idx)
-            hash= item['values'][8]
-            filename=item['text']
+        for hash in indexes:
             self.controller.db.backup_unset_delete(hash)
         
         self.populate_tree()
@@ -639,92 +837,335 @@ class StartPage(ttk.Frame):
         """sets the flag for the currently selected backups
         """
 
-        for idx in indexes:
-            item = self.tree.item(idx)
-            hash = item['values'][8]
-            filename=item['text']
+        for hash in indexes:
             self.controller.db.update_backup_flag(True, hash)
             
-        self.populate_tree()
+        self.patch_tree(indexes)
 
     def unset_backup_flag(self, indexes):
         """unsets the flag for the currently selected backups
         """
 
-        for idx in indexes:
-            item = self.tree.item(idx)
-            hash = item['values'][8]
-            filename=item['text']
+        for hash in indexes:
             self.controller.db.update_backup_flag(False, hash)
             
-        self.populate_tree()
+        self.patch_tree(indexes)
 
     def move_save(self, indexes, playthrough_id):
         """Moves the saves from one playthrough to another
         """
         entries = []
-        for idx in indexes:
-            item = self.tree.item(idx)
+        for hash in indexes:
             entries.append({
-                'hash': item['values'][8],
-                'filename': item['text']
+                'hash': hash,
+                'filename': self.controller.db.get_backup_by_hash(hash)['backup_filename']
             })
-        self.controller.playthrough_manager.move_backups_to_index(entries, playthrough_id)
-        self.populate_tree()
+        self.controller.playthrough_manager.move_backups_to_index(
+            entries,
+            playthrough_id,
+            on_done=lambda moved: self.populate_tree()
+        )
 
-    def populate_tree(self, sort_column=None, sort_direction=None):
-        """Populates the treeview with a list of backups for the currently
-        selected playthrough
+    def populate_tree(self, reset=False):
+        """Reads the backups of the currently selected playthrough
+
+        The backups are read on the DB worker thread into a BackupListing,
+        which the treeview pages and sorts in memory. Any earlier request
+        that is still outstanding is superseded. The scroll position and
+        selection are kept unless reset is set
+
+        Args:
+            reset (bool): default False. scrolls back to the top, for when
+                          another playthrough or branch is shown
         """
-        self.clear_heading_images()
+        kwargs = self.listing_filter()
+        if kwargs is None:
+            self.controller.db_worker.cancel('backup_tree')
+            self.listing_loaded([], reset)
+            return
 
-        if not sort_column and not sort_direction:
-            sort_column = self.tree_cursort['column']
-            sort_direction = self.tree_cursort['direction']
-        
+        self.controller.db_worker.submit(
+            'get_backup_listing',
+            sort_column=self.tree_cursort['column'],
+            sort_direction=self.tree_cursort['direction'],
+            key='backup_tree',
+            callback=lambda backups: self.listing_loaded(backups, reset),
+            **kwargs
+        )
+
+    def listing_loaded(self, backups, reset):
+        """Callback with the backups read by populate_tree
+
+        Args:
+            backups (list): the backup listing to display
+            reset (bool): scrolls back to the top when set
+        """
+        self.listing = BackupListing(
+            backups,
+            self.tree_cursort['column'],
+            self.tree_cursort['direction']
+        )
+        if self.backup_filters():
+            # the backups are shown once the filter is read again
+            self.listing.filter(self.filtered_hashes or [])
+            self.apply_filters(reset)
+        else:
+            self.backup_list.refresh(reset=reset, keep=self.listing.listed)
+            self.show_filter_count()
+        self.show_sort_heading()
+        self.update_playthrough_stats()
+        self.update_filter_values()
+
+    def patch_tree(self, hashes):
+        """Refreshes the rows of backups that were changed without leaving
+        the listing, such as a flag or branch change, without reading
+        the rest of the playthrough
+
+        Args:
+            hashes (list): the hashes of the changed backups
+        """
+        kwargs = self.listing_filter()
+        if kwargs is None:
+            return
+
+        self.controller.db_worker.submit(
+            'get_backup_listing',
+            hashes=list(hashes),
+            callback=self.backups_changed,
+            **kwargs
+        )
+        self.update_playthrough_stats()
+        # the changed backups may not match the filters anymore
+        if self.backup_filters():
+            self.apply_filters(reset=False)
+
+    def backups_changed(self, backups):
+        """Callback with the backups read by patch_tree
+
+        Args:
+            backups (list): the changed backups
+        """
+        self.listing.update(backups or [])
+        self.backup_list.patch_rows(
+            [self.backup_row(save) for save in backups or []]
+        )
+
+    def fetch_backups(self, offset, limit, callback):
+        """hands a page of the sorted backup listing to the backup treeview
+
+        Args:
+            offset (int): the index of the first backup of the page
+            limit (int): the number of backups in the page
+            callback (function): called with the number of backups and
+                                 the rows of the page
+        """
+        callback(
+            len(self.listing),
+            [self.backup_row(save) for save in self.listing.page(offset, limit)]
+        )
+
+    def listing_filter(self):
+        """returns the Model.get_backup_listing arguments selecting the
+        backups shown in the backup treeview, None when nothing is shown
+        """
         if self.controller.delete_selected:
-            backups = self.controller.db.get_backups_to_delete(
-                sort_column=sort_column,
-                sort_direction=sort_direction
-            )
+            return {'deleted_only': True}
+        if self.controller.selected_playthrough:
+            return {
+                'playthrough_id': self.controller.selected_playthrough['id'],
+                'branch': self.user_selected_branch
+            }
+        return None
 
-        if self.controller.selected_playthrough and not self.controller.delete_selected:
-            backups = self.controller.db.get_backups_by_id(
-                self.controller.selected_playthrough['id'],
-                sort_column=sort_column,
-                sort_direction=sort_direction,
-                branch=self.user_selected_branch
-            )
-        
-        # delete all previous items in the tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # populate the tree with saves that match the selected playthrough
-        for save in backups:
-            self.tree.insert('', 'end', text=save['backup_filename'], values=(
-                save['x4_save_time'],
-                save['branch'],
-                "{:0.2f}".format(save['playtime']/60/60),
-                save['character_name'],
-                "${:,.0f}".format(save['money']),
-                save['moded'],
-                save['flag'],
-                save['notes'].partition('\n')[0],
-                save['file_hash']
+    def backup_filters(self):
+        """returns the Model.filter_backups filters set in the filter bar,
+        None when no filter is set. Hours that aren't numbers are ignored
+        """
+        values = {
+            name: var.get().strip() for name, var in self.filter_vars.items()
+        }
+        filters = {}
+        if values['savetype'] != 'All':
+            filters['savetype'] = values['savetype']
+        if values['flag'] != 'All':
+            filters['flag'] = values['flag'] == 'Flagged'
+        for name in ('game_version', 'character'):
+            if values[name] and values[name] != 'All':
+                filters[name] = values[name]
+        for name, key in (('min_hours', 'min_playtime'), ('max_hours', 'max_playtime')):
+            try:
+                filters[key] = float(values[name]) * 60 * 60
+            except ValueError:
+                pass
+        if values['text']:
+            filters['text'] = values['text']
+
+        return filters or None
+
+    def filter_changed(self, *args):
+        """trace callback of the filter bar variables. The backups are
+        filtered once the user has stopped typing for filter_debounce_ms
+        """
+        if self.filter_timer:
+            self.after_cancel(self.filter_timer)
+        self.filter_timer = self.after(self.filter_debounce_ms, self.apply_filters)
+
+    def apply_filters(self, reset=True):
+        """reads the hashes of the backups matching the filter bar on
+        the DB worker thread. Any earlier filter that is still being
+        read is superseded
+
+        Args:
+            reset (bool): default True. scrolls back to the top
+        """
+        if self.filter_timer:
+            self.after_cancel(self.filter_timer)
+            self.filter_timer = None
+
+        kwargs = self.listing_filter()
+        filters = self.backup_filters()
+        if kwargs is None or filters is None:
+            self.controller.db_worker.cancel('backup_filter')
+            self.filters_loaded(None, reset)
+            return
+
+        self.controller.db_worker.submit(
+            'filter_backups',
+            filters,
+            key='backup_filter',
+            callback=lambda hashes: self.filters_loaded(hashes, reset),
+            **kwargs
+        )
+
+    def filters_loaded(self, hashes, reset):
+        """Callback with the hashes read by apply_filters
+
+        Args:
+            hashes (list): the hashes of the matching backups,
+                           None shows every backup
+            reset (bool): scrolls back to the top when set
+        """
+        self.filtered_hashes = hashes
+        self.listing.filter(hashes)
+        self.backup_list.refresh(reset=reset, keep=self.listing.listed)
+        self.show_filter_count()
+
+    def show_filter_count(self):
+        """shows how many backups match the filter bar
+        """
+        total = len(self.listing.positions)
+        if self.listing.shown is None:
+            self.filter_count_var.set("{:,} backups".format(total))
+        else:
+            self.filter_count_var.set("{:,} of {:,} backups".format(
+                len(self.listing),
+                total
             ))
-        
-        if self.tree_cursort['direction'] == 'ASC':
-            self.tree.heading(
-                self.tree_cursort['heading'],
-                image=self.up_arrow
+
+    def clear_filters(self):
+        """resets the filter bar without filtering the backups again
+        """
+        for name, var in self.filter_vars.items():
+            var.set('All' if name in self.filter_dropdowns else '')
+        if self.filter_timer:
+            self.after_cancel(self.filter_timer)
+            self.filter_timer = None
+        self.filtered_hashes = None
+
+    def clear_filters_clicked(self):
+        """Callback for the filter bar Clear button
+        """
+        self.clear_filters()
+        self.apply_filters()
+
+    def update_filter_values(self):
+        """reads the game versions and characters of the shown backups
+        for the filter bar dropdowns
+        """
+        kwargs = self.listing_filter()
+        if kwargs is None:
+            self.controller.db_worker.cancel('filter_values')
+            self.filter_values_loaded(None)
+            return
+
+        self.controller.db_worker.submit(
+            'get_backup_filter_values',
+            playthrough_id=kwargs.get('playthrough_id'),
+            deleted_only=kwargs.get('deleted_only', False),
+            key='filter_values',
+            callback=self.filter_values_loaded
+        )
+
+    def filter_values_loaded(self, values):
+        """Callback with the dropdown values read by update_filter_values
+
+        Args:
+            values (dict): game_versions and characters
+        """
+        values = values or {}
+        for name, key in (('game_version', 'game_versions'), ('character', 'characters')):
+            self.filter_dropdowns[name].configure(
+                values=['All'] + values.get(key, [])
             )
-        else:
-            self.tree.heading(
-                self.tree_cursort['heading'],
-                image=self.down_arrow
+
+    @staticmethod
+    def backup_row(save):
+        """formats a backup of the listing as a backup treeview row
+
+        Args:
+            save (dict): a backup returned by Model.get_backup_listing
+
+        Returns:
+            tuple: (iid, text, values)
+        """
+        # the listing holds raw values, so we format them for display
+        return (save['file_hash'], save['backup_filename'], (
+            ctime(save['x4_save_time']),
+            save['branch'],
+            "{:0.2f}".format(save['playtime']/60/60),
+            save['character_name'],
+            "${:,.0f}".format(save['money']),
+            save['moded'],
+            save['flag'],
+            save['notes_preview'],
+            save['file_hash']
+        ))
+
+    def update_playthrough_stats(self):
+        """shows the summary statistics for the selected playthrough
+        """
+        if self.controller.delete_selected or not self.controller.selected_playthrough:
+            self.controller.db_worker.cancel('playthrough_stats')
+            self.stats_var.set('')
+            return
+
+        self.controller.db_worker.submit(
+            'get_playthrough_stats',
+            self.controller.selected_playthrough['id'],
+            key='playthrough_stats',
+            callback=self.show_playthrough_stats
+        )
+
+    def show_playthrough_stats(self, stats):
+        """Callback which displays the statistics read by
+        update_playthrough_stats
+
+        Args:
+            stats (dict): the playthrough statistics
+        """
+        if not stats:
+            return
+
+        self.stats_var.set(
+            "Backups: {}    Branches: {}    Size: {}    Hours Played: {:0.2f}    Latest Save: {}".format(
+                stats['backup_count'],
+                stats['branch_count'],
+                Formatter.size(stats['total_size']),
+                stats['max_playtime']/60/60,
+                ctime(stats['latest_save_time']) if stats['latest_save_time'] else 'None'
             )
-    
+        )
+
     def sort_tree(self, heading, column):
         # check if we are changing columns
         # if so, set the initial sort direction to DESC
@@ -741,8 +1182,11 @@ class StartPage(ttk.Frame):
             self.tree_cursort['direction'] = 'DESC'
         else:
             self.tree_cursort['direction'] = 'ASC'
-                
-        self.populate_tree()
+
+        # the listing is sorted in memory, only the shown rows are reordered
+        self.listing.sort(column, self.tree_cursort['direction'])
+        self.backup_list.refresh()
+        self.show_sort_heading()
 
     def create_playthrough(self):
         """Opens the create playthrough window
@@ -755,15 +1199,18 @@ class StartPage(ttk.Frame):
     def refresh_playthroughs(self):
         """re-populates the list of playthroughs
         """
-        self.playthrousghs_var.set(
-            self.controller.db.get_playthrough_names()
+        self.controller.db_worker.submit(
+            'get_playthrough_names',
+            key='playthrough_names',
+            callback=self.playthrousghs_var.set
         )
     
     def select_playthrough(self, event):
         """Callback when the user selects a new playthrough
 
-        Responsible for calling other application methods to re-organize
-        the windows when the user selects a new playthrough
+        Reads the selected playthrough on the DB worker thread. If the user
+        selects another playthrough before it arrives, the earlier request
+        is superseded
 
         Args:
             event: the tk event to track the current index for the user
@@ -774,22 +1221,98 @@ class StartPage(ttk.Frame):
             if cur_selection:
                 index = cur_selection[0]
                 name = event.widget.get(index)
-                if name == "__RECYCLE BIN__":
-                    self.controller.delete_selected = True
-                    notes = self.controller.db.get_playthrough_by_name("__RECYCLE BIN__")['notes']
-                else:
-                    self.controller.delete_selected = False
-                    self.controller.selected_playthrough = self.controller.db.get_playthrough_by_name(name)
-                    if hasattr(self.controller, 'statusbar'):
-                        self.controller.statusbar.set_playthrough(name)
-                    notes = self.controller.selected_playthrough['notes']
-                    self.controller.top_menu.menu_backup.entryconfigure('Start Backup', state='normal')
-                
-                self.clear_heading_images()
-                self.set_notes(notes)
-                self.user_selected_branch=None
-                self.controller.statusbar.set_branch_filter('All')
-                self.populate_tree()
+                self.controller.db_worker.submit(
+                    'get_playthrough_by_name',
+                    name,
+                    key='select_playthrough',
+                    callback=self.playthrough_selected
+                )
+
+    def playthrough_selected(self, playthrough):
+        """Callback with the playthrough the user selected
+
+        Responsible for calling other application methods to re-organize
+        the windows when the user selects a new playthrough
+
+        Args:
+            playthrough (dict): the selected playthrough
+        """
+        if not playthrough:
+            return
+
+        name = playthrough['name']
+        if name == "__RECYCLE BIN__":
+            self.controller.delete_selected = True
+        else:
+            self.controller.delete_selected = False
+            self.controller.selected_playthrough = playthrough
+            if hasattr(self.controller, 'statusbar'):
+                self.controller.statusbar.set_playthrough(name)
+            self.controller.top_menu.menu_backup.entryconfigure('Start Backup', state='normal')
+        
+        self.clear_heading_images()
+        self.set_notes(playthrough['notes'])
+        self.user_selected_branch=None
+        self.controller.statusbar.set_branch_filter('All')
+        self.clear_filters()
+        self.populate_tree(reset=True)
+
+    def show_playthrough(self, name):
+        """selects the playthrough with the given name in the playthrough
+        listbox, as if the user had clicked on it
+
+        Args:
+            name (str): the name of the playthrough to select
+        """
+        names = self.playthroughs.get(0, tk.END)
+        if name not in names:
+            return
+
+        index = names.index(name)
+        self.playthroughs.selection_clear(0, tk.END)
+        self.playthroughs.selection_set(index)
+        self.playthroughs.see(index)
+        self.playthroughs.event_generate("<<ListboxSelect>>")
+
+    def open_search(self, *args):
+        """Opens the search results window for the text in the search box
+
+        Used to only open 1 search window at a time
+        """
+        text = Validate.text_input(self.search_var.get())
+        if not text:
+            return
+
+        if self.search_window == None:
+            self.search_window = Search(self, self.controller, text)
+            self.search_window.bind('<Destroy>', self.search_closed)
+        else:
+            self.search_window.search(text)
+            self.search_window.focus()
+
+    def search_closed(self, event):
+        """Callback when the search window is closed
+
+        the Destroy event is also sent for every child widget,
+        so we only reset when the window itself is destroyed
+        """
+        if event.widget == self.search_window:
+            self.search_window = None
+
+    def show_sort_heading(self):
+        """shows the sort direction arrow on the sorted column heading
+        """
+        self.clear_heading_images()
+        if self.tree_cursort['direction'] == 'ASC':
+            self.tree.heading(
+                self.tree_cursort['heading'],
+                image=self.up_arrow
+            )
+        else:
+            self.tree.heading(
+                self.tree_cursort['heading'],
+                image=self.down_arrow
+            )
 
     def clear_heading_images(self):
         self.tree.heading(
@@ -844,6 +1367,12 @@ class StartPage(ttk.Frame):
             row=0,
             sticky=(tk.N, tk.E, tk.S, tk.W)
         )
+        self.shown_processing = None
+        self.shown_warning = None
+        self.backup_status_var.set('')
+        self.clear_history()
+        if not self.progress_poller:
+            self.poll_backup_progress()
 
     def update_branches_dropdown(self):
         """Updates the branches dropdown in the backup page
@@ -873,88 +1402,195 @@ class StartPage(ttk.Frame):
             row=0,
             sticky=(tk.N, tk.E, tk.S, tk.W)
         )
-        self.backup_data.configure(state='normal')
-        self.backup_data.delete('1.0', tk.END)
-        self.backup_data.configure(state='disabled')
+        if self.progress_poller:
+            self.after_cancel(self.progress_poller)
+            self.progress_poller = None
+        self.clear_history()
 
-    def set_progress_count(self, count):
-        """sets the progress bar max value
+    def poll_backup_progress(self):
+        """shows the latest backup progress while the backup thread runs.
 
-        this is needed when the user changes the number of seconds between
-        backup loops.
+        The only poller of the backup channel, so the progress is shown at
+        a steady rate however often the backup thread publishes it. While
+        the window is minimized the channel is left to fill up, and is
+        drained in one go once the window is shown again
         """
-        self.progressbar_count = count
-        self.progress['value'] = self.progressbar_count
+        self.progress_poller = None
+        if not self.controller.save_manager.backup_in_progress:
+            return
 
-    def increment_progress(self):
-        """decrements the progress bar for a visual indicator of when
-        the next backup loop will happen
-        """
-        count = self.controller.app_settings.get_app_setting(
-            'BACKUPFREQUENCY_SECONDS',
-            category="BACKUP"
-        )
-        if self.progressbar_count > 0:
-            self.progressbar_count -= 1
-        else:
-            self.progressbar_count = count
+        if self.controller.state() == 'iconic':
+            self.progress_poller = self.after(
+                self.progress_poll_minimized_ms,
+                self.poll_backup_progress
+            )
+            return
 
-        self.progress['value'] = self.progressbar_count
+        progress, finished, dropped = self.controller.backup_channel.drain()
+        self.show_backup_progress(progress, finished, dropped)
+        self.progress_poller = self.after(
+            self.progress_poll_ms,
+            self.poll_backup_progress
+        )
 
-    def update_backup_data(self):
+    def show_backup_progress(self, progress, finished, dropped=0):
         """responsible for showing the user what is happening
         or what happened during the backup thread.
-        
-        controls what is shows in the data_box
+
+        New lines are appended to the data_box, which is never rebuilt
+        and only keeps the latest backups, see append_history
+
+        Args:
+            progress (BackupProgress): the latest backup thread snapshot
+            finished (list): the BackupEntry of the backups finished since
+                             the last call
+            dropped (int): the number of finished backups the channel
+                           couldn't keep, they are left in the session log
         """
-        update_data_box = False
-        message = ''
-        data = self.controller.message_queue.get()
-        self.countdown['text'] = data['countdown']
-        self.loop['text'] = data['loops']
-        
-        # if we just backed up a save, update the flag and notes DB columns
-        if self.last_backup_processed:
+        if dropped:
+            # the history would have a gap, so it restarts from the
+            # backups we have and the rest is read from the session log
+            self.clear_history()
+
+        self.countdown['text'] = progress.countdown
+        self.loop['text'] = progress.loops
+        self.progress['maximum'] = max(progress.seconds, 1)
+        self.progress['value'] = progress.countdown
+
+        if finished:
+            # the backup thread committed the finished backups
+            self.controller.db.expire_data_version()
+        lines = []
+        for entry in finished:
+            # the backup is in the database now, so save the flag, notes
+            # and branch the user entered while it was backed up
             self.controller.db.update_backup_options(
                 self.backup_flag_checkbox_var.get(),
                 self.backup_note_var.get(),
                 self.backup_branch_dropdown.get(),
-                self.last_backup_processed['hash']
+                entry.hash
             )
             self.selected_branch = self.backup_branch_dropdown.get()
-            self.update_branches_dropdown()
-            self.last_backup_processed = None
             self.backup_flag_checkbox_var.set(False)
             self.backup_note.delete(0,'end')
+            lines.append((entry.log_id, self.history_line(
+                entry.x4save,
+                entry.backup_filename,
+                entry.backup_timespan,
+                entry.evicted
+            )))
 
-            # if we are not processing a backup, display the history of backups
-            # for this session
-            if len(data['x4saves']) > 0 and data['processing'] == 0:
-                message += "\nx4saves backed up:\n"
-                for save in data['x4saves']:
-                    message += "    {}  ->   {} in  {:0.4f} seconds\n".format(
-                        save['x4save'],
-                        save['backup_filename'],
-                        save['backup_timespan']
-                    )
+        if finished:
+            self.update_branches_dropdown()
+            self.populate_tree()
+            self.append_history(lines)
 
-            update_data_box = True
+        if (
+            progress.processing != self.shown_processing or
+            progress.warning != self.shown_warning
+        ):
+            self.shown_processing = progress.processing
+            self.shown_warning = progress.warning
+            if progress.processing:
+                self.controller.statusbar.set_backup_status('backup running')
+                self.backup_status_var.set(
+                    "Now backing up file: {}   ->  {}, this may take a few minutes".format(
+                        progress.processing.x4save,
+                        progress.processing.backup_filename
+                    )
+                )
+            else:
+                self.controller.statusbar.set_backup_status('waiting for new save files')
+                self.backup_status_var.set(progress.warning or '')
 
-        # record the backup in progress details and display progress
-        if data['processing'] == 1:
-            message += "Backup now in progress\n\n"
-            self.last_backup_processed = data['x4saves'][-1]
-            message += "Now backing up file: {}   ->  {}\n".format(
-                data['x4saves'][-1]['x4save'],
-                data['x4saves'][-1]['backup_filename']
+    @staticmethod
+    def history_line(x4save, backup_filename, backup_timespan, evicted):
+        """formats a backup of the session history as a single line
+        """
+        line = "{}  ->   {} in  {:0.4f} seconds".format(
+            x4save,
+            backup_filename,
+            backup_timespan or 0
+        )
+        if evicted:
+            line += ", evicted {} backups to stay under the backup quota".format(
+                evicted
             )
-            message += "this may take a few minutes\n"
-            message += "    now backing up and extracting info from backup file\n\n"
-            
-            update_data_box = True
-            
-        if update_data_box:
-            self.backup_data.configure(state='normal')
-            self.backup_data.delete('1.0', tk.END)
-            self.backup_data.insert('1.0', message)
-            self.backup_data.configure(state='disabled')
\ No newline at end of file
+        return line + "\n"
+
+    def append_history(self, lines, earlier=False):
+        """adds backups to the session history in the data_box. The data_box
+        holds one line per backup, and the oldest ones are removed once it
+        holds more than session_history_lines, plus the lines the user
+        asked to see with show_earlier_history
+
+        Args:
+            lines (list): (log_id, line) tuples, oldest first
+            earlier (bool): default False. the lines are older than the
+                            ones shown, and are added at the top
+        """
+        self.backup_data.configure(state='normal')
+        if earlier:
+            self.backup_data.insert('1.0', ''.join(line for log_id, line in lines))
+            self.history_ids.extendleft(log_id for log_id, line in reversed(lines))
+            self.history_limit += len(lines)
+        else:
+            self.backup_data.insert(tk.END, ''.join(line for log_id, line in lines))
+            self.history_ids.extend(log_id for log_id, line in lines)
+
+        excess = len(self.history_ids) - self.history_limit
+        if excess > 0:
+            for _ in range(excess):
+                self.history_ids.popleft()
+            self.backup_data.delete('1.0', "{}.0".format(excess + 1))
+            self.earlier_button.state(['!disabled'])
+
+        if not earlier:
+            self.backup_data.see(tk.END)
+        self.backup_data.configure(state='disabled')
+
+    def clear_history(self):
+        """empties the session history in the data_box
+        """
+        self.history_ids.clear()
+        self.history_limit = self.session_history_lines
+        self.earlier_button.state(['!disabled'])
+        self.backup_data.configure(state='normal')
+        self.backup_data.delete('1.0', tk.END)
+        self.backup_data.configure(state='disabled')
+
+    def show_earlier_history(self):
+        """reads the backups of the session that are older than the ones
+        in the data_box from the session log, on the DB worker thread
+        """
+        before_id = next(
+            (log_id for log_id in self.history_ids if log_id is not None),
+            None
+        )
+        self.controller.db_worker.submit(
+            'get_session_log',
+            self.controller.backup_channel.session_start,
+            before_id=before_id,
+            limit=self.session_history_page,
+            key='session_log',
+            callback=self.earlier_history_loaded
+        )
+
+    def earlier_history_loaded(self, entries):
+        """Callback with the backups read by show_earlier_history
+
+        Args:
+            entries (list): the session log entries, newest first
+        """
+        if len(entries) < self.session_history_page:
+            self.earlier_button.state(['disabled'])
+        if entries:
+            self.append_history([
+                (entry['id'], self.history_line(
+                    entry['x4save'],
+                    entry['backup_filename'],
+                    entry['backup_timespan'],
+                    entry['evicted']
+                ))
+                for entry in reversed(entries)
+            ], earlier=True)
@@ -11,7 +11,10 @@ if TYPE_CHECKING:
 
 class StatusBar(ttk.Frame):
     """Provides a statusbar with a left, center, and right area
-    and provides methods to write status messages into each
+    and provides methods to write status messages into each.
+
+    The jobs panel at the far right lists the running jobs, see JobRunner,
+    and cancels them from its menu
 
     Args:
         tk (Frame): inherits from tk.Frame
@@ -36,12 +39,14 @@ class StatusBar(ttk.Frame):
         self.messages = {
             "left" : tk.StringVar(),
             "center": tk.StringVar(),
-            "right": tk.StringVar()
+            "right": tk.StringVar(),
+            "jobs": tk.StringVar()
         }
         self.set_playthrough("None")
         self.set_backup_status("idle")
         
         self.build_statusbar()
+        self.controller.jobs.add_listener(self.show_jobs)
 
     def build_statusbar(self):
         """Builds the status bar
@@ -92,6 +97,21 @@ class StatusBar(ttk.Frame):
             width=30
         )
         status_right.grid(column=4, row=0, sticky=(tk.W, tk.E))
+        jseperator = ttk.Separator(
+            self,
+            orient='vertical'
+        )
+        jseperator.grid(column=5, row=0, sticky=(tk.N, tk.S))
+
+        # jobs panel
+        self.jobs_menu = tk.Menu(self, postcommand=self.build_jobs_menu)
+        self.jobs_button = ttk.Menubutton(
+            self,
+            textvariable=self.messages['jobs'],
+            menu=self.jobs_menu,
+            width=25
+        )
+        self.jobs_button.grid(column=6, row=0, sticky=(tk.W, tk.E))
 
     def set_playthrough(self, message):
         """updates the left status area with 'message'
@@ -117,3 +137,29 @@ class StatusBar(ttk.Frame):
         """updates the right status area with 'message'
         """
         self.messages['right'].set(f"{self._right_message} {message}")
+
+    def show_jobs(self, jobs):
+        """JobRunner listener, updates the jobs panel with the active jobs
+        """
+        if not jobs:
+            message = "Jobs: none"
+        elif len(jobs) == 1:
+            message = f"Jobs: {jobs[0].title} {jobs[0].describe()}"
+        else:
+            message = f"Jobs: {len(jobs)} running"
+
+        if self.messages['jobs'].get() != message:
+            self.messages['jobs'].set(message)
+        self.jobs_button.state(['!disabled'] if jobs else ['disabled'])
+
+    def build_jobs_menu(self):
+        """lists the active jobs in the jobs panel menu when it is opened,
+        selecting a job cancels it
+        """
+        self.jobs_menu.delete(0, 'end')
+        for job in self.controller.jobs.active():
+            self.jobs_menu.add_command(
+                label=f"Cancel #{job.id} {job.title}: {job.describe()}",
+                command=lambda job_id=job.id: self.controller.jobs.cancel(job_id),
+                state='disabled' if job.cancel.is_set() else 'normal'
+            )
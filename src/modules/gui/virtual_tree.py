@@ -0,0 +1,362 @@
+"""VirtualTree Class
+
+Responsible for showing very long lists in a ttk.Treeview by only
+creating the rows that are visible
+"""
+import tkinter as tk
+from tkinter import ttk
+
+class VirtualTree(ttk.Frame):
+    """a ttk.Treeview with its own scrollbar, which only holds the rows
+    that are visible. The rows are fetched a page at a time as the list
+    is scrolled, and only the pages around the visible rows are kept.
+
+    Rows are (iid, text, values) tuples, and are selected by their iid,
+    so the selection survives scrolling and refreshes. The treeview is
+    reconciled with the visible rows by iid, so only the rows that were
+    added, changed, moved or removed are touched.
+
+    Usage:
+        backup_list = VirtualTree(parent, fetch, columns=('SaveTime', ...))
+        backup_list.tree.heading('SaveTime', text='Save Time')
+
+    fetch is called as fetch(offset, limit, callback), and must call
+    callback(total, rows) once the page has been read
+    """
+    # the number of rows fetched at a time
+    page_size = 200
+    # the number of pages kept on either side of the visible rows
+    margin_pages = 1
+
+    def __init__(self, parent, fetch, columns, displaycolumns=None, **kwargs):
+        """Constructor
+
+        Args:
+            parent (tk.Frame): the parent tk container object
+            fetch (function): reads a page of rows, see the class docstring
+            columns (tuple): the treeview columns
+            displaycolumns (tuple): default all columns. the columns shown
+        """
+        super().__init__(parent, **kwargs)
+        self.fetch = fetch
+        self.total = 0
+        self.first = 0
+        self.visible = 20
+        self.pages = {}
+        self.stale_pages = {}
+        self.requested = set()
+        self.generation = 0
+        # the selected iids, in the order they were selected
+        self.selected = {}
+        # the (text, values, tags) of the rows in the treeview, by iid
+        self.rendered = {}
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        self.tree = ttk.Treeview(
+            self,
+            columns=columns,
+            displaycolumns=displaycolumns or columns
+        )
+        self.tree.grid(
+            column=0,
+            row=0,
+            sticky=(tk.N, tk.E, tk.S, tk.W)
+        )
+        self.scrollbar = ttk.Scrollbar(
+            self,
+            orient='vertical',
+            command=self.yview
+        )
+        self.scrollbar.grid(
+            column=1,
+            row=0,
+            sticky=(tk.N, tk.S)
+        )
+        self.tree.tag_configure('loading', foreground='grey')
+
+        self.tree.bind('<Configure>', self.resized)
+        self.tree.bind('<<TreeviewSelect>>', self.selection_changed)
+        self.tree.bind('<ButtonPress-1>', self.clicked)
+        self.tree.bind('<MouseWheel>', self.wheel)
+        self.tree.bind('<Button-4>', lambda e: self.yview('scroll', -3, 'units') or 'break')
+        self.tree.bind('<Button-5>', lambda e: self.yview('scroll', 3, 'units') or 'break')
+        self.tree.bind('<Up>', lambda e: self.move_focus(e, -1))
+        self.tree.bind('<Down>', lambda e: self.move_focus(e, 1))
+        self.tree.bind('<Prior>', lambda e: self.move_focus(e, -self.visible))
+        self.tree.bind('<Next>', lambda e: self.move_focus(e, self.visible))
+        self.tree.bind('<Home>', lambda e: self.move_focus(e, -self.total))
+        self.tree.bind('<End>', lambda e: self.move_focus(e, self.total))
+
+    def refresh(self, reset=False, keep=None):
+        """reads the rows again, keeping the scroll position and the
+        selection. The rows already shown stay until their page is read
+
+        Args:
+            reset (bool): default False. scrolls back to the top and clears
+                          the selection, for when a different list is shown
+            keep (function): default None. called with every selected iid,
+                             the iids it returns False for are deselected,
+                             for the rows that have left the list
+        """
+        self.generation += 1
+        self.requested = set()
+        if reset:
+            self.first = 0
+            self.selected = {}
+            self.stale_pages = {}
+        else:
+            if keep:
+                self.selected = {
+                    iid: None for iid in self.selected if keep(iid)
+                }
+            self.stale_pages.update(self.pages)
+        self.pages = {}
+        self.render()
+
+    def selection(self):
+        """returns the iids of the selected rows, including the rows
+        that are scrolled out of view
+
+        Returns:
+            list: the selected iids, in the order they were selected
+        """
+        return list(self.selected)
+
+    def row(self, index):
+        """returns the row at index, or None when its page isn't read yet
+        """
+        page, position = divmod(index, self.page_size)
+        rows = self.pages.get(page)
+        if rows is None:
+            rows = self.stale_pages.get(page)
+        if rows is None or position >= len(rows):
+            return None
+
+        return rows[position]
+
+    def yview(self, *args):
+        """scrollbar callback, scrolls the visible rows
+        """
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * self.total))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= max(self.visible - 1, 1)
+            self.scroll_to(self.first + step)
+
+    def scroll_to(self, first):
+        """shows the rows starting at index first
+
+        Args:
+            first (int): the index of the first visible row
+        """
+        first = min(max(first, 0), max(self.total - self.visible, 0))
+        if first != self.first:
+            self.first = first
+            self.render()
+
+    def wheel(self, event):
+        """scrolls the rows with the mouse wheel on Windows and macOS
+        """
+        self.yview('scroll', -3 if event.delta > 0 else 3, 'units')
+        return 'break'
+
+    def resized(self, event):
+        """works out how many rows fit in the treeview
+        """
+        top, rowheight = 25, 20
+        children = self.tree.get_children()
+        bbox = self.tree.bbox(children[0]) if children else None
+        if bbox:
+            top, rowheight = bbox[1], bbox[3]
+        visible = max((event.height - top) // max(rowheight, 1), 1)
+        if visible != self.visible:
+            self.visible = visible
+            self.first = min(self.first, max(self.total - self.visible, 0))
+            self.render()
+
+    def render(self):
+        """shows the visible rows, and reads the pages around them
+        """
+        # pages can be handed over straight away, which can change total
+        self.load_pages()
+        last = min(self.first + self.visible, self.total)
+
+        rows = []
+        shown = set()
+        for index in range(self.first, last):
+            row = self.row(index)
+            # a stale page can repeat a row that moved into a fresh page
+            if row is None or row[0] in shown:
+                rows.append(("loading {}".format(index), 'loading...', (), ('loading', )))
+            else:
+                rows.append((row[0], row[1], tuple(row[2]), ()))
+                shown.add(row[0])
+        self.reconcile(rows)
+        self.show_selection()
+
+        if self.total:
+            self.scrollbar.set(self.first / self.total, last / self.total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def reconcile(self, rows):
+        """applies the differences between the treeview and rows to the
+        treeview, instead of deleting and inserting every row
+
+        Args:
+            rows (list): the (iid, text, values, tags) of the visible rows
+        """
+        wanted = {row[0] for row in rows}
+        removed = [iid for iid in self.tree.get_children() if iid not in wanted]
+        if removed:
+            self.tree.delete(*removed)
+            for iid in removed:
+                del self.rendered[iid]
+
+        current = list(self.tree.get_children())
+        for index, (iid, text, values, tags) in enumerate(rows):
+            shown = self.rendered.get(iid)
+            if shown is None:
+                self.tree.insert('', index, iid=iid, text=text, values=values, tags=tags)
+                current.insert(index, iid)
+            else:
+                if shown != (text, values, tags):
+                    self.tree.item(iid, text=text, values=values, tags=tags)
+                if current[index] != iid:
+                    self.tree.move(iid, '', index)
+                    current.remove(iid)
+                    current.insert(index, iid)
+            self.rendered[iid] = (text, values, tags)
+
+    def patch_rows(self, rows):
+        """replaces rows that have changed without reading their pages
+        again. Rows that aren't in the read pages are ignored
+
+        Args:
+            rows (list): the changed (iid, text, values) rows
+        """
+        rows = {row[0]: row for row in rows}
+        for pages in (self.pages, self.stale_pages):
+            for page in pages.values():
+                for position, row in enumerate(page):
+                    if row[0] in rows:
+                        page[position] = rows[row[0]]
+        self.render()
+
+    def load_pages(self):
+        """requests the pages around the visible rows that aren't read yet,
+        and drops the pages that are further away
+        """
+        low = max(self.first // self.page_size - self.margin_pages, 0)
+        high = (self.first + self.visible) // self.page_size + self.margin_pages
+        if self.total:
+            high = min(high, (self.total - 1) // self.page_size)
+
+        for pages in (self.pages, self.stale_pages):
+            for page in [page for page in pages if not low <= page <= high]:
+                del pages[page]
+
+        for page in range(low, high + 1):
+            if page in self.pages or page in self.requested:
+                continue
+
+            self.requested.add(page)
+            self.fetch(
+                page * self.page_size,
+                self.page_size,
+                lambda total, rows, page=page, generation=self.generation:
+                    self.page_loaded(generation, page, total, rows)
+            )
+
+    def page_loaded(self, generation, page, total, rows):
+        """callback with a page of rows
+
+        Args:
+            generation (int): the refresh the page was requested for
+            page (int): the page number
+            total (int): the number of rows in the whole list
+            rows (list): the rows of the page
+        """
+        if generation != self.generation:
+            return
+
+        self.requested.discard(page)
+        self.pages[page] = rows
+        self.stale_pages.pop(page, None)
+        if total != self.total:
+            # the list changed size, so the pages read before are stale
+            self.total = total
+            self.first = min(self.first, max(self.total - self.visible, 0))
+            for number in [number for number in self.pages if number != page]:
+                self.stale_pages[number] = self.pages.pop(number)
+            self.render()
+            return
+
+        start = page * self.page_size
+        if start < self.first + self.visible and start + len(rows) > self.first:
+            self.render()
+        elif not self.tree.get_children():
+            self.render()
+
+    def show_selection(self):
+        """selects the visible rows that are in the selection
+        """
+        self.tree.selection_set(
+            [iid for iid in self.tree.get_children() if iid in self.selected]
+        )
+
+    def selection_changed(self, event):
+        """keeps the selection of the rows that are scrolled out of view
+        when the user changes the selection of the visible rows
+        """
+        children = [
+            iid for iid in self.tree.get_children()
+            if not self.tree.tag_has('loading', iid)
+        ]
+        current = set(self.tree.selection())
+        for iid in children:
+            if iid in current:
+                self.selected.setdefault(iid)
+            else:
+                self.selected.pop(iid, None)
+
+    def clicked(self, event):
+        """a click without ctrl or shift only selects the clicked row,
+        so the rows selected out of view are dropped
+        """
+        if (
+            not event.state & 0x0005 and
+            self.tree.identify_region(event.x, event.y) in ('tree', 'cell')
+        ):
+            self.selected = {}
+
+    def move_focus(self, event, step):
+        """moves the focus and selection with the keyboard, scrolling the
+        rows when the focus moves past the visible rows
+
+        Args:
+            step (int): the number of rows to move by
+        """
+        if not self.total:
+            return 'break'
+
+        children = self.tree.get_children()
+        focus = self.tree.focus()
+        index = self.first + (children.index(focus) if focus in children else 0)
+        index = min(max(index + step, 0), self.total - 1)
+        if index < self.first:
+            self.scroll_to(index)
+        elif index >= self.first + self.visible:
+            self.scroll_to(index - self.visible + 1)
+
+        row = self.row(index)
+        if row is not None:
+            if not event.state & 0x0001:
+                self.selected = {}
+            self.selected.setdefault(row[0])
+            self.tree.focus(row[0])
+            self.show_selection()
+        return 'break'
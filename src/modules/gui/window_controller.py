@@ -21,7 +21,6 @@ import modules.gui as guimod
 import json
 import webbrowser
 from os import path as ospath
-from queue import Queue
 from urllib.request import urlopen
 
 class WindowController(tk.Tk):
@@ -31,6 +30,10 @@ class WindowController(tk.Tk):
     Args:
         tk (tk.Tk): inherits from tk.Tk
     """
+    # how often (ms) a database maintenance step runs while idle
+    maintenance_interval_ms = 60000
+    # how long (seconds) the main thread Model trusts the data_version
+    db_data_version_interval = 1
 
     def __init__(self, approot, moduleroot):
         """Initializes a new instance of WindowController
@@ -40,12 +43,17 @@ class WindowController(tk.Tk):
             moduleroot (str): filesystem path to the modules folder
         """
         super().__init__()
-        self.message_queue = Queue()
+        self.backup_channel = appmod.BackupChannel()
         self.approot = approot
         self.moduleroot = moduleroot
         self.modalresult = 0
         self.app_settings = appmod.AppSettings(self)
         self.db = appmod.Model(self, self.app_settings.get_app_setting("DBPATH"))
+        # cache hits on the Tk main thread don't touch SQLite, the jobs and
+        # the backup thread expire the data_version when they commit
+        self.db.data_version_interval = self.db_data_version_interval
+        self.db_worker = appmod.DBWorker(self, self.app_settings.get_app_setting("DBPATH"))
+        self.jobs = appmod.JobRunner(self)
         self.selected_playthrough = None
         self.delete_selected = False
         self.save_manager = appmod.SaveManager(self)
@@ -94,10 +102,16 @@ class WindowController(tk.Tk):
             self.show_error(msg)
         self.bind_events()
         self.check_update()
+        self.save_manager.recover_deletions()
         if self.app_settings.get_app_setting('PRUNE_MARK_DELETION', category='BACKUP'):
-            self.save_manager.mark_old_backups(silent=True)
-        if self.app_settings.get_app_setting('PRUNE_DELETE', category='BACKUP'):
-            self.save_manager.delete_backups(silent=True)
+            self.save_manager.mark_old_backups(
+                silent=True,
+                on_done=self.prune_backups
+            )
+        else:
+            self.prune_backups()
+        self.save_manager.start_storage_backfill()
+        self.after(self.maintenance_interval_ms, self.idle_maintenance)
         self.startup()
 
     def set_window_title(self, text=""):
@@ -114,11 +128,26 @@ class WindowController(tk.Tk):
         self.config(cursor=type)
         self.update()
 
+    def prune_backups(self):
+        """deletes the backups marked for deletion at startup,
+        when the settings allow it
+        """
+        if self.app_settings.get_app_setting('PRUNE_DELETE', category='BACKUP'):
+            self.save_manager.delete_backups(silent=True)
+
     def startup(self):
         """starts the main window TK event loop
         """
         self.mainloop()
 
+    def idle_maintenance(self):
+        """runs a bounded database maintenance step on the DB worker
+        when no backup is running, and schedules the next one
+        """
+        if not self.save_manager.backup_in_progress:
+            self.db_worker.submit('idle_maintenance', key='maintenance')
+        self.after(self.maintenance_interval_ms, self.idle_maintenance)
+
     def show_error(self, message):
         """wrapper for MessageWindow to display application level error windows
         """
@@ -136,6 +165,19 @@ class WindowController(tk.Tk):
             message
         )
 
+    def show_progress(self, title, on_cancel=None):
+        """wrapper for Progress to display application level progress windows
+
+        Returns:
+            Progress: the progress window
+        """
+        return guimod.Progress(
+            self,
+            self,
+            title,
+            on_cancel=on_cancel
+        )
+
     def check_modal(self):
         """used to detect the answers to questions from show_question()
         """
@@ -164,18 +206,10 @@ class WindowController(tk.Tk):
     def bind_events(self):
         """main application level event bindings
         """
-        self.bind(
-            "<<UpdateBackupProgress>>",
-            lambda e: self.startpage.increment_progress()
-        )
         self.bind(
             "<<BackupIdle>>",
             lambda e: self.statusbar.set_backup_status('idle')
         )
-        self.bind(
-            "<<BackupRunning>>",
-            lambda e: self.statusbar.set_backup_status('backup running')
-        )
         self.bind(
             "<<ImportingBackups>>",
             lambda e: self.statusbar.set_backup_status('Importing and Re-indexing Previous Backups')
@@ -184,14 +218,6 @@ class WindowController(tk.Tk):
             "<<BackupThreadStarted>>",
             lambda e: self.statusbar.set_backup_status('waiting for new save files')
         )
-        self.bind(
-            "<<NewQueueData>>",
-            lambda e: self.startpage.update_backup_data()
-        )
-        self.bind(
-            "<<RefreshBackupTreeview>>",
-            lambda e: self.startpage.populate_tree()
-        )
         self.protocol("WM_DELETE_WINDOW", self.close)
 
     def close(self):
@@ -200,6 +226,9 @@ class WindowController(tk.Tk):
         # and cancel it
         if self.save_manager.backup_in_progress:
             self.save_manager.cancel_backup.set()
+        self.jobs.cancel_all()
+        self.db_worker.stop()
+        self.db.optimize()
         self.destroy()
 
     def check_update(self, feedback=False):
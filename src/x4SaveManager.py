@@ -5,6 +5,7 @@ of modules.gui.WindowController, which creates the initial GUI and calls the
 Tk mainloop() method which then waits for the events from the displayed GUI.
 """
 import sys
+import multiprocessing
 from os import path as ospath
 from modules.gui import WindowController
 
@@ -16,4 +17,8 @@ approot = ospath.realpath(ospath.dirname(__file__))
 moduleroot = ospath.join(approot, "modules")
 sys.path.append(moduleroot)
 
-WindowController(approot, moduleroot)
+# the import runs worker processes, which import this module again
+# so the application must only start in the main process
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    WindowController(approot, moduleroot)